@@ -0,0 +1,75 @@
+"""
+Benchmark: latest-version lookups in a VersionCatalog
+
+    python benchmarks/bench_catalog.py [count]
+
+Compares finding the latest (stable) version of a package by sorting its \
+versions on each lookup with VersionCatalog lookups, and times adding \
+versions one at a time.
+"""
+
+import random
+import sys
+import time
+
+from semver import VersionCatalog, parse_version
+
+
+def make_entries(count: int) -> list:
+    rng = random.Random(0)
+    ret = []
+    for _ in range(count):
+        version = "{}.{}.{}".format(
+            rng.randrange(20), rng.randrange(50), rng.randrange(200)
+        )
+        if rng.random() < 0.3:
+            version += "-rc.{}".format(rng.randrange(10))
+        ret.append(("pkg-{}".format(rng.randrange(100)), version))
+    return ret
+
+
+def timed(name: str, func, repeat: int = 1) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    seconds = (time.perf_counter() - start) / repeat
+    print("{:<34} {:>12.6f} s".format(name, seconds))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    entries = make_entries(count)
+
+    lists: dict = {}
+    for package, version in entries:
+        lists.setdefault(package, []).append(parse_version(version))
+
+    probes = [package for package, _ in random.Random(1).sample(entries, 1000)]
+    timed(
+        "max of stable versions x1000",
+        lambda: [max(v for v in lists[p] if v.is_stable) for p in probes],
+    )
+
+    start = time.perf_counter()
+    catalog = VersionCatalog(entries)
+    print(
+        "{:<34} {:>12.6f} s".format(
+            "VersionCatalog(entries)", time.perf_counter() - start
+        )
+    )
+
+    timed("latest(stable) x1000", lambda: [catalog.latest(p, "stable") for p in probes])
+    timed("latest(major=3) x1000", lambda: [catalog.latest(p, major=3) for p in probes])
+    timed(
+        "select('^3.1.0') x1000", lambda: [catalog.select(p, "^3.1.0") for p in probes]
+    )
+
+    added = make_entries(1000)
+    timed(
+        "add() x1000",
+        lambda: [catalog.add(p, "1{}".format(v)) for p, v in added],
+    )
+
+
+if __name__ == "__main__":
+    main()
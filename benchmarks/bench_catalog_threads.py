@@ -0,0 +1,103 @@
+"""
+Benchmark: catalog reads while another thread adds versions
+
+    python benchmarks/bench_catalog_threads.py [seconds]
+
+Reader threads look up the latest stable version of random packages while \
+a writer thread adds versions. Compares a VersionCatalog guarded by a lock \
+(for reads and writes) with a ConcurrentCatalog, whose readers take no lock.
+"""
+
+import random
+import sys
+import threading
+import time
+
+from semver import ConcurrentCatalog, VersionCatalog
+
+READERS = 4
+PACKAGES = 1000
+
+
+def make_entries(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    ret = []
+    for _ in range(count):
+        version = "{}.{}.{}".format(
+            rng.randrange(20), rng.randrange(50), rng.randrange(200)
+        )
+        if rng.random() < 0.3:
+            version += "-rc.{}".format(rng.randrange(10))
+        ret.append(("pkg-{}".format(rng.randrange(PACKAGES)), version))
+    return ret
+
+
+def run(name: str, read, write, added: list, seconds: float) -> None:
+    stop = threading.Event()
+    reads = [0] * READERS
+    writes = [0]
+
+    def reader(slot: int) -> None:
+        rng = random.Random(slot)
+        count = 0
+        while not stop.is_set():
+            for _ in range(100):
+                read("pkg-{}".format(rng.randrange(PACKAGES)))
+            count += 100
+        reads[slot] = count
+
+    def writer() -> None:
+        for package, version in added:
+            if stop.is_set():
+                break
+            write(package, version)
+            writes[0] += 1
+            # a steady stream of releases, not a bulk load
+            time.sleep(0.0001)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(READERS)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    print(
+        "{:<24} {:>12,.0f} reads/s {:>10,.0f} writes/s".format(
+            name, sum(reads) / seconds, writes[0] / seconds
+        )
+    )
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    entries = make_entries(100000, 0)
+    added = make_entries(100000, 1)
+
+    locked = VersionCatalog(entries)
+    lock = threading.Lock()
+
+    def locked_read(package: str) -> None:
+        with lock:
+            locked.latest(package, "stable")
+
+    def locked_write(package: str, version: str) -> None:
+        with lock:
+            locked.add(package, version)
+
+    run("VersionCatalog + Lock", locked_read, locked_write, added, seconds)
+
+    concurrent = ConcurrentCatalog(entries)
+    run(
+        "ConcurrentCatalog",
+        lambda package: concurrent.snapshot().latest(package, "stable"),
+        concurrent.add,
+        added,
+        seconds,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: encoding versions with semver.codec and pickle
+
+    python benchmarks/bench_codec.py [count]
+
+Compares the size and speed of pickling a list of versions with \
+encode_many() and decode_many() (or decode_array()).
+"""
+
+import pickle
+import random
+import sys
+import time
+
+from semver import codec
+from semver.version import Version
+
+
+def make_versions(count: int) -> list:
+    rng = random.Random(0)
+    ret = []
+    for _ in range(count):
+        pre = "rc.{}".format(rng.randrange(10)) if rng.random() < 0.3 else None
+        build = "b{}".format(rng.randrange(1000)) if rng.random() < 0.1 else None
+        ret.append(
+            Version(
+                rng.randrange(20), rng.randrange(50), rng.randrange(200), pre, build
+            )
+        )
+    return ret
+
+
+def timed(func):
+    start = time.perf_counter()
+    ret = func()
+    return ret, time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    versions = make_versions(count)
+    print("{} versions".format(count))
+
+    for name, dumps, loads in [
+        ("pickle", pickle.dumps, pickle.loads),
+        ("codec", codec.encode_many, codec.decode_many),
+        ("codec (decode_array)", codec.encode_many, codec.decode_array),
+    ]:
+        data, encode_time = timed(lambda: dumps(versions))
+        loaded, decode_time = timed(lambda: loads(data))
+        assert len(loaded) == count
+        print(
+            "{:<22} {:>9} bytes  encode {:>6.3f} s  decode {:>6.3f} s".format(
+                name, len(data), encode_time, decode_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: finding the ranges that a new version satisfies
+
+    python benchmarks/bench_constraints.py [count]
+
+Compares testing each of count ranges with Range.test() with a RangeIndex \
+lookup, for a few published versions.
+"""
+
+import random
+import sys
+import time
+
+from semver import Range, RangeIndex
+
+
+def make_expressions(count: int) -> list:
+    rng = random.Random(0)
+    ret = []
+    for _ in range(count):
+        version = "{}.{}.{}".format(
+            rng.randrange(20), rng.randrange(50), rng.randrange(200)
+        )
+        ret.append(rng.choice(["^", "~", ">=", "<", ""]) + version)
+    return ret
+
+
+def timed(name: str, func, repeat: int = 1) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    seconds = (time.perf_counter() - start) / repeat
+    print("{:<34} {:>12.6f} s".format(name, seconds))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    ranges = [Range(e) for e in make_expressions(count)]
+    versions = ["5.10.3", "19.49.199", "0.0.1", "7.0.0-rc.1"]
+
+    timed(
+        "Range.test() x{}, 4 versions".format(count),
+        lambda: [[i for i, r in enumerate(ranges) if r.test(v)] for v in versions],
+        1,
+    )
+
+    start = time.perf_counter()
+    index = RangeIndex(ranges)
+    print("{:<34} {:>12.6f} s".format("RangeIndex()", time.perf_counter() - start))
+
+    timed("match(), 4 versions", lambda: [index.match(v) for v in versions], 10)
+    for version in versions:
+        print(
+            "{:<34} {:>12,}".format("matches for " + version, len(index.match(version)))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: building and opening an index file
+
+    python benchmarks/bench_index.py [count]
+
+Builds indexes of count versions (spread over 1000 packages) and of \
+count // 10 versions, and shows that opening one takes the same time \
+whatever its size, unlike parsing and sorting the versions again.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from semver import index
+from semver.bulk import parse_many
+
+
+def make_entries(count: int) -> list:
+    rng = random.Random(0)
+    ret = []
+    for _ in range(count):
+        version = "{}.{}.{}".format(
+            rng.randrange(20), rng.randrange(50), rng.randrange(200)
+        )
+        if rng.random() < 0.3:
+            version += "-rc.{}".format(rng.randrange(10))
+        ret.append(("pkg-{}".format(rng.randrange(1000)), version))
+    return ret
+
+
+def timed(name: str, func, repeat: int = 1) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    seconds = (time.perf_counter() - start) / repeat
+    print("{:<34} {:>12.6f} s".format(name, seconds))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    entries = make_entries(count)
+
+    timed("parse_many + sort", lambda: sorted(parse_many(v for _, v in entries)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (count // 10, count):
+            path = os.path.join(directory, "{}.idx".format(size))
+            timed(
+                "build({}, chunk 50000)".format(size),
+                lambda: index.build(entries[:size], path, chunk_size=50000),
+            )
+            print("{:<34} {:>12.1f} MB".format("file", os.path.getsize(path) / 1e6))
+            timed(
+                "open + close ({})".format(size), lambda: index.open(path).close(), 100
+            )
+
+            with index.open(path) as idx:
+                probes = random.Random(1).sample(entries, 1000)
+                timed(
+                    "floor() x1000 ({})".format(size),
+                    lambda: [idx.floor(v, p) for p, v in probes],
+                )
+                timed(
+                    "latest_stable() x1000 ({})".format(size),
+                    lambda: [idx.latest_stable(p) for p, _ in probes],
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: parsing and sorting in worker processes
+
+    python benchmarks/bench_parallel.py [count]
+
+Compares bulk.parse_many() and sorted(key=sort_key) with semver.parallel \
+for 1, 2, 4, ... workers (up to the number of CPUs).
+"""
+
+import os
+import random
+import sys
+import time
+
+from semver import parallel
+from semver.bulk import parse_many
+from semver.keys import sort_key
+
+
+def make_versions(count: int) -> list:
+    rng = random.Random(0)
+    ret = []
+    for _ in range(count):
+        version = "{}.{}.{}".format(
+            rng.randrange(20), rng.randrange(50), rng.randrange(200)
+        )
+        if rng.random() < 0.3:
+            version += "-rc.{}".format(rng.randrange(10))
+        ret.append(version)
+    return ret
+
+
+def timed(name: str, func, count: int) -> None:
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(
+        "{:<28} {:>6.2f} s {:>10.0f} versions/s".format(name, seconds, count / seconds)
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    versions = make_versions(count)
+
+    cpus = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cpus:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cpus:
+        workers.append(cpus)
+
+    print("{} versions, {} CPUs".format(count, cpus))
+
+    timed("bulk.parse_many", lambda: parse_many(versions), count)
+    for n in workers:
+        timed(
+            "parallel.parse_many x{}".format(n),
+            lambda: parallel.parse_many(versions, workers=n),
+            count,
+        )
+        timed(
+            "parallel.parse_array x{}".format(n),
+            lambda: parallel.parse_array(versions, workers=n),
+            count,
+        )
+
+    timed("sorted(key=sort_key)", lambda: sorted(versions, key=sort_key), count)
+    for n in workers:
+        timed(
+            "parallel.sort_versions x{}".format(n),
+            lambda: parallel.sort_versions(versions, workers=n),
+            count,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark: memory blocks allocated (and kept) per parse_version() call
+
+    python benchmarks/bench_parse_alloc.py [count]
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from semver.version import parse_version
+
+SAMPLES = ["1.2.3", "10.20.30-rc.1", "2.0.0-alpha.1+build.5"]
+
+
+def measure(version: str, count: int) -> None:
+    strings = [version] * count
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    parsed = [parse_version(s) for s in strings]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+
+    seconds = timeit.timeit(lambda: parse_version(version), number=count)
+    print(
+        "{:<24} {:>6.2f} blocks {:>8.1f} bytes {:>8.2f} us".format(
+            version, blocks / count, size / count, seconds / count * 1e6
+        )
+    )
+    del parsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print("per parsed Version (kept alive), {} parses each:".format(count))
+    for version in SAMPLES:
+        measure(version, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: parsing a file of versions (one per line)
+
+    python benchmarks/bench_parse_file.py [lines]
+
+Compares reading lines through text I/O and calling parse_version() with \
+parse_file() and parse_file_array().
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from semver.bulk import parse_file, parse_file_array
+from semver.version import parse_version
+
+
+def write_file(path: str, lines: int) -> None:
+    rng = random.Random(0)
+    with open(path, "w") as f:
+        for _ in range(lines):
+            version = "{}.{}.{}".format(
+                rng.randrange(20), rng.randrange(50), rng.randrange(200)
+            )
+            if rng.random() < 0.3:
+                version += "-rc.{}".format(rng.randrange(10))
+            f.write(version + "\n")
+
+
+def readline_parse(path: str) -> int:
+    count = 0
+    with open(path) as f:
+        for line in f:
+            parse_version(line.rstrip("\n"))
+            count += 1
+    return count
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        write_file(path, lines)
+        size = os.path.getsize(path) / 1e6
+        print("{} lines, {:.1f} MB".format(lines, size))
+
+        for name, func in [
+            ("readline + parse_version", readline_parse),
+            ("parse_file", lambda p: sum(1 for _ in parse_file(p))),
+            ("parse_file_array", lambda p: len(parse_file_array(p))),
+        ]:
+            start = time.perf_counter()
+            count = func(path)
+            seconds = time.perf_counter() - start
+            assert count == lines
+            print(
+                "{:<26} {:>6.2f} s {:>8.0f} lines/s".format(
+                    name, seconds, lines / seconds
+                )
+            )
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: combining many constraints on one package
+
+    python benchmarks/bench_range_algebra.py [count]
+
+Unions and intersects count random constraints one at a time, as a \
+resolver does, and simplifies one long '||'-chain of them. The simplified \
+results stay small.
+"""
+
+import random
+import sys
+import time
+
+from semver import Range
+
+
+def make_expressions(count: int) -> list:
+    """Tilde ranges (for unions) and wide ranges that all overlap (for \
+    intersections)
+    """
+
+    rng = random.Random(0)
+    tilde = []
+    wide = []
+    for _ in range(count):
+        tilde.append("~1.{}.{}".format(rng.randrange(500), rng.randrange(20)))
+        wide.append(
+            ">=1.{}.0 <3.{}.0 || ^0.{}".format(
+                rng.randrange(100), rng.randrange(100), rng.randrange(10)
+            )
+        )
+    return [tilde, wide]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    tilde, wide = ([Range(e) for e in group] for group in make_expressions(count))
+
+    for name, combine, ranges in (
+        ("union", Range.union, tilde),
+        ("intersect", Range.intersect, wide),
+    ):
+        start = time.perf_counter()
+        result = ranges[0]
+        for other in ranges[1:]:
+            result = combine(result, other)
+        seconds = time.perf_counter() - start
+        print(
+            "{:<10} {:>10.6f} s  {:>5} comparator sets: {}".format(
+                name, seconds, len(result.sets), result.expression[:60]
+            )
+        )
+
+    start = time.perf_counter()
+    joined = Range(" || ".join(r.expression for r in tilde))
+    print(
+        "{:<10} {:>10.6f} s  {:>5} comparator sets before simplify()".format(
+            "'||'-chain", time.perf_counter() - start, len(joined.sets)
+        )
+    )
+    simplified = joined.simplify()
+    print(
+        "{:<10} {:>29} after: {}".format(
+            "", len(simplified.sets), simplified.expression[:60]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
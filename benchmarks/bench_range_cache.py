@@ -0,0 +1,61 @@
+"""
+Benchmark: satisfies() with recurring range expressions
+
+    python benchmarks/bench_range_cache.py [count]
+
+Tests count (version, expression) pairs drawn from a few hundred \
+expressions, compiling each range every time and with range_cache, and \
+shows the hit rate of the cache.
+"""
+
+import random
+import sys
+import time
+
+from semver.ranges import Range, RangeCache, range_cache, satisfies
+
+
+def make_pairs(count: int) -> list:
+    rng = random.Random(0)
+    expressions = [
+        rng.choice(["^{}.{}.0", "~{}.{}.1", ">={}.{}.0 <{}.0.0 || 0.x"]).format(
+            major, minor, major + 1
+        )
+        for major in range(10)
+        for minor in range(30)
+    ]
+    return [
+        (
+            "{}.{}.{}".format(rng.randrange(10), rng.randrange(30), rng.randrange(9)),
+            rng.choice(expressions),
+        )
+        for _ in range(count)
+    ]
+
+
+def timed(name: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print("{:<34} {:>12.6f} s".format(name, time.perf_counter() - start))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    pairs = make_pairs(count)
+
+    timed("Range(e).test(v)", lambda: [Range(e).test(v) for v, e in pairs])
+
+    range_cache.cache_clear()
+    timed("satisfies(v, e)", lambda: [satisfies(v, e) for v, e in pairs])
+    print(range_cache.cache_info())
+
+    small = RangeCache(64)
+    timed(
+        "RangeCache(64).get(e).test(v)",
+        lambda: [small.get(e).test(v) for v, e in pairs],
+    )
+    print(small.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: MB/s of find_all() and iter_find() on a synthetic build log
+
+    python benchmarks/bench_search.py [megabytes]
+"""
+
+import io
+import random
+import sys
+import time
+
+from semver.search import find_all, iter_find
+
+LINES = [
+    "2024-01-02T03:04:05Z INFO  resolved dependency foo@{} in 12ms",
+    "2024-01-02T03:04:05Z DEBUG fetching https://example.com/pkg/bar-{}.tgz",
+    "2024-01-02T03:04:06Z INFO  User-Agent: Mozilla/5.0 (X11) Chrome/120.0.6099.109",
+    "2024-01-02T03:04:06Z WARN  retrying request 3 of 5 after 250ms",
+    "2024-01-02T03:04:07Z INFO  built image sha256:5114f85 with tag v{}",
+]
+VERSIONS = ["1.2.3", "10.20.30-rc.1", "2.0.0-alpha.1+build.5", "0.1.0"]
+
+
+def make_log(megabytes: float) -> str:
+    rng = random.Random(0)
+    size = int(megabytes * 1e6)
+    lines = []
+    total = 0
+    while total < size:
+        line = rng.choice(LINES).format(rng.choice(VERSIONS))
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def main() -> None:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    text = make_log(megabytes)
+    size = len(text) / 1e6
+
+    start = time.perf_counter()
+    found = len(find_all(text))
+    seconds = time.perf_counter() - start
+    print(
+        "find_all:  {:.1f} MB, {} versions, {:.1f} MB/s".format(
+            size, found, size / seconds
+        )
+    )
+
+    start = time.perf_counter()
+    found = sum(1 for _ in iter_find(io.StringIO(text)))
+    seconds = time.perf_counter() - start
+    print(
+        "iter_find: {:.1f} MB, {} versions, {:.1f} MB/s".format(
+            size, found, size / seconds
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark: set_*() on version strings, spliced vs. through a Version object
+
+    python benchmarks/bench_setters.py [count]
+"""
+
+import sys
+import timeit
+
+from semver.operations import set_build, set_major, set_pre
+from semver.version import parse_version
+
+LONG_PRE = ".".join("alpha{}".format(i) for i in range(40)) + ".7"
+LONG_BUILD = ".".join("sha{:08x}".format(i) for i in range(40))
+
+SAMPLES = [
+    ("set_major", set_major, "major", "1.2.3", 4),
+    ("set_major", set_major, "major", "1.2.3-" + LONG_PRE + "+" + LONG_BUILD, 4),
+    ("set_pre", set_pre, "pre", "1.2.3-rc.1+" + LONG_BUILD, "rc.2"),
+    ("set_build", set_build, "build", "1.2.3-" + LONG_PRE, "build.99"),
+]
+
+
+def through_version(version: str, attr: str, value: object) -> str:
+    v = parse_version(version)
+    setattr(v, attr, value)
+    return str(v)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("us per call, {} calls each:".format(count))
+    for name, func, attr, version, value in SAMPLES:
+        spliced = timeit.timeit(lambda: func(version, value), number=count)
+        slow = timeit.timeit(
+            lambda: through_version(version, attr, value), number=count
+        )
+        print(
+            "{:<10} len {:>4} {:>8.2f} us spliced {:>8.2f} us via Version".format(
+                name, len(version), spliced / count * 1e6, slow / count * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
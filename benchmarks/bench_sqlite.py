@@ -0,0 +1,90 @@
+"""
+Benchmark: ordering and range scans over an in-memory SQLite table
+
+Compares ``ORDER BY version COLLATE SEMVER`` and ``semver_satisfies()`` (which
+call into Python) against an indexed sort key column.
+
+    python benchmarks/bench_sqlite.py [rows]
+"""
+
+import random
+import sqlite3
+import sys
+import time
+
+from semver.keys import sort_key
+from semver.sqlite import register
+
+
+def make_versions(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    labels = ["", "", "", "-alpha.1", "-beta.3", "-rc.2"]
+    return [
+        "{}.{}.{}{}".format(
+            rng.randrange(30), rng.randrange(50), rng.randrange(100), rng.choice(labels)
+        )
+        for _ in range(n)
+    ]
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print("{:<48} {:>8.2f}s".format(label, time.perf_counter() - start))
+    return result
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    print("rows: {}".format(rows))
+
+    conn = sqlite3.connect(":memory:")
+    register(conn)
+    conn.execute("CREATE TABLE releases (version TEXT NOT NULL, vkey BLOB)")
+
+    versions = make_versions(rows)
+    timed(
+        "insert",
+        lambda: conn.executemany(
+            "INSERT INTO releases (version) VALUES (?)", ((v,) for v in versions)
+        ),
+    )
+    timed(
+        "fill key column (semver_key)",
+        lambda: conn.execute("UPDATE releases SET vkey = semver_key(version)"),
+    )
+    timed(
+        "create index on key column",
+        lambda: conn.execute("CREATE INDEX releases_vkey ON releases (vkey)"),
+    )
+
+    timed(
+        "ORDER BY version COLLATE SEMVER",
+        lambda: conn.execute(
+            "SELECT version FROM releases ORDER BY version COLLATE SEMVER"
+        ).fetchall(),
+    )
+    timed(
+        "ORDER BY vkey (index)",
+        lambda: conn.execute("SELECT version FROM releases ORDER BY vkey").fetchall(),
+    )
+
+    found = timed(
+        "WHERE semver_satisfies(version, '^7.2')",
+        lambda: conn.execute(
+            "SELECT version FROM releases WHERE semver_satisfies(version, '^7.2')"
+        ).fetchall(),
+    )
+    found_idx = timed(
+        "WHERE vkey >= :lo AND vkey < :hi (index)",
+        lambda: conn.execute(
+            "SELECT version FROM releases WHERE vkey >= ? AND vkey < ?",
+            (sort_key("7.2.0"), sort_key("8.0.0-0")),
+        ).fetchall(),
+    )
+    assert sorted(found) == sorted(found_idx)
+    print("matched: {}".format(len(found)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: loading a catalog of versions in each process
+
+    python benchmarks/bench_table.py [count]
+
+Compares parsing every version string (what each worker process does \
+without a shared table) with attaching to a VersionTable in shared memory, \
+and times floor() and select() queries on the table.
+"""
+
+import random
+import sys
+import time
+
+from semver.bulk import parse_many
+from semver.table import VersionTable
+
+
+def make_versions(count: int) -> list:
+    rng = random.Random(0)
+    ret = []
+    for _ in range(count):
+        version = "{}.{}.{}".format(
+            rng.randrange(20), rng.randrange(50), rng.randrange(200)
+        )
+        if rng.random() < 0.3:
+            version += "-rc.{}".format(rng.randrange(10))
+        ret.append(version)
+    return ret
+
+
+def timed(name: str, func, repeat: int = 1) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    seconds = (time.perf_counter() - start) / repeat
+    print("{:<34} {:>12.6f} s".format(name, seconds))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    versions = make_versions(count)
+
+    timed("parse_many + sort", lambda: sorted(parse_many(versions)))
+
+    start = time.perf_counter()
+    table = VersionTable.create_shared(versions)
+    print(
+        "{:<34} {:>12.6f} s ({:.1f} MB)".format(
+            "create_shared", time.perf_counter() - start, table.nbytes / 1e6
+        )
+    )
+
+    try:
+        name = table.name
+        assert name is not None
+        timed("attach_shared + close", lambda: VersionTable.attach_shared(name).close())
+
+        probes = random.Random(1).sample(versions, 1000)
+        timed("floor() x1000", lambda: [table.floor(v) for v in probes])
+        timed("count('^5.10.0')", lambda: table.count("^5.10.0"), 100)
+        timed("select('~5.10.0')", lambda: list(table.select("~5.10.0")), 100)
+    finally:
+        table.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,15 @@
+from .bulk import VersionArray as VersionArray
+from .bulk import clean_and_parse_many as clean_and_parse_many
+from .bulk import clean_many as clean_many
+from .bulk import pack_many as pack_many
+from .bulk import parse_file as parse_file
+from .bulk import parse_file_array as parse_file_array
+from .bulk import parse_many as parse_many
+from .bulk import valid_many as valid_many
+from .catalog import CatalogSnapshot as CatalogSnapshot
+from .catalog import ConcurrentCatalog as ConcurrentCatalog
+from .catalog import VersionCatalog as VersionCatalog
+from .constraints import RangeIndex as RangeIndex
 from .constants import VPos as VPos
 from .constants import VRm as VRm
 from .exc import InvalidOperationException as InvalidOperationException
@@ -5,6 +17,7 @@ from .exc import InvalidPositionException as InvalidPositionException
 from .exc import NegativeValueException as NegativeValueException
 from .exc import NoValueException as NoValueException
 from .exc import ParseException as ParseException
+from .keys import sort_key as sort_key
 from .operations import add as add
 from .operations import bump as bump
 from .operations import clean as clean
@@ -24,7 +37,18 @@ from .operations import set_pre as set_pre
 from .operations import sub as sub
 from .operations import update as update
 from .operations import valid as valid
+from .plan import UpdatePlan as UpdatePlan
+from .plan import compile_update as compile_update
+from .ranges import Range as Range
+from .ranges import RangeCache as RangeCache
+from .ranges import satisfies as satisfies
+from .search import find_all as find_all
+from .search import iter_find as iter_find
+from .table import VersionTable as VersionTable
+from .version import FrozenVersion as FrozenVersion
 from .version import Version as Version
 from .version import parse_version as parse_version
+from .views import VersionView as VersionView
+from .views import parse_bytes as parse_bytes
 
 __version__ = "1.0.1"
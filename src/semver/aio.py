@@ -0,0 +1,247 @@
+"""
+Parsing and sorting versions in asyncio programs
+
+parse_stream() reads lines from an async iterable (such as an \
+``asyncio.StreamReader``) and yields the parsed versions in batches. Lines \
+are only read as fast as the batches are used, and the event loop gets a \
+chance to run other tasks after each batch:
+
+.. code-block:: py
+
+    from semver import aio
+
+    async def ingest(reader):
+        async for batch in aio.parse_stream(reader, batch_size=500):
+            await store(batch)
+
+sort_versions() and max_version() work on large lists in chunks and let \
+other tasks run between the chunks.
+"""
+
+import asyncio
+import concurrent.futures
+import heapq
+import typing as t
+
+from .bulk import _check_errors, parse_many, valid_many
+from .constants import EXC_BAD_BATCH
+from .keys import sort_key
+from .version import Version
+
+# lines parsed (or versions sorted) between chances for other tasks to run
+BATCH_SIZE = 1000
+
+_T = t.TypeVar("_T", str, Version)
+
+
+async def parse_stream(
+    lines: t.AsyncIterable[t.Union[str, bytes]],
+    batch_size: int = BATCH_SIZE,
+    errors: str = "strict",
+    executor: t.Optional[concurrent.futures.Executor] = None,
+) -> t.AsyncIterator[t.List[t.Optional[Version]]]:
+    """Parses lines from an async iterable, a batch at a time
+
+    Lines may be str or bytes (decoded as UTF-8), and a trailing newline \
+    (and carriage return) is removed from each line. Blank lines are skipped.
+
+    Args:
+        lines (AsyncIterable[Union[str, bytes]]): Lines with one version \
+        each; versions must not include 'v' in beginning
+        batch_size (int, optional): Lines in each batch. Defaults to \
+        BATCH_SIZE (1000).
+        errors (str, optional): What to do with invalid lines: 'strict' \
+        raises ParseException, 'skip' leaves them out, and 'none' puts None \
+        in their place. Defaults to 'strict'.
+        executor (Optional[Executor], optional): If given, batches are \
+        parsed in this executor instead of in the event loop. Defaults to None.
+
+    Raises:
+        ValueError: If errors is not a known error policy or batch_size is \
+        not positive
+        ParseException: If errors is 'strict' and any line is invalid
+
+    Yields:
+        List[Optional[Version]]: The parsed versions of each batch, in order \
+        (batches left empty by 'skip' are not yielded)
+    """
+
+    _check_errors(errors)
+    _check_batch(batch_size)
+
+    async for batch in _batches(lines, batch_size):
+        parsed = await _parse(batch, errors, executor)
+        if parsed:
+            yield parsed
+
+
+async def valid_stream(
+    lines: t.AsyncIterable[t.Union[str, bytes]], batch_size: int = BATCH_SIZE
+) -> t.AsyncIterator[t.List[bool]]:
+    """Checks lines from an async iterable with valid(), a batch at a time
+
+    Lines are read the same way as in parse_stream(), so blank lines are \
+    skipped.
+
+    Args:
+        lines (AsyncIterable[Union[str, bytes]]): Lines with one version each
+        batch_size (int, optional): Lines in each batch. Defaults to \
+        BATCH_SIZE (1000).
+
+    Raises:
+        ValueError: If batch_size is not positive
+
+    Yields:
+        List[bool]: If each line of the batch is a valid semantic version
+    """
+
+    _check_batch(batch_size)
+
+    async for batch in _batches(lines, batch_size):
+        yield valid_many(batch)
+        await asyncio.sleep(0)
+
+
+async def sort_versions(
+    versions: t.Iterable[_T], batch_size: int = BATCH_SIZE
+) -> t.List[_T]:
+    """Sorts versions by precedence, letting other tasks run between batches
+
+    The sort keys (see semver.keys.sort_key()) are made and sorted a batch \
+    at a time, and the sorted batches are merged. The sort is stable.
+
+    Args:
+        versions (Iterable[Union[str, Version]]): Version strings (must not \
+        include 'v' in beginning) or Version objects
+        batch_size (int, optional): Versions handled between chances for \
+        other tasks to run. Defaults to BATCH_SIZE (1000).
+
+    Raises:
+        ValueError: If batch_size is not positive
+        ParseException: If any version string is invalid
+
+    Returns:
+        List[Union[str, Version]]: The versions in ascending order
+    """
+
+    _check_batch(batch_size)
+
+    items = list(versions)
+    runs = []
+    for start in range(0, len(items), batch_size):
+        batch = items[start : start + batch_size]
+        runs.append(sorted((sort_key(v), start + i) for i, v in enumerate(batch)))
+        await asyncio.sleep(0)
+
+    # (key, index) pairs are unique, so ties keep their input order
+    ret = []
+    for count, (_, index) in enumerate(heapq.merge(*runs), 1):
+        ret.append(items[index])
+        if count % batch_size == 0:
+            await asyncio.sleep(0)
+
+    return ret
+
+
+async def max_version(
+    versions: t.Iterable[_T], batch_size: int = BATCH_SIZE
+) -> t.Optional[_T]:
+    """Finds the version with the highest precedence, letting other tasks run \
+    between batches
+
+    Args:
+        versions (Iterable[Union[str, Version]]): Version strings (must not \
+        include 'v' in beginning) or Version objects
+        batch_size (int, optional): Versions handled between chances for \
+        other tasks to run. Defaults to BATCH_SIZE (1000).
+
+    Raises:
+        ValueError: If batch_size is not positive
+        ParseException: If any version string is invalid
+
+    Returns:
+        Optional[Union[str, Version]]: The first version with the highest \
+        precedence, or None if there are no versions
+    """
+
+    _check_batch(batch_size)
+
+    best: t.Optional[_T] = None
+    best_key = b""
+    batch: t.List[_T] = []
+
+    for version in versions:
+        batch.append(version)
+        if len(batch) < batch_size:
+            continue
+
+        best, best_key = _max_batch(batch, best, best_key)
+        batch = []
+        await asyncio.sleep(0)
+
+    best, _ = _max_batch(batch, best, best_key)
+    return best
+
+
+async def _batches(
+    lines: t.AsyncIterable[t.Union[str, bytes]], batch_size: int
+) -> t.AsyncIterator[t.List[str]]:
+    """Non-blank lines (without line endings) in lists of up to batch_size"""
+
+    batch: t.List[str] = []
+    async for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", "replace")
+        if line[-1:] == "\n":
+            line = line[:-1]
+        if line[-1:] == "\r":
+            line = line[:-1]
+        if not line:
+            continue
+
+        batch.append(line)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def _parse(
+    batch: t.List[str],
+    errors: str,
+    executor: t.Optional[concurrent.futures.Executor],
+) -> t.List[t.Optional[Version]]:
+    """Parses a batch in executor, or in the event loop and then yields to it"""
+
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, parse_many, batch, errors)
+
+    ret = parse_many(batch, errors)
+    await asyncio.sleep(0)
+
+    return ret
+
+
+def _max_batch(
+    batch: t.List[_T], best: t.Optional[_T], best_key: bytes
+) -> t.Tuple[t.Optional[_T], bytes]:
+    """Highest version (and its key) of a batch and the best one so far"""
+
+    for version in batch:
+        key = sort_key(version)
+        # strictly greater, so the first of equal versions is kept
+        if best is None or key > best_key:
+            best = version
+            best_key = key
+
+    return best, best_key
+
+
+def _check_batch(batch_size: int) -> None:
+    """Raises error if batch_size is not positive"""
+
+    if batch_size <= 0:
+        raise ValueError(EXC_BAD_BATCH.format(batch_size))
@@ -0,0 +1,506 @@
+"""
+Working with many versions at once
+
+Includes:
+
+* Version array class (columnar storage of versions)
+* Bulk parsing, cleaning, validating, and packing functions
+* Parsing files of versions (one per line)
+"""
+
+import array
+import mmap
+import os
+import typing as t
+
+from .constants import (
+    ERRORS,
+    EXC_BAD_ERRORS,
+    EXC_BAD_ERRORS_ARRAY,
+    EXC_INVALID_STR,
+)
+from .exc import ParseException
+from .keys import PACK_OVERFLOW, pack, sort_key
+from .operations import clean, clean_and_parse
+from .spans import CLEAN_RE, FULL_RE
+from .version import Version, _from_groups, parse_version
+
+# bytes of a file decoded at a time by parse_file() (blocks end at a newline)
+FILE_BLOCK_SIZE = 1 << 20
+
+
+class VersionArray:
+    """Stores many versions as columns (one list per version component) \
+    instead of as separate Version objects.
+
+    Indexing or iterating over the array makes Version objects on demand.
+    """
+
+    def __init__(self, versions: t.Iterable[t.Union[str, Version]] = ()) -> None:
+        """Constructor
+
+        Args:
+            versions (Iterable[Union[str, Version]], optional): Version strings \
+            (must not include 'v' in beginning) or Version objects. \
+            Defaults to an empty array.
+
+        Raises:
+            ParseException: If any of the version strings are invalid
+        """
+
+        self._major: t.List[int] = []
+        self._minor: t.List[int] = []
+        self._patch: t.List[int] = []
+        self._pre: t.List[t.Optional[str]] = []
+        self._build: t.List[t.Optional[str]] = []
+
+        self.extend(versions)
+
+    def __repr__(self) -> str:
+        """repr of VersionArray"""
+
+        return "VersionArray({})".format([str(v) for v in self])
+
+    def __len__(self) -> int:
+        return len(self._major)
+
+    def __getitem__(self, index: int) -> Version:
+        """Makes a Version object from the version at the index"""
+
+        return Version(
+            self._major[index],
+            self._minor[index],
+            self._patch[index],
+            self._pre[index],
+            self._build[index],
+        )
+
+    def __iter__(self) -> t.Iterator[Version]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, version: t.Union[str, Version]) -> None:
+        """Adds a version to the end of the array
+
+        Args:
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+
+        Raises:
+            ParseException: If the version string is invalid
+        """
+
+        if isinstance(version, str):
+            parsed = FULL_RE.match(version)
+            if not parsed:
+                raise ParseException(
+                    EXC_INVALID_STR.format("semantic version", version)
+                )
+
+            major, minor, patch, pre, build = parsed.groups()
+            self._append(int(major), int(minor), int(patch), pre, build)
+        else:
+            self._append(
+                version.major, version.minor, version.patch, version.pre, version.build
+            )
+
+    def extend(self, versions: t.Iterable[t.Union[str, Version]]) -> None:
+        """Adds versions to the end of the array
+
+        Args:
+            versions (Iterable[Union[str, Version]]): Version strings (must not \
+            include 'v' in beginning) or Version objects
+
+        Raises:
+            ParseException: If any of the version strings are invalid
+        """
+
+        for version in versions:
+            self.append(version)
+
+    def packed(self) -> t.Tuple["array.array[int]", t.List[int]]:
+        """Packed keys of all versions (see semver.keys.pack())
+
+        Returns:
+            Tuple[array.array, List[int]]: An array of unsigned 64-bit ints \
+            (typecode 'Q') with the packed key of each version, and the indices \
+            of the versions that could not be packed. Those versions have the \
+            key PACK_OVERFLOW instead.
+        """
+
+        keys = array.array("Q")
+        overflow: t.List[int] = []
+
+        for i, (major, minor, patch, pre) in enumerate(
+            zip(self._major, self._minor, self._patch, self._pre)
+        ):
+            key = pack(major, minor, patch, pre is not None)
+            if key is None:
+                overflow.append(i)
+                key = PACK_OVERFLOW
+            keys.append(key)
+
+        return keys, overflow
+
+    def argsort(self) -> t.List[int]:
+        """Indices that would sort the array by version precedence
+
+        The sort is stable. When every version is a release with small version \
+        numbers, this only compares packed keys.
+
+        Returns:
+            List[int]: Indices of the versions in sorted order
+        """
+
+        keys, overflow = self.packed()
+        indices = range(len(self))
+
+        if overflow:
+            return sorted(indices, key=lambda i: sort_key(self[i]))
+
+        if all(pre is None for pre in self._pre):
+            return sorted(indices, key=keys.__getitem__)
+
+        # pre-releases with the same version core have the same packed key,
+        # so they are ordered by their pre-release labels
+        def key(i: int) -> t.Tuple[int, bytes]:
+            if self._pre[i] is None:
+                return (keys[i], b"")
+            return (keys[i], sort_key(self[i]))
+
+        return sorted(indices, key=key)
+
+    def sort(self) -> None:
+        """Sorts the array in place by version precedence (stable)"""
+
+        order = self.argsort()
+        columns: t.Tuple[t.List[t.Any], ...] = (
+            self._major,
+            self._minor,
+            self._patch,
+            self._pre,
+            self._build,
+        )
+        for column in columns:
+            column[:] = [column[i] for i in order]
+
+    @property
+    def major(self) -> t.List[int]:
+        """Major version numbers (should not be modified)"""
+
+        return self._major
+
+    @property
+    def minor(self) -> t.List[int]:
+        """Minor version numbers (should not be modified)"""
+
+        return self._minor
+
+    @property
+    def patch(self) -> t.List[int]:
+        """Patch version numbers (should not be modified)"""
+
+        return self._patch
+
+    @property
+    def pre(self) -> t.List[t.Optional[str]]:
+        """Pre-release labels, or None where there is no label \
+        (should not be modified)
+        """
+
+        return self._pre
+
+    @property
+    def build(self) -> t.List[t.Optional[str]]:
+        """Build labels, or None where there is no label (should not be modified)"""
+
+        return self._build
+
+    def _append(
+        self,
+        major: int,
+        minor: int,
+        patch: int,
+        pre: t.Optional[str],
+        build: t.Optional[str],
+    ) -> None:
+        """Adds already validated components to the columns"""
+
+        self._major.append(major)
+        self._minor.append(minor)
+        self._patch.append(patch)
+        self._pre.append(pre)
+        self._build.append(build)
+
+
+def clean_many(
+    versions: t.Iterable[str], errors: str = "strict"
+) -> t.List[t.Optional[str]]:
+    """Cleans many version strings (see clean()) and checks that the cleaned \
+    strings are valid
+
+    Args:
+        versions (Iterable[str]): Version strings to clean up
+        errors (str, optional): What to do with strings that are invalid after \
+        cleaning: 'strict' raises ParseException, 'skip' leaves them out, and \
+        'none' puts None in their place. Defaults to 'strict'.
+
+    Raises:
+        ValueError: If errors is not a known error policy
+        ParseException: If errors is 'strict' and any cleaned string is invalid
+
+    Returns:
+        List[Optional[str]]: The cleaned version strings
+    """
+
+    _check_errors(errors)
+
+    match = CLEAN_RE.match
+    ret: t.List[t.Optional[str]] = []
+    for version in versions:
+        parsed = match(version)
+        if parsed:
+            ret.append(parsed.group(1))
+        elif errors == "strict":
+            raise ParseException(
+                EXC_INVALID_STR.format("semantic version", clean(version))
+            )
+        elif errors == "none":
+            ret.append(None)
+
+    return ret
+
+
+def clean_and_parse_many(
+    versions: t.Iterable[str], errors: str = "strict"
+) -> t.List[t.Optional[Version]]:
+    """Cleans and parses many version strings (see clean_and_parse())
+
+    Args:
+        versions (Iterable[str]): Version strings to clean up and parse
+        errors (str, optional): What to do with strings that are invalid after \
+        cleaning: 'strict' raises ParseException, 'skip' leaves them out, and \
+        'none' puts None in their place. Defaults to 'strict'.
+
+    Raises:
+        ValueError: If errors is not a known error policy
+        ParseException: If errors is 'strict' and any cleaned string is invalid
+
+    Returns:
+        List[Optional[Version]]: The parsed versions
+    """
+
+    _check_errors(errors)
+
+    ret: t.List[t.Optional[Version]] = []
+    for version in versions:
+        try:
+            ret.append(clean_and_parse(version))
+        except ParseException:
+            if errors == "strict":
+                raise
+            elif errors == "none":
+                ret.append(None)
+
+    return ret
+
+
+def pack_many(
+    versions: t.Iterable[t.Union[str, Version]],
+) -> t.Tuple["array.array[int]", t.List[int]]:
+    """Packed keys of many versions (see semver.keys.pack())
+
+    Args:
+        versions (Iterable[Union[str, Version]]): Version strings (must not \
+        include 'v' in beginning) or Version objects
+
+    Raises:
+        ParseException: If any of the version strings are invalid
+
+    Returns:
+        Tuple[array.array, List[int]]: An array of unsigned 64-bit ints \
+        (typecode 'Q') with the packed key of each version, and the indices \
+        of the versions that could not be packed. Those versions have the \
+        key PACK_OVERFLOW instead.
+    """
+
+    return VersionArray(versions).packed()
+
+
+def parse_file(
+    path: t.Union[str, "os.PathLike[str]"], errors: str = "strict"
+) -> t.Iterator[t.Optional[Version]]:
+    """Parses a file with one version per line
+
+    The file is memory-mapped and decoded (as UTF-8) in large blocks instead \
+    of being read a line at a time. Blank lines are skipped, and '\\r\\n' \
+    line endings are allowed.
+
+    Args:
+        path (Union[str, os.PathLike]): Path of the file
+        errors (str, optional): What to do with invalid lines: 'strict' \
+        raises ParseException, 'skip' leaves them out, and 'none' yields None \
+        in their place. Defaults to 'strict'.
+
+    Raises:
+        ValueError: If errors is not a known error policy
+        ParseException: If errors is 'strict' and any line is invalid
+
+    Returns:
+        Iterator[Optional[Version]]: The parsed versions, in file order (the \
+        file is opened when the iteration starts)
+    """
+
+    # checked now, not when the iteration starts
+    _check_errors(errors)
+
+    return _parse_file(path, errors)
+
+
+def parse_file_array(
+    path: t.Union[str, "os.PathLike[str]"], errors: str = "strict"
+) -> VersionArray:
+    """Parses a file with one version per line into a VersionArray
+
+    Same as parse_file(), but the components go straight into the array's \
+    columns without making Version objects.
+
+    Args:
+        path (Union[str, os.PathLike]): Path of the file
+        errors (str, optional): What to do with invalid lines: 'strict' \
+        raises ParseException, and 'skip' leaves them out. Defaults to 'strict'.
+
+    Raises:
+        ValueError: If errors is not 'strict' or 'skip'
+        ParseException: If errors is 'strict' and any line is invalid
+
+    Returns:
+        VersionArray: The parsed versions, in file order
+    """
+
+    _check_errors(errors)
+    if errors == "none":
+        raise ValueError(EXC_BAD_ERRORS_ARRAY.format(repr(errors)))
+
+    ret = VersionArray()
+    for parsed in _match_file(path, errors):
+        assert parsed is not None, "'none' error policy in VersionArray"
+        major, minor, patch, pre, build = parsed.groups()
+        ret._append(int(major), int(minor), int(patch), pre, build)
+
+    return ret
+
+
+def parse_many(
+    versions: t.Iterable[str], errors: str = "strict"
+) -> t.List[t.Optional[Version]]:
+    """Parses many version strings
+
+    Args:
+        versions (Iterable[str]): Version strings; must not include 'v' \
+        in beginning
+        errors (str, optional): What to do with invalid strings: 'strict' \
+        raises ParseException, 'skip' leaves them out, and 'none' puts None \
+        in their place. Defaults to 'strict'.
+
+    Raises:
+        ValueError: If errors is not a known error policy
+        ParseException: If errors is 'strict' and any string is invalid
+
+    Returns:
+        List[Optional[Version]]: The parsed versions
+    """
+
+    _check_errors(errors)
+
+    ret: t.List[t.Optional[Version]] = []
+    for version in versions:
+        try:
+            ret.append(parse_version(version))
+        except ParseException:
+            if errors == "strict":
+                raise
+            elif errors == "none":
+                ret.append(None)
+
+    return ret
+
+
+def valid_many(versions: t.Iterable[t.Any]) -> t.List[bool]:
+    """Checks many strings with valid()
+
+    Args:
+        versions (Iterable[Any]): Any values; only strings can be valid
+
+    Returns:
+        List[bool]: If each value is a valid semantic version, in order
+    """
+
+    match = FULL_RE.match
+    return [isinstance(v, str) and match(v) is not None for v in versions]
+
+
+def _parse_file(
+    path: t.Union[str, "os.PathLike[str]"], errors: str
+) -> t.Iterator[t.Optional[Version]]:
+    """Generator of parse_file()"""
+
+    for parsed in _match_file(path, errors):
+        if parsed is None:
+            yield None
+        else:
+            yield _from_groups(parsed.groups(), parsed.string)
+
+
+def _match_file(
+    path: t.Union[str, "os.PathLike[str]"], errors: str
+) -> t.Iterator[t.Optional[t.Match[str]]]:
+    """Matches each non-blank line of a file with RE_FULL (None for invalid \
+    lines if errors is 'none')
+    """
+
+    match = FULL_RE.match
+
+    for line in _read_lines(path):
+        if line[-1:] == "\r":
+            line = line[:-1]
+        if not line:
+            continue
+
+        parsed = match(line)
+        if parsed:
+            yield parsed
+        elif errors == "strict":
+            raise ParseException(EXC_INVALID_STR.format("semantic version", line))
+        elif errors == "none":
+            yield None
+
+
+def _read_lines(path: t.Union[str, "os.PathLike[str]"]) -> t.Iterator[str]:
+    """Lines of a file, decoded a block at a time from a memory map"""
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # empty files cannot be mapped
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while pos < size:
+                # end blocks after a newline, so lines are not split
+                end = mm.rfind(b"\n", pos, pos + FILE_BLOCK_SIZE) + 1
+                if end <= pos:
+                    end = mm.find(b"\n", pos + FILE_BLOCK_SIZE) + 1 or size
+
+                block = mm[pos:end].decode("utf-8", "replace")
+                pos = end
+
+                yield from block.split("\n")
+
+
+def _check_errors(errors: str) -> None:
+    """Raises error if unknown error policy"""
+
+    if errors not in ERRORS:
+        raise ValueError(EXC_BAD_ERRORS.format(repr(errors)))
@@ -0,0 +1,680 @@
+"""
+Catalogs of the versions of many packages
+
+A catalog keeps the versions of each package sorted by precedence, along \
+with a sorted list of the versions in each release channel (see \
+CHANNELS), so lookups binary search instead of sorting:
+
+.. code-block:: py
+
+    from semver import VersionCatalog
+
+    catalog = VersionCatalog([("requests", "2.31.0"), ("flask", "3.0.0"), ...])
+    catalog.add("requests", "2.32.0-rc.1")
+
+    catalog.latest("requests")                       # 2.32.0-rc.1
+    catalog.latest("requests", channel="stable")     # 2.31.0
+    catalog.latest("requests", major=1)              # highest 1.x.x
+    catalog.select("requests", "1.x")                # every 1.x.x, in order
+
+The catalog stores FrozenVersion objects, so the versions it returns can be \
+kept and shared safely.
+
+A ConcurrentCatalog can be read by many threads while another thread adds \
+versions. Readers never wait for writers: they read immutable snapshots, \
+and writers publish a new snapshot for each change:
+
+.. code-block:: py
+
+    from semver import ConcurrentCatalog
+
+    catalog = ConcurrentCatalog(entries)
+
+    # in the thread that ingests releases
+    catalog.add("requests", "2.32.0")
+
+    # in request handlers
+    snapshot = catalog.snapshot()
+    snapshot.latest("requests"), snapshot.select("requests", "^2.30")
+"""
+
+import bisect
+import threading
+import typing as t
+
+from .constants import EXC_BAD_CHANNEL
+from .keys import _make_key, sort_key
+from .ranges import KeyBounds, Range, _key_bounds, range_cache
+from .version import FrozenVersion, Version, parse_version
+
+# the release channels that are indexed, and the versions in each one
+CHANNELS: t.Dict[str, t.Callable[[Version], bool]] = {
+    "stable": lambda v: v.is_stable,
+    "final": lambda v: v.is_final,
+    "pre": lambda v: v.has_pre,
+    "rc": lambda v: v.is_rc,
+    "beta": lambda v: v.is_beta,
+    "alpha": lambda v: v.is_alpha,
+}
+
+
+class _Sorted:
+    """Versions sorted by sort key (versions with equal keys are kept in \
+    the order they were added)
+    """
+
+    __slots__ = ("keys", "versions")
+
+    def __init__(
+        self,
+        keys: t.Optional[t.List[bytes]] = None,
+        versions: t.Optional[t.List[FrozenVersion]] = None,
+    ) -> None:
+        self.keys = [] if keys is None else keys
+        self.versions = [] if versions is None else versions
+
+    def insert(self, key: bytes, version: FrozenVersion) -> None:
+        index = bisect.bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.versions.insert(index, version)
+
+    def inserted(self, key: bytes, version: FrozenVersion) -> "_Sorted":
+        """Copy with a version inserted (this one is not changed)"""
+
+        ret = _Sorted(self.keys[:], self.versions[:])
+        ret.insert(key, version)
+        return ret
+
+    def removed(self, index: int) -> "_Sorted":
+        """Copy without the version at an index (this one is not changed)"""
+
+        ret = _Sorted(self.keys[:], self.versions[:])
+        del ret.keys[index], ret.versions[index]
+        return ret
+
+    def find(self, key: bytes, string: str) -> int:
+        """Index of the version with the same key and string, or -1"""
+
+        index = bisect.bisect_left(self.keys, key)
+        while index < len(self.keys) and self.keys[index] == key:
+            if str(self.versions[index]) == string:
+                return index
+            index += 1
+
+        return -1
+
+    def last(
+        self, low: t.Optional[bytes], high: t.Optional[bytes]
+    ) -> t.Optional[FrozenVersion]:
+        """The last version with a key from low (inclusive) to high (exclusive)"""
+
+        start = 0 if low is None else bisect.bisect_left(self.keys, low)
+        end = len(self.keys) if high is None else bisect.bisect_left(self.keys, high)
+
+        return self.versions[end - 1] if start < end else None
+
+    def span(self, bounds: KeyBounds) -> t.Tuple[int, int]:
+        """(start, end) indexes of the versions within the bounds"""
+
+        low, low_inclusive, high, high_inclusive = bounds
+        if low is None:
+            start = 0
+        elif low_inclusive:
+            start = bisect.bisect_left(self.keys, low)
+        else:
+            start = bisect.bisect_right(self.keys, low)
+
+        if high is None:
+            end = len(self.keys)
+        elif high_inclusive:
+            end = bisect.bisect_right(self.keys, high)
+        else:
+            end = bisect.bisect_left(self.keys, high)
+
+        return start, end
+
+
+class _Package:
+    """The versions of a package, and of each channel that has any"""
+
+    __slots__ = ("all", "channels")
+
+    def __init__(self) -> None:
+        self.all = _Sorted()
+        self.channels: t.Dict[str, _Sorted] = {}
+
+    def copy(self) -> "_Package":
+        """Copy that shares the sorted lists of this package (so they must be \
+        replaced, not changed)
+        """
+
+        ret = _Package()
+        ret.all = self.all
+        ret.channels = dict(self.channels)
+
+        return ret
+
+    def added(self, key: bytes, version: FrozenVersion) -> t.Optional["_Package"]:
+        """Copy with a version added, which only copies the lists that \
+        change, or None if the version is already in the package
+        """
+
+        if self.all.find(key, str(version)) >= 0:
+            return None
+
+        ret = self.copy()
+        ret.all = self.all.inserted(key, version)
+        for name, test in CHANNELS.items():
+            if test(version):
+                channel = self.channels.get(name, _Sorted())
+                ret.channels[name] = channel.inserted(key, version)
+
+        return ret
+
+    def discarded(self, key: bytes, string: str) -> t.Optional["_Package"]:
+        """Copy with a version removed, which only copies the lists that \
+        change, or None if the version is not in the package
+        """
+
+        index = self.all.find(key, string)
+        if index < 0:
+            return None
+
+        ret = self.copy()
+        ret.all = self.all.removed(index)
+        for name, channel in self.channels.items():
+            index = channel.find(key, string)
+            if index < 0:
+                continue
+            if len(channel.keys) == 1:
+                del ret.channels[name]
+            else:
+                ret.channels[name] = channel.removed(index)
+
+        return ret
+
+    def add(self, key: bytes, version: FrozenVersion) -> bool:
+        if self.all.find(key, str(version)) >= 0:
+            return False
+
+        self.all.insert(key, version)
+        for name, test in CHANNELS.items():
+            if test(version):
+                self.channels.setdefault(name, _Sorted()).insert(key, version)
+
+        return True
+
+    def discard(self, key: bytes, string: str) -> bool:
+        index = self.all.find(key, string)
+        if index < 0:
+            return False
+
+        del self.all.keys[index], self.all.versions[index]
+        for name, channel in list(self.channels.items()):
+            index = channel.find(key, string)
+            if index >= 0:
+                del channel.keys[index], channel.versions[index]
+                if not channel.keys:
+                    del self.channels[name]
+
+        return True
+
+    def rebuild(self, added: t.List[t.Tuple[bytes, FrozenVersion]]) -> int:
+        """Adds many versions with one sort (instead of one insert each)"""
+
+        rows = list(zip(self.all.keys, self.all.versions))
+        rows.extend(added)
+        # stable, so equal keys stay in the order they were added
+        rows.sort(key=lambda row: row[0])
+
+        keys: t.List[bytes] = []
+        versions: t.List[FrozenVersion] = []
+        strings: t.Set[str] = set()
+        for key, version in rows:
+            if not keys or keys[-1] != key:
+                strings.clear()
+
+            string = str(version)
+            if string not in strings:
+                strings.add(string)
+                keys.append(key)
+                versions.append(version)
+
+        count = len(keys) - len(self.all.keys)
+
+        self.all = _Sorted(keys, versions)
+        self.channels = {}
+        for name, test in CHANNELS.items():
+            rows = [(k, v) for k, v in zip(keys, versions) if test(v)]
+            if rows:
+                self.channels[name] = _Sorted(
+                    [k for k, _ in rows], [v for _, v in rows]
+                )
+
+        return count
+
+
+class _Queries:
+    """Lookups shared by the catalog classes (each one reads _packages once)"""
+
+    _packages: t.Dict[str, _Package]
+
+    def __len__(self) -> int:
+        """Number of packages"""
+
+        return len(self._packages)
+
+    def __contains__(self, package: str) -> bool:
+        return package in self._packages
+
+    def packages(self) -> t.Iterator[str]:
+        """Names of the packages in the catalog, in the order they were added
+
+        Returns:
+            Iterator[str]: The package names
+        """
+
+        return iter(list(self._packages))
+
+    def versions(self, package: str) -> t.List[FrozenVersion]:
+        """Versions of a package, in ascending order
+
+        Args:
+            package (str): Package name
+
+        Returns:
+            List[FrozenVersion]: The versions (empty if the package is not in \
+            the catalog)
+        """
+
+        entry = self._packages.get(package)
+        return [] if entry is None else entry.all.versions[:]
+
+    def latest(
+        self,
+        package: str,
+        channel: t.Optional[str] = None,
+        major: t.Optional[int] = None,
+    ) -> t.Optional[FrozenVersion]:
+        """The version of a package with the highest precedence
+
+        Args:
+            package (str): Package name
+            channel (Optional[str], optional): Only versions in this release \
+            channel (one of CHANNELS). Defaults to None.
+            major (Optional[int], optional): Only versions with this major \
+            version number. Defaults to None.
+
+        Raises:
+            ValueError: If the channel is unknown
+
+        Returns:
+            Optional[FrozenVersion]: The version, or None if there is none
+        """
+
+        if channel is not None and channel not in CHANNELS:
+            raise ValueError(EXC_BAD_CHANNEL.format(channel, ", ".join(CHANNELS)))
+
+        entry = self._packages.get(package)
+        if entry is None:
+            return None
+
+        versions = entry.all if channel is None else entry.channels.get(channel)
+        if versions is None:
+            return None
+        if major is None:
+            return versions.versions[-1]
+
+        return versions.last(_major_key(major), _major_key(major + 1))
+
+    def select(
+        self, package: str, expression: t.Union[str, Range]
+    ) -> t.List[FrozenVersion]:
+        """Versions of a package that satisfy a range, in ascending order
+
+        Args:
+            package (str): Package name
+            expression (Union[str, Range]): A range expression or Range object
+
+        Raises:
+            ParseException: If the range expression is invalid
+
+        Returns:
+            List[FrozenVersion]: The versions in the range
+        """
+
+        if isinstance(expression, str):
+            expression = range_cache.get(expression)
+
+        entry = self._packages.get(package)
+        if entry is None:
+            return []
+
+        spans = []
+        for comparators in expression._key_sets:
+            bounds = _key_bounds(comparators)
+            if bounds is not None:
+                spans.append(entry.all.span(bounds))
+
+        # comparator sets can overlap
+        spans.sort()
+        ret: t.List[FrozenVersion] = []
+        end = 0
+        for start, stop in spans:
+            start = max(start, end)
+            if start < stop:
+                ret.extend(entry.all.versions[start:stop])
+                end = stop
+
+        return ret
+
+
+class VersionCatalog(_Queries):
+    """Versions of packages, sorted by precedence and indexed by release \
+    channel
+
+    Adding a version binary searches for its place in the package and in \
+    each of its channels. Lookups for a package that is not in the catalog \
+    find nothing.
+    """
+
+    def __init__(
+        self, entries: t.Iterable[t.Tuple[str, t.Union[str, Version]]] = ()
+    ) -> None:
+        """Constructor
+
+        Args:
+            entries (Iterable[Tuple[str, Union[str, Version]]], optional): \
+            (package name, version) pairs to add (see update()). Defaults to ().
+
+        Raises:
+            ParseException: If any of the version strings are invalid
+        """
+
+        self._packages: t.Dict[str, _Package] = {}
+        self.update(entries)
+
+    def __repr__(self) -> str:
+        """repr of VersionCatalog"""
+
+        return "VersionCatalog(packages={})".format(len(self._packages))
+
+    def add(self, package: str, version: t.Union[str, Version]) -> bool:
+        """Adds a version of a package
+
+        Versions with the same string are only added once. Versions that \
+        only differ in build labels are all kept, in the order they were added.
+
+        Args:
+            package (str): Package name
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            bool: If the version was added (it was not already in the catalog)
+        """
+
+        frozen = _freeze(version)
+        entry = self._packages.get(package)
+        if entry is None:
+            entry = self._packages[package] = _Package()
+
+        return entry.add(sort_key(frozen), frozen)
+
+    def update(self, entries: t.Iterable[t.Tuple[str, t.Union[str, Version]]]) -> int:
+        """Adds many versions, sorting each package once (faster than add() \
+        for large batches)
+
+        Args:
+            entries (Iterable[Tuple[str, Union[str, Version]]]): (package name, \
+            version) pairs
+
+        Raises:
+            ParseException: If any of the version strings are invalid (no \
+            version is added then)
+
+        Returns:
+            int: The number of versions that were added
+        """
+
+        count = 0
+        for package, added in _group(entries).items():
+            entry = self._packages.get(package)
+            if entry is None:
+                entry = self._packages[package] = _Package()
+            count += entry.rebuild(added)
+
+        return count
+
+    def discard(self, package: str, version: t.Union[str, Version]) -> bool:
+        """Removes a version of a package (a package with no versions left is \
+        removed too)
+
+        Args:
+            package (str): Package name
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object, with the same build label
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            bool: If the version was in the catalog
+        """
+
+        frozen = _freeze(version)
+        entry = self._packages.get(package)
+        if entry is None or not entry.discard(sort_key(frozen), str(frozen)):
+            return False
+
+        if not entry.all.keys:
+            del self._packages[package]
+
+        return True
+
+
+class CatalogSnapshot(_Queries):
+    """The versions of a ConcurrentCatalog at one moment (see \
+    ConcurrentCatalog.snapshot())
+
+    A snapshot never changes, so it can be read from any thread without locks.
+    """
+
+    def __init__(self, packages: t.Dict[str, _Package]) -> None:
+        """Constructor (use ConcurrentCatalog.snapshot() instead)"""
+
+        self._packages = packages
+
+    def __repr__(self) -> str:
+        """repr of CatalogSnapshot"""
+
+        return "CatalogSnapshot(packages={})".format(len(self._packages))
+
+
+class ConcurrentCatalog(_Queries):
+    """A VersionCatalog that threads can read while other threads change it
+
+    Changes never modify the current snapshot. A writer copies the sorted \
+    lists that the change touches (the other lists and packages are shared \
+    with the old snapshot) and then \
+    replaces the snapshot with one reference assignment. Readers take no \
+    locks: each lookup, or each snapshot(), reads the current snapshot once. \
+    Writers are serialized by a lock, and each change copies the mapping of \
+    packages, so batch many changes into one update() when possible.
+    """
+
+    def __init__(
+        self, entries: t.Iterable[t.Tuple[str, t.Union[str, Version]]] = ()
+    ) -> None:
+        """Constructor
+
+        Args:
+            entries (Iterable[Tuple[str, Union[str, Version]]], optional): \
+            (package name, version) pairs to add (see update()). Defaults to ().
+
+        Raises:
+            ParseException: If any of the version strings are invalid
+        """
+
+        self._lock = threading.Lock()
+        self._snapshot = CatalogSnapshot({})
+        self.update(entries)
+
+    def __repr__(self) -> str:
+        """repr of ConcurrentCatalog"""
+
+        return "ConcurrentCatalog(packages={})".format(len(self._packages))
+
+    @property
+    def _packages(self) -> t.Dict[str, _Package]:  # type: ignore[override]
+        return self._snapshot._packages
+
+    def snapshot(self) -> CatalogSnapshot:
+        """The current versions, which do not change when the catalog does \
+        (use one snapshot for lookups that must agree with each other)
+
+        Returns:
+            CatalogSnapshot: The snapshot
+        """
+
+        return self._snapshot
+
+    def add(self, package: str, version: t.Union[str, Version]) -> bool:
+        """Adds a version of a package (see VersionCatalog.add())
+
+        Args:
+            package (str): Package name
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            bool: If the version was added (it was not already in the catalog)
+        """
+
+        frozen = _freeze(version)
+        key = sort_key(frozen)
+
+        with self._lock:
+            packages = self._snapshot._packages
+            entry = packages.get(package)
+            entry = (_Package() if entry is None else entry).added(key, frozen)
+            if entry is None:
+                return False
+
+            self._publish(packages, {package: entry})
+
+        return True
+
+    def update(self, entries: t.Iterable[t.Tuple[str, t.Union[str, Version]]]) -> int:
+        """Adds many versions, and publishes them in one snapshot (see \
+        VersionCatalog.update())
+
+        Args:
+            entries (Iterable[Tuple[str, Union[str, Version]]]): (package name, \
+            version) pairs
+
+        Raises:
+            ParseException: If any of the version strings are invalid (no \
+            version is added then)
+
+        Returns:
+            int: The number of versions that were added
+        """
+
+        groups = _group(entries)
+
+        count = 0
+        with self._lock:
+            packages = self._snapshot._packages
+            changed = {}
+            for package, added in groups.items():
+                entry = packages.get(package)
+                # rebuild() makes new lists, so the shared ones are not changed
+                entry = _Package() if entry is None else entry.copy()
+                count += entry.rebuild(added)
+                changed[package] = entry
+
+            if changed:
+                self._publish(packages, changed)
+
+        return count
+
+    def discard(self, package: str, version: t.Union[str, Version]) -> bool:
+        """Removes a version of a package (see VersionCatalog.discard())
+
+        Args:
+            package (str): Package name
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object, with the same build label
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            bool: If the version was in the catalog
+        """
+
+        frozen = _freeze(version)
+        key = sort_key(frozen)
+
+        with self._lock:
+            packages = self._snapshot._packages
+            entry = packages.get(package)
+            if entry is not None:
+                entry = entry.discarded(key, str(frozen))
+            if entry is None:
+                return False
+
+            self._publish(packages, {package: entry})
+
+        return True
+
+    def _publish(
+        self, packages: t.Dict[str, _Package], changed: t.Dict[str, _Package]
+    ) -> None:
+        """Replaces the snapshot with one that has the changed packages \
+        (called with the lock held)
+        """
+
+        packages = dict(packages)
+        for package, entry in changed.items():
+            if entry.all.keys:
+                packages[package] = entry
+            else:
+                packages.pop(package, None)
+
+        self._snapshot = CatalogSnapshot(packages)
+
+
+def _group(
+    entries: t.Iterable[t.Tuple[str, t.Union[str, Version]]],
+) -> t.Dict[str, t.List[t.Tuple[bytes, FrozenVersion]]]:
+    """(sort key, version) pairs of each package"""
+
+    groups: t.Dict[str, t.List[t.Tuple[bytes, FrozenVersion]]] = {}
+    for package, version in entries:
+        frozen = _freeze(version)
+        groups.setdefault(package, []).append((sort_key(frozen), frozen))
+
+    return groups
+
+
+def _freeze(version: t.Union[str, Version]) -> FrozenVersion:
+    if isinstance(version, str):
+        version = parse_version(version)
+
+    return version.freeze()
+
+
+def _major_key(major: int) -> bytes:
+    """Sort key of the lowest version with a major version number \
+    (major.0.0-0)
+    """
+
+    return _make_key(str(major), "0", "0", "0")
@@ -0,0 +1,275 @@
+"""
+Compact binary encoding of versions
+
+encode() and decode() convert one version, and encode_many() and \
+decode_many() convert a sequence of versions. The encoded data is much \
+smaller and faster to read than a pickle of Version objects, so it suits \
+caches on disk and sending versions between processes:
+
+.. code-block:: py
+
+    from semver import codec
+
+    data = codec.encode_many(versions)
+    assert codec.decode_many(data) == versions
+
+Numbers and label lengths are stored as little-endian unsigned ints of the \
+smallest size (1, 2, 4, or 8 bytes) that fits all of them. Versions with \
+numbers that do not fit in 8 bytes are stored as text. Only data made by \
+this module should be decoded; the labels in it are not checked again.
+"""
+
+import struct
+import typing as t
+
+from .bulk import VersionArray
+from .constants import EXC_BAD_CODEC
+from .exc import ParseException
+from .version import Version, _from_parts, parse_version
+
+# struct format characters of unsigned ints, smallest first
+_WIDTHS = "BHIQ"
+
+# header: format character of the numbers and of the label lengths (the
+# stored length of a label is its length plus one, or 0 if there is no
+# label), then (for encode_many()) the number of versions
+_HEAD = struct.Struct("<2s")
+_HEAD_MANY = struct.Struct("<2sQ")
+
+# header of versions stored as text (separated by newlines)
+_TEXT = b"TT"
+
+# columns of decoded versions: major, minor, patch, pre, build
+_Columns = t.Tuple[
+    t.List[int],
+    t.List[int],
+    t.List[int],
+    t.List[t.Optional[str]],
+    t.List[t.Optional[str]],
+]
+
+
+def encode(version: Version) -> bytes:
+    """Encodes a version
+
+    Args:
+        version (Version): The version
+
+    Returns:
+        bytes: The encoded version
+    """
+
+    pre = version.pre
+    build = version.build
+    lengths = (_length(pre), _length(build))
+    head = _head(max(version._core), max(lengths))
+
+    if head == _TEXT:
+        return head + str(version).encode()
+
+    labels = (pre or "") + (build or "")
+    return b"".join(
+        (
+            head,
+            struct.pack(_format(head, 3, 2), *version._core, *lengths),
+            labels.encode(),
+        )
+    )
+
+
+def decode(data: bytes) -> Version:
+    """Decodes a version made by encode()
+
+    Args:
+        data (bytes): The encoded version (any bytes-like object)
+
+    Raises:
+        ValueError: If data was not made by encode()
+
+    Returns:
+        Version: The version
+    """
+
+    try:
+        (head,) = _HEAD.unpack_from(data)
+        pos = _HEAD.size
+        if head == _TEXT:
+            return parse_version(bytes(data[pos:]).decode())
+
+        fmt = _format(head, 3, 2)
+        major, minor, patch, *lengths = struct.unpack_from(fmt, data, pos)
+        labels = bytes(data[pos + struct.calcsize(fmt) :]).decode()
+        pre, build = _split_labels(labels, lengths, 1)
+    except (struct.error, UnicodeDecodeError, ParseException) as e:
+        raise ValueError(EXC_BAD_CODEC.format(e)) from e
+
+    return _from_parts(major, minor, patch, pre[0], build[0])
+
+
+def encode_many(versions: t.Iterable[t.Union[str, Version]]) -> bytes:
+    """Encodes many versions
+
+    The versions are stored as columns (see VersionArray), so the numbers are \
+    packed together.
+
+    Args:
+        versions (Iterable[Union[str, Version]]): Version objects, version \
+        strings (must not include 'v' in beginning), or a VersionArray
+
+    Raises:
+        ParseException: If any of the version strings are invalid
+
+    Returns:
+        bytes: The encoded versions
+    """
+
+    if isinstance(versions, VersionArray):
+        array = versions
+    else:
+        array = VersionArray(versions)
+
+    count = len(array)
+    numbers = array._major + array._minor + array._patch
+    labels = array._pre + array._build
+    lengths = [_length(label) for label in labels]
+    head = _head(max(numbers, default=0), max(lengths, default=0))
+
+    if head == _TEXT:
+        text = "\n".join(str(v) for v in array)
+        return _HEAD_MANY.pack(head, count) + text.encode()
+
+    return b"".join(
+        (
+            _HEAD_MANY.pack(head, count),
+            struct.pack(_format(head, 3 * count, 2 * count), *numbers, *lengths),
+            "".join(label for label in labels if label is not None).encode(),
+        )
+    )
+
+
+def decode_many(data: bytes) -> t.List[Version]:
+    """Decodes versions made by encode_many()
+
+    Args:
+        data (bytes): The encoded versions (any bytes-like object)
+
+    Raises:
+        ValueError: If data was not made by encode_many()
+
+    Returns:
+        List[Version]: The versions
+    """
+
+    major, minor, patch, pre, build = _decode_columns(data)
+    return [_from_parts(*parts) for parts in zip(major, minor, patch, pre, build)]
+
+
+def decode_array(data: bytes) -> VersionArray:
+    """Decodes versions made by encode_many() into a VersionArray (without \
+    making Version objects)
+
+    Args:
+        data (bytes): The encoded versions (any bytes-like object)
+
+    Raises:
+        ValueError: If data was not made by encode_many()
+
+    Returns:
+        VersionArray: The versions
+    """
+
+    ret = VersionArray()
+    ret._major, ret._minor, ret._patch, ret._pre, ret._build = _decode_columns(data)
+
+    return ret
+
+
+def _decode_columns(data: bytes) -> _Columns:
+    """Columns of versions made by encode_many()"""
+
+    try:
+        head, count = _HEAD_MANY.unpack_from(data)
+        pos = _HEAD_MANY.size
+
+        if head == _TEXT:
+            text = bytes(data[pos:]).decode()
+            array = VersionArray(text.split("\n") if count else [])
+            if len(array) != count:
+                raise ValueError(EXC_BAD_CODEC.format("wrong number of versions"))
+            return array._major, array._minor, array._patch, array._pre, array._build
+
+        fmt = _format(head, 3 * count, 2 * count)
+        values = struct.unpack_from(fmt, data, pos)
+        labels = bytes(data[pos + struct.calcsize(fmt) :]).decode()
+        pre, build = _split_labels(labels, values[3 * count :], count)
+    except (struct.error, UnicodeDecodeError, ParseException) as e:
+        raise ValueError(EXC_BAD_CODEC.format(e)) from e
+
+    return (
+        list(values[:count]),
+        list(values[count : 2 * count]),
+        list(values[2 * count : 3 * count]),
+        pre,
+        build,
+    )
+
+
+def _head(largest_number: int, largest_length: int) -> bytes:
+    """Header for numbers up to largest_number and label lengths up to \
+    largest_length
+    """
+
+    number = _width(largest_number)
+    if number is None:
+        return _TEXT
+
+    return (number + (_width(largest_length) or "Q")).encode()
+
+
+def _width(largest: int) -> t.Optional[str]:
+    """Smallest format character that fits largest (None if it is too large)"""
+
+    for char in _WIDTHS:
+        if largest < 1 << (8 * struct.calcsize(char)):
+            return char
+
+    return None
+
+
+def _format(head: bytes, numbers: int, lengths: int) -> str:
+    """struct format of the numbers and label lengths after a header"""
+
+    chars = head.decode("ascii", "replace")
+    number, length = chars[0], chars[1]
+    if number not in _WIDTHS or length not in _WIDTHS:
+        raise ValueError(EXC_BAD_CODEC.format("unknown header {!r}".format(head)))
+
+    return "<{}{}{}{}".format(numbers, number, lengths, length)
+
+
+def _length(label: t.Optional[str]) -> int:
+    """Stored length of a label (0 if there is no label)"""
+
+    return 0 if label is None else len(label) + 1
+
+
+def _split_labels(
+    labels: str, lengths: t.Sequence[int], count: int
+) -> t.Tuple[t.List[t.Optional[str]], t.List[t.Optional[str]]]:
+    """Splits the joined labels by their stored lengths (count pre-release \
+    lengths, then count build lengths)
+    """
+
+    pos = 0
+    split: t.List[t.Optional[str]] = []
+    for length in lengths:
+        if length:
+            split.append(labels[pos : pos + length - 1])
+            pos += length - 1
+        else:
+            split.append(None)
+
+    if pos != len(labels):
+        raise ValueError(EXC_BAD_CODEC.format("labels do not match their lengths"))
+
+    return split[:count], split[count:]
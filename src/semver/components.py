@@ -24,6 +24,10 @@ from .constants import (
 )
 from .exc import NegativeValueException, NoValueException, ParseException
 
+# Pre._digit before the last identifier has been checked (digits are never
+# negative)
+_UNKNOWN = -1
+
 
 class VersionNumber(Core):
     """A mutable wrapper of Python's int to represent a version number
@@ -143,10 +147,13 @@ class Pre(Core):
 
         self._string = self._check_then_set(string)
 
-        # comparer list
-        self._cmp = self._get_cmp_list(string)
-        # digit to increment/decrement when inc() or dec() is called
-        self._digit = self._cmp[-1] if isinstance(self._cmp[-1], int) else None
+        # comparer list (made on first comparison, see _get_cmp())
+        self._cmp: t.Optional[t.List[t.Union[int, str]]] = None
+        # digit to increment/decrement when inc() or dec() is called (found
+        # on first use, see _get_digit())
+        self._digit: t.Optional[int] = _UNKNOWN
+        # string before the digit (only the digit is re-rendered in inc() or dec())
+        self._prefix = string[: string.rfind(".") + 1]
 
     def __repr__(self) -> str:
         """repr of Pre"""
@@ -189,39 +196,52 @@ class Pre(Core):
             else:
                 return False
 
-        return self._calc_lt(self._cmp, other._cmp, cmp)
+        return self._calc_lt(self._get_cmp(), other._get_cmp(), cmp)
 
-    def inc(self) -> None:
-        """Increments digit by 1 if exists"""
+    def inc(self, amount: int = 1) -> None:
+        """Increments digit by amount if exists
+
+        Args:
+            amount (int, optional): The amount to increment by. Defaults to 1.
+
+        Raises:
+            NoValueException: If there is no digit
+            NegativeValueException: If amount is negative
+        """
 
-        if self._digit is None:
+        digit = self._get_digit()
+        if digit is None:
             raise NoValueException(EXC_PRE_NO_VALUE.format(self._string))
 
-        # make mypy happy
-        assert isinstance(self._cmp[-1], int), "Last element of cmp is not int"
+        if amount < 0:
+            raise NegativeValueException(EXC_MUST_POSITIVE.format(amount))
 
-        # need to update comparison list along with digit and string
-        self._digit += 1
-        self._cmp[-1] += 1
-        self._string = ".".join(map(str, self._cmp))
+        self._set_digit(digit + amount)
 
-    def dec(self) -> None:
-        """Decrements digits by 1 if exists and not 0"""
+    def dec(self, amount: int = 1) -> None:
+        """Decrements digit by amount if exists and the result is not negative
+
+        Args:
+            amount (int, optional): The amount to decrement by. Defaults to 1.
 
-        if self._digit is None:
+        Raises:
+            NoValueException: If there is no digit
+            NegativeValueException: If amount is negative or the digit is \
+            less than amount
+        """
+
+        digit = self._get_digit()
+        if digit is None:
             raise NoValueException(EXC_PRE_NO_VALUE.format(self._string))
 
-        if self._digit == 0:
+        if amount < 0:
+            raise NegativeValueException(EXC_MUST_POSITIVE.format(amount))
+
+        if digit < amount:
             # cannot decrement into a negative value
             raise NegativeValueException(EXC_CANNOT_DEC)
 
-        # make mypy happy
-        assert isinstance(self._cmp[-1], int), "Last element of cmp is not int"
-
-        # need to update comparison list along with digit and string
-        self._digit -= 1
-        self._cmp[-1] -= 1
-        self._string = ".".join(map(str, self._cmp))
+        self._set_digit(digit - amount)
 
     def reset(self) -> None:
         """Resets to dash"""
@@ -229,6 +249,7 @@ class Pre(Core):
         self._string = "-"
         self._cmp = ["-"]
         self._digit = None
+        self._prefix = ""
 
     @property
     def string(self) -> str:
@@ -245,16 +266,17 @@ class Pre(Core):
     def string(self, string: str) -> None:
         # set string
         self._string = self._check_then_set(string)
-        # comparer list
-        self._cmp = self._get_cmp_list(string)
-        # digit to increment/decrement when inc() or dec() is called
-        self._digit = self._cmp[-1] if isinstance(self._cmp[-1], int) else None
+        # comparer list and digit are found again on first use
+        self._cmp = None
+        self._digit = _UNKNOWN
+        # string before the digit (only the digit is re-rendered in inc() or dec())
+        self._prefix = string[: string.rfind(".") + 1]
 
     @property
     def digit(self) -> t.Optional[int]:
         """Returns the digit, if any, otherwise returns None"""
 
-        return self._digit
+        return self._get_digit()
 
     @property
     def is_alpha(self) -> bool:
@@ -262,15 +284,16 @@ class Pre(Core):
             (case insensitive), followed by an empty string or a digit
         """
 
-        if not isinstance(self._cmp[0], str):
+        first = self._get_cmp()[0]
+        if not isinstance(first, str):
             return False
 
-        if self._cmp[0].lower().startswith("alpha"):
-            s = self._cmp[0][len("alpha") :]
+        if first.lower().startswith("alpha"):
+            s = first[len("alpha") :]
             return s == "" or s.isdigit()
 
-        if self._cmp[0].lower().startswith("a"):
-            s = self._cmp[0][len("a") :]
+        if first.lower().startswith("a"):
+            s = first[len("a") :]
             return s == "" or s.isdigit()
 
         return False
@@ -281,15 +304,16 @@ class Pre(Core):
             (case insensitive), followed by an empty string or a digit
         """
 
-        if not isinstance(self._cmp[0], str):
+        first = self._get_cmp()[0]
+        if not isinstance(first, str):
             return False
 
-        if self._cmp[0].lower().startswith("beta"):
-            s = self._cmp[0][len("beta") :]
+        if first.lower().startswith("beta"):
+            s = first[len("beta") :]
             return s == "" or s.isdigit()
 
-        if self._cmp[0].lower().startswith("b"):
-            s = self._cmp[0][len("b") :]
+        if first.lower().startswith("b"):
+            s = first[len("b") :]
             return s == "" or s.isdigit()
 
         return False
@@ -299,15 +323,63 @@ class Pre(Core):
         """Returns if first dot-separated identifier starts with 'rc' \
             (case insensitive), followed by an empty string or a digit"""
 
-        if not isinstance(self._cmp[0], str):
+        first = self._get_cmp()[0]
+        if not isinstance(first, str):
             return False
 
-        if self._cmp[0].lower().startswith("rc"):
-            s = self._cmp[0][len("rc") :]
+        if first.lower().startswith("rc"):
+            s = first[len("rc") :]
             return s == "" or s.isdigit()
 
         return False
 
+    def _copy(self) -> "Pre":
+        """Copy that does not share the (mutable) comparison list"""
+
+        ret = Pre.__new__(Pre)
+        ret.__dict__.update(self.__dict__)
+        if self._cmp is not None:
+            ret._cmp = self._cmp[:]
+
+        return ret
+
+    @classmethod
+    def _from_valid(cls, string: str) -> "Pre":
+        """Makes a Pre from a string that was already checked (e.g. by RE_FULL)"""
+
+        ret = cls.__new__(cls)
+        ret._string = string
+        ret._cmp = None
+        ret._digit = _UNKNOWN
+        ret._prefix = string[: string.rfind(".") + 1]
+
+        return ret
+
+    def _set_digit(self, digit: int) -> None:
+        """Sets the digit and updates the comparison list and string"""
+
+        self._digit = digit
+        if self._cmp is not None:
+            self._cmp[-1] = digit
+        self._string = self._prefix + str(digit)
+
+    def _get_cmp(self) -> t.List[t.Union[int, str]]:
+        """Comparison list (made on first use)"""
+
+        if self._cmp is None:
+            self._cmp = self._get_cmp_list(self._string)
+
+        return self._cmp
+
+    def _get_digit(self) -> t.Optional[int]:
+        """Digit in the last identifier, or None (found on first use)"""
+
+        if self._digit == _UNKNOWN:
+            last = self._string[len(self._prefix) :]
+            self._digit = int(last) if last.isdigit() else None
+
+        return self._digit
+
     def _get_cmp_list(self, string: str) -> t.List[t.Union[int, str]]:
         """Comparison list"""
 
@@ -375,6 +447,15 @@ class Build:
     def string(self, string: str) -> None:
         self._string = self._check_then_set(string)
 
+    @classmethod
+    def _from_valid(cls, string: str) -> "Build":
+        """Makes a Build from a string that was already checked (e.g. by RE_FULL)"""
+
+        ret = cls.__new__(cls)
+        ret._string = string
+
+        return ret
+
     def _check_then_set(self, string: str) -> str:
         """Raises error if invalid string"""
 
@@ -16,6 +16,19 @@ RE_FULL = (
     r"|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-]"
     r"[0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
 )  # for parsing a full version string
+RE_CLEAN = (
+    r"^\s*[v=]*(" + RE_FULL[1:-1] + r")\s*\Z"
+)  # for cleaning and parsing in one pass (group 1 is the cleaned string)
+RE_SEARCH = (
+    r"(?<![\d.])" + RE_FULL[1:-1] + r"(?![\da-zA-Z-]|[.+][\da-zA-Z])"
+)  # for finding versions in text (not inside a longer dotted number or word)
+RE_PARTIAL = (
+    r"^v?(0|[1-9]\d*|[xX*])(?:\.(0|[1-9]\d*|[xX*])(?:\.(0|[1-9]\d*|[xX*])"
+    r"(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*"
+    r"[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?)?)?$"
+)  # for parsing a (possibly partial or wildcard) version in a range
+RE_RANGE_OP = r"(<=|>=|<|>|=|\^|~)\s+"  # for joining operators to their versions
+RE_COMPARATOR = r"^(<=|>=|<|>|=|\^|~)?(.+)$"  # for parsing a comparator in a range
 
 # -------------------- EXCEPTION MSGS --------------------
 
@@ -29,6 +42,86 @@ an unknown type.
 """
 
 
+EXC_BAD_ERRORS = "Unknown error policy: {} (must be one of 'strict', 'skip', 'none')"
+"""
+Used in bulk functions when the errors argument is not a known error policy.
+
+* In parse_many(), clean_many(), and clean_and_parse_many(), used when errors \
+is not 'strict', 'skip', or 'none'
+"""
+
+
+EXC_BAD_ERRORS_ARRAY = (
+    "Error policy {} cannot fill a VersionArray (must be 'strict' or 'skip')"
+)
+"""
+Used when a bulk function fills a VersionArray, which cannot hold None.
+
+* In parse_file_array(), used when errors is 'none'
+* In parallel.parse_array(), used when errors is 'none'
+"""
+
+
+EXC_BAD_BATCH = "Batch size must be positive: {}"
+"""
+Used when versions are handled in batches.
+
+* In aio.parse_stream(), aio.valid_stream(), aio.sort_versions(), and \
+aio.max_version(), used when batch_size is not positive
+"""
+
+
+EXC_BAD_CODEC = "Invalid encoded version data: {}"
+"""
+Used when decoding data that was not made by semver.codec.
+
+* In decode(), decode_many(), and decode_array(), used when the data is \
+truncated, has extra bytes, or has an unknown format
+"""
+
+
+EXC_BAD_TABLE = "Invalid version table: {}"
+"""
+Used when reading a buffer that does not hold a version table.
+
+* In VersionTable, used when the header is wrong or the buffer is too small
+"""
+
+
+EXC_BAD_INDEX = "Invalid version index: {}"
+"""
+Used when reading a buffer or file that does not hold a version index.
+
+* In index.open() and VersionIndex, used when the header is wrong or the \
+buffer is too small
+"""
+
+
+EXC_BAD_CHUNK = "Chunk size must be positive: {}"
+"""
+Used when reading a stream in chunks.
+
+* In iter_find(), used when chunk_size is not positive
+* In index.build(), used when chunk_size is not positive
+"""
+
+
+EXC_BAD_CACHE_SIZE = "Cache size must not be negative: {}"
+"""
+Used when making a cache with a negative size.
+
+* In RangeCache, used when maxsize is negative
+"""
+
+
+EXC_BAD_CHANNEL = "Unknown release channel: {} (must be one of {})"
+"""
+Used when looking up versions by release channel.
+
+* In VersionCatalog.latest(), used when channel is not in catalog.CHANNELS
+"""
+
+
 EXC_CANNOT_ADD = "Cannot add {} that already exists: {}"
 """
 When trying to append a pre-release or build label to a version object \
@@ -43,9 +136,10 @@ the has_pre property is True
 EXC_CANNOT_DEC = "Cannot decrement number to a negative value"
 """
 When trying to decrement a VersionNumber object or the digit of a Pre object \
-that is currently 0.
+that is currently 0 (or less than the amount to decrement by).
 
-* In dec() of Pre, used when _digit attribute is 0
+* In dec() of Pre, used when _digit attribute is less than amount
+* In dec() of Version, used when the version number is less than amount
 """
 
 
@@ -59,6 +153,15 @@ property is False, or when rhs is VRm.BUILD and the has_build property is True
 """
 
 
+EXC_FROZEN = "Cannot change a frozen version: {}"
+"""
+When trying to change a FrozenVersion object.
+
+* In inc(), dec(), remove_pre(), remove_build(), reset(), the +, - operators, \
+and the setters of FrozenVersion
+"""
+
+
 EXC_INVALID_POS = "Unrecognized version position: {}"
 """
 Used when incrementing or decrementing an invalid position of a Version object.
@@ -94,12 +197,31 @@ is not '+' or '-'
 """
 
 
+EXC_NO_SHARED_MEMORY = "Shared memory needs Python 3.8 or later (running {})"
+"""
+Used when shared memory is not available.
+
+* In VersionTable.create_shared() and VersionTable.attach_shared(), used \
+before Python 3.8
+"""
+
+
+EXC_TOO_LARGE = "Number is too large to store in {}: {}"
+"""
+Used when a version number does not fit in a fixed-size field.
+
+* In pack_table(), used when a number does not fit in 64 bits
+"""
+
+
 EXC_MUST_POSITIVE = "Number must be positive: {}"
 """
 Used when the user is trying to set a VersionNumber object to a negative number.
 
 * In the VersionNumber constructor, used when the number argument is negative
 * In the number setter of VersionNumber, used when the number argument is negative
+* In the Version constructor and number setters, used when the number is negative
+* In inc() and dec() of Version and Pre, used when the amount argument is negative
 """
 
 
@@ -144,6 +266,18 @@ Used in Version when trying to decrement a pre-release that doesn't exist.
 """
 
 
+# -------------------- BULK --------------------
+
+ERRORS = ("strict", "skip", "none")
+"""
+Error policies for bulk functions, when an item cannot be parsed:
+
+* 'strict' raises the exception
+* 'skip' leaves the item out of the results
+* 'none' puts None in place of the item
+"""
+
+
 # -------------------- ENUMS --------------------
 
 
@@ -0,0 +1,189 @@
+"""
+Indexes of many ranges, for finding the ranges that a version satisfies
+
+.. code-block:: py
+
+    from semver import RangeIndex
+
+    constraints = RangeIndex(["^1.2.0", ">=2 <3", "~1.4.1", ...])
+    constraints.match("1.4.5")      # positions of the ranges 1.4.5 satisfies
+
+Each range is turned into the intervals of versions that it allows (see \
+Range.simplify()), and the intervals are stored in a centered interval \
+tree. match() then takes O(log n + k) time for n ranges and k matches, \
+instead of testing every range.
+"""
+
+import bisect
+import typing as t
+
+from .keys import sort_key
+from .ranges import _KEY_MAX, Range
+from .version import Version
+
+# the sort keys from start (inclusive) to end (exclusive) that a range
+# allows: (start, end, position of the range)
+_Interval = t.Tuple[bytes, bytes, int]
+
+
+class _Node:
+    """Node of the interval tree: the intervals that contain center, \
+    sorted by start and by end, and the nodes of the intervals entirely \
+    before and after center
+    """
+
+    __slots__ = (
+        "center",
+        "starts",
+        "start_positions",
+        "ends",
+        "end_positions",
+        "left",
+        "right",
+    )
+
+    def __init__(self, center: bytes, intervals: t.List[_Interval]) -> None:
+        self.center = center
+
+        by_start = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [start for start, _, _ in by_start]
+        self.start_positions = [pos for _, _, pos in by_start]
+
+        by_end = sorted(intervals, key=lambda interval: interval[1])
+        self.ends = [end for _, end, _ in by_end]
+        self.end_positions = [pos for _, _, pos in by_end]
+
+        self.left: t.Optional[_Node] = None
+        self.right: t.Optional[_Node] = None
+
+
+class RangeIndex:
+    """An immutable index of ranges that finds the ranges a version \
+    satisfies without testing each one
+    """
+
+    def __init__(self, ranges: t.Iterable[t.Union[str, Range]]) -> None:
+        """Constructor
+
+        Args:
+            ranges (Iterable[Union[str, Range]]): Range expressions or Range \
+            objects
+
+        Raises:
+            ParseException: If any of the range expressions are invalid
+        """
+
+        # compiled without range_cache, so that building an index of many
+        # ranges does not push out the ranges of other calls
+        self._ranges = [Range(r) if isinstance(r, str) else r for r in ranges]
+
+        intervals: t.List[_Interval] = []
+        for pos, expression in enumerate(self._ranges):
+            # the intervals of a range are disjoint, so it only matches once
+            intervals.extend(
+                (
+                    b"" if start is None else start[0],
+                    _KEY_MAX if end is None else end[0],
+                    pos,
+                )
+                for start, end in expression._intervals()
+            )
+
+        self._root = _build(intervals)
+
+    def __repr__(self) -> str:
+        """repr of RangeIndex"""
+
+        return "RangeIndex(ranges={})".format(len(self._ranges))
+
+    def __len__(self) -> int:
+        """Number of ranges"""
+
+        return len(self._ranges)
+
+    def __getitem__(self, index: int) -> Range:
+        """The range at a position (in the order the ranges were given)"""
+
+        return self._ranges[index]
+
+    def match(self, version: t.Union[str, Version]) -> t.List[int]:
+        """Positions of the ranges that a version satisfies
+
+        Args:
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            List[int]: The positions of the ranges (in the order the ranges \
+            were given to the constructor), in no particular order
+        """
+
+        point = sort_key(version)
+
+        ret: t.List[int] = []
+        node = self._root
+        while node is not None:
+            if point < node.center:
+                # every interval here ends after point, so those that start
+                # at or before it contain it
+                ret.extend(
+                    node.start_positions[: bisect.bisect_right(node.starts, point)]
+                )
+                node = node.left
+            elif point > node.center:
+                # and every interval here starts before point
+                ret.extend(node.end_positions[bisect.bisect_right(node.ends, point) :])
+                node = node.right
+            else:
+                ret.extend(node.start_positions)
+                break
+
+        return ret
+
+    def matching(self, version: t.Union[str, Version]) -> t.List[Range]:
+        """Ranges that a version satisfies (see match())
+
+        Args:
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            List[Range]: The ranges, in no particular order
+        """
+
+        return [self._ranges[pos] for pos in self.match(version)]
+
+
+def _build(intervals: t.List[_Interval]) -> t.Optional[_Node]:
+    """Builds the interval tree (the center of each node is the median \
+    start, so the tree has O(log n) depth)
+    """
+
+    if not intervals:
+        return None
+
+    starts = sorted(start for start, _, _ in intervals)
+    center = starts[len(starts) // 2]
+
+    before: t.List[_Interval] = []
+    after: t.List[_Interval] = []
+    here: t.List[_Interval] = []
+    for interval in intervals:
+        if interval[1] <= center:
+            before.append(interval)
+        elif interval[0] > center:
+            after.append(interval)
+        else:
+            here.append(interval)
+
+    node = _Node(center, here)
+    node.left = _build(before)
+    node.right = _build(after)
+
+    return node
@@ -0,0 +1,454 @@
+"""
+Sorted version indexes stored in files
+
+An index file holds versions sorted by precedence, optionally grouped by \
+package name. open() maps the file and only reads its header, so queries \
+can start right away however large the index is:
+
+.. code-block:: py
+
+    from semver import index
+
+    index.build([("requests", "2.31.0"), ("flask", "3.0.0"), ...], "catalog.idx")
+
+    with index.open("catalog.idx") as idx:
+        idx.latest("requests"), idx.floor("2.0.0", "requests")
+
+build() sorts the versions with an external merge sort, so it only keeps \
+one chunk of entries (and the versions of one package) in memory.
+
+Layout (all ints are little-endian unsigned 64-bit):
+
+* Header: ``b"SVIX"``, layout number (4 bytes), number of packages, \
+offset of the directory, and size of the package names
+* A version table (see semver.table) for each package, in package order, \
+each starting at a multiple of 8 bytes
+* Directory: offsets of the package names (packages + 1), offsets of the \
+tables (packages), and the package names (UTF-8, sorted as bytes)
+"""
+
+import errno
+import heapq
+import io
+import itertools
+import mmap
+import os
+import pickle
+import secrets
+import struct
+import tempfile
+import typing as t
+
+from .constants import EXC_BAD_CHUNK, EXC_BAD_INDEX
+from .ranges import Range, range_cache
+from .table import VersionTable, _pack_rows, _row
+from .version import Version
+
+# entries sorted in memory at a time by build()
+CHUNK_SIZE = 1 << 18
+
+_MAGIC = b"SVIX"
+_LAYOUT = 1
+_HEADER = struct.Struct("<4sIQQQ")
+_PAIR = struct.Struct("<QQ")
+_INT = struct.Struct("<Q")
+
+# O_BINARY is needed on Windows
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# rows pickled together in the temporary files of build()
+_RUN_BATCH = 4096
+
+# package name of versions without one
+DEFAULT_PACKAGE = ""
+
+# an entry of build(): a version, or a (package name, version) pair
+Entry = t.Union[str, Version, t.Tuple[str, t.Union[str, Version]]]
+
+# (package, sort key, entry number, major, minor, patch, pre, build)
+_Row = t.Tuple[bytes, bytes, int, int, int, int, t.Optional[str], t.Optional[str]]
+
+
+class VersionIndex:
+    """A read-only index of versions, grouped by package and sorted by \
+    precedence (see open())
+
+    Queries for a package that is not in the index find nothing.
+    """
+
+    def __init__(self, buffer: t.Any) -> None:
+        """Constructor
+
+        Args:
+            buffer (Any): A bytes-like object (bytes, memoryview, mmap) with \
+            an index made by build()
+
+        Raises:
+            ValueError: If the buffer does not hold an index
+        """
+
+        try:
+            magic, layout, count, directory, names = _HEADER.unpack_from(buffer)
+        except struct.error as e:
+            raise ValueError(EXC_BAD_INDEX.format(e)) from e
+
+        if magic != _MAGIC or layout != _LAYOUT:
+            raise ValueError(EXC_BAD_INDEX.format("unknown header"))
+
+        self._buffer = buffer
+        self._count: int = count
+
+        # start of each section of the directory
+        self._name_offsets = directory
+        self._table_offsets = directory + 8 * (count + 1)
+        self._names = self._table_offsets + 8 * count
+
+        if len(buffer) < self._names + names:
+            raise ValueError(EXC_BAD_INDEX.format("buffer is too small"))
+
+        # released in close()
+        self._mmap: t.Optional[mmap.mmap] = None
+
+    def __repr__(self) -> str:
+        """repr of VersionIndex"""
+
+        return "VersionIndex(packages={})".format(self._count)
+
+    def __len__(self) -> int:
+        """Number of packages"""
+
+        return self._count
+
+    def __contains__(self, package: str) -> bool:
+        return self._find(package) is not None
+
+    def __getitem__(self, package: str) -> VersionTable:
+        """The versions of a package
+
+        Raises:
+            KeyError: If the package is not in the index
+        """
+
+        table = self._find(package)
+        if table is None:
+            raise KeyError(package)
+
+        return table
+
+    def __enter__(self) -> "VersionIndex":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    def packages(self) -> t.Iterator[str]:
+        """Names of the packages in the index, sorted by their UTF-8 bytes
+
+        Yields:
+            str: Each package name
+        """
+
+        for i in range(self._count):
+            yield self._name(i).decode()
+
+    def close(self) -> None:
+        """Unmaps the index file (the index and its tables cannot be used \
+        after it is closed)
+        """
+
+        self._buffer = b""
+        self._count = 0
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def latest(self, package: str = DEFAULT_PACKAGE) -> t.Optional[Version]:
+        """The version of a package with the highest precedence
+
+        Args:
+            package (str, optional): Package name. Defaults to DEFAULT_PACKAGE.
+
+        Returns:
+            Optional[Version]: The version, or None if there is none
+        """
+
+        table = self._find(package)
+        return None if table is None else table.latest()
+
+    def latest_stable(self, package: str = DEFAULT_PACKAGE) -> t.Optional[Version]:
+        """The stable version (see Version.is_stable) of a package with the \
+        highest precedence
+
+        Args:
+            package (str, optional): Package name. Defaults to DEFAULT_PACKAGE.
+
+        Returns:
+            Optional[Version]: The version, or None if there is none
+        """
+
+        table = self._find(package)
+        return None if table is None else table.latest(stable=True)
+
+    def floor(
+        self, version: t.Union[str, Version], package: str = DEFAULT_PACKAGE
+    ) -> t.Optional[Version]:
+        """The highest version of a package that is lower than or equal to \
+        version (see VersionTable.floor())
+
+        Args:
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+            package (str, optional): Package name. Defaults to DEFAULT_PACKAGE.
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            Optional[Version]: The version, or None if there is none
+        """
+
+        table = self._find(package)
+        return None if table is None else table.floor(version)
+
+    def ceiling(
+        self, version: t.Union[str, Version], package: str = DEFAULT_PACKAGE
+    ) -> t.Optional[Version]:
+        """The lowest version of a package that is higher than or equal to \
+        version (see VersionTable.ceiling())
+
+        Args:
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+            package (str, optional): Package name. Defaults to DEFAULT_PACKAGE.
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            Optional[Version]: The version, or None if there is none
+        """
+
+        table = self._find(package)
+        return None if table is None else table.ceiling(version)
+
+    def select(
+        self, expression: t.Union[str, Range], package: str = DEFAULT_PACKAGE
+    ) -> t.Iterator[Version]:
+        """Versions of a package that satisfy a range, in ascending order
+
+        Args:
+            expression (Union[str, Range]): A range expression or Range object
+            package (str, optional): Package name. Defaults to DEFAULT_PACKAGE.
+
+        Raises:
+            ParseException: If the range expression is invalid
+
+        Returns:
+            Iterator[Version]: The versions in the range
+        """
+
+        if isinstance(expression, str):
+            expression = range_cache.get(expression)
+
+        table = self._find(package)
+        return iter(()) if table is None else table.select(expression)
+
+    def _find(self, package: str) -> t.Optional[VersionTable]:
+        """Binary searches the directory for a package's table"""
+
+        name = package.encode()
+        lo = 0
+        hi = self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = self._name(mid)
+            if probe < name:
+                lo = mid + 1
+            elif probe > name:
+                hi = mid
+            else:
+                (offset,) = _INT.unpack_from(
+                    self._buffer, self._table_offsets + 8 * mid
+                )
+                return VersionTable(self._buffer, offset)
+
+        return None
+
+    def _name(self, index: int) -> bytes:
+        start, end = _PAIR.unpack_from(self._buffer, self._name_offsets + 8 * index)
+        return bytes(self._buffer[self._names + start : self._names + end])
+
+
+def open(path: t.Union[str, "os.PathLike[str]"]) -> VersionIndex:
+    """Opens an index file made by build() (the file is mapped read-only, \
+    not read)
+
+    Args:
+        path (Union[str, os.PathLike]): Path of the file
+
+    Raises:
+        ValueError: If the file does not hold an index
+
+    Returns:
+        VersionIndex: The index (close it when it is no longer used)
+    """
+
+    with io.open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            raise ValueError(EXC_BAD_INDEX.format("file is empty"))
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        ret = VersionIndex(mapped)
+    except ValueError:
+        mapped.close()
+        raise
+
+    ret._mmap = mapped
+    return ret
+
+
+def build(
+    entries: t.Iterable[Entry],
+    path: t.Union[str, "os.PathLike[str]"],
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """Builds an index file from entries in any order
+
+    Entries are sorted chunk_size at a time, and chunks are kept in \
+    temporary files until they are merged. The file is written next to \
+    path and then moved over it, so an index that is already open is not \
+    changed.
+
+    Args:
+        entries (Iterable[Entry]): Versions (version strings, which must not \
+        include 'v' in beginning, or Version objects), which belong to the \
+        package DEFAULT_PACKAGE, or (package name, version) pairs
+        path (Union[str, os.PathLike]): Path of the index file
+        chunk_size (int, optional): Entries sorted in memory at a time. \
+        Defaults to CHUNK_SIZE.
+
+    Raises:
+        ParseException: If any of the version strings are invalid
+        ValueError: If chunk_size is not positive, or a version number does \
+        not fit in 64 bits
+
+    Returns:
+        int: The number of versions in the index
+    """
+
+    if chunk_size <= 0:
+        raise ValueError(EXC_BAD_CHUNK.format(chunk_size))
+
+    runs: t.List[t.IO[bytes]] = []
+    try:
+        chunk: t.List[_Row] = []
+        count = 0
+        for entry in entries:
+            if isinstance(entry, tuple):
+                package, version = entry
+            else:
+                package, version = DEFAULT_PACKAGE, entry
+
+            row = _row(version)
+            chunk.append((package.encode(), row[0], count) + row[1:])
+            count += 1
+
+            if len(chunk) >= chunk_size:
+                chunk.sort()
+                runs.append(_write_run(chunk))
+                chunk = []
+
+        chunk.sort()
+        if runs:
+            runs.append(_write_run(chunk))
+            rows: t.Iterator[_Row] = heapq.merge(*(_read_run(run) for run in runs))
+        else:
+            rows = iter(chunk)
+
+        _write_index(rows, path)
+    finally:
+        for run in runs:
+            run.close()
+
+    return count
+
+
+def _write_index(
+    rows: t.Iterator[_Row], path: t.Union[str, "os.PathLike[str]"]
+) -> None:
+    """Writes rows sorted by package and key as an index file"""
+
+    fd, temp = _create_temp(path)
+    try:
+        with io.open(fd, "wb") as out:
+            out.write(bytes(_HEADER.size))
+            pos = _HEADER.size
+
+            names: t.List[bytes] = []
+            offsets: t.List[int] = []
+            for package, group in itertools.groupby(rows, key=lambda row: row[0]):
+                table = _pack_rows([(row[1],) + row[3:] for row in group])
+
+                names.append(package)
+                offsets.append(pos)
+                padding = -len(table) % 8
+                out.write(table + bytes(padding))
+                pos += len(table) + padding
+
+            name_offsets = [0]
+            for name in names:
+                name_offsets.append(name_offsets[-1] + len(name))
+
+            columns = name_offsets + offsets
+            out.write(struct.pack("<{}Q".format(len(columns)), *columns))
+            out.write(b"".join(names))
+
+            out.seek(0)
+            out.write(_HEADER.pack(_MAGIC, _LAYOUT, len(names), pos, name_offsets[-1]))
+
+        os.replace(temp, path)
+    except BaseException:
+        os.remove(temp)
+        raise
+
+
+def _create_temp(path: t.Union[str, "os.PathLike[str]"]) -> t.Tuple[int, str]:
+    """Creates a temporary file next to path, like mkstemp() but with the \
+    mode that open() gives new files (mkstemp() makes them 0600)
+    """
+
+    directory, name = os.path.split(os.path.abspath(path))
+    for _ in range(tempfile.TMP_MAX):
+        temp = os.path.join(directory, ".{}.{}.tmp".format(name, secrets.token_hex(8)))
+        try:
+            # the kernel applies the umask to the mode
+            fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666)
+        except FileExistsError:
+            continue
+        return fd, temp
+
+    raise FileExistsError(errno.EEXIST, "No usable temporary file name found")
+
+
+def _write_run(rows: t.List[_Row]) -> t.IO[bytes]:
+    """Temporary file with sorted rows (deleted when it is closed)"""
+
+    run = tempfile.TemporaryFile()
+    for start in range(0, len(rows), _RUN_BATCH):
+        pickle.dump(rows[start : start + _RUN_BATCH], run, pickle.HIGHEST_PROTOCOL)
+    run.seek(0)
+
+    return run
+
+
+def _read_run(run: t.IO[bytes]) -> t.Iterator[_Row]:
+    """Rows written by _write_run()"""
+
+    while True:
+        try:
+            batch = pickle.load(run)
+        except EOFError:
+            return
+        yield from batch
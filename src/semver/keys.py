@@ -0,0 +1,158 @@
+"""
+Binary keys that sort in the same order as version precedence
+
+Includes:
+
+* Sort keys (bytes that compare like the versions they were made from)
+* Packed keys (64-bit ints for versions with small version numbers)
+"""
+
+import typing as t
+
+from .constants import EXC_INVALID_STR
+from .exc import ParseException
+from .spans import FULL_RE
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .version import Version
+
+# bits for each of major, minor, and patch in a packed key
+PACK_BITS = 20
+# biggest version number that can be packed
+PACK_MAX = (1 << PACK_BITS) - 1
+# marks versions that could not be packed in bulk packing (bigger than any
+# packed key, and still fits in an unsigned 64-bit int)
+PACK_OVERFLOW = 1 << 63
+
+# marks the end of the version core when there is no pre-release label, so
+# that a release sorts after all of its pre-releases
+_KEY_RELEASE = b"\x01"
+_KEY_PRE = b"\x00"
+
+# tags for pre-release identifiers (numeric identifiers sort before
+# alphanumeric ones) and the end of an identifier or the identifier list
+_KEY_NUM = b"\x01"
+_KEY_ALNUM = b"\x02"
+_KEY_END = b"\x00"
+
+
+def sort_key(version: t.Union[str, "Version"]) -> bytes:
+    """Makes a binary key that sorts in the same order as version precedence
+
+    Two keys compare (as bytes) in the same way their versions compare, so \
+    they can be stored in an indexed database column, sorted with ``sorted()``, \
+    or binary searched. Build labels are ignored, just like when comparing \
+    Version objects.
+
+    Args:
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
+
+    Raises:
+        ParseException: If the version string is invalid
+
+    Returns:
+        bytes: The sort key
+    """
+
+    if isinstance(version, str):
+        parsed = FULL_RE.match(version)
+        if not parsed:
+            raise ParseException(EXC_INVALID_STR.format("semantic version", version))
+
+        major, minor, patch, pre, _ = parsed.groups()
+        return _make_key(major, minor, patch, pre)
+
+    return _make_key(
+        str(version.major), str(version.minor), str(version.patch), version.pre
+    )
+
+
+def _make_key(major: str, minor: str, patch: str, pre: t.Optional[str]) -> bytes:
+    """Sort key from the digit strings of the version core and the pre-release"""
+
+    key = _num_key(major) + _num_key(minor) + _num_key(patch)
+    if pre is None:
+        return key + _KEY_RELEASE
+
+    parts = [key, _KEY_PRE]
+    for ident in pre.split("."):
+        if ident.isdigit():
+            parts.append(_KEY_NUM + _num_key(ident))
+        else:
+            # identifiers only contain [0-9a-zA-Z-], which are all greater than
+            # the terminator, so a shorter identifier sorts before a longer one
+            parts.append(_KEY_ALNUM + ident.encode("utf-8") + _KEY_END)
+    parts.append(_KEY_END)
+
+    return b"".join(parts)
+
+
+def _num_key(digits: str) -> bytes:
+    """Length-prefixed digits (numbers never have leading zeros, so a longer \
+    number is always a bigger number)
+    """
+
+    if not digits.isascii():
+        # the regex digit class also accepts non-ASCII digits
+        digits = str(int(digits))
+
+    length = len(digits)
+    if length < 0xFF:
+        return bytes((length,)) + digits.encode("ascii")
+
+    # very long numbers get an escape byte and a 4-byte length
+    return b"\xff" + length.to_bytes(4, "big") + digits.encode("ascii")
+
+
+def pack(major: int, minor: int, patch: int, has_pre: bool) -> t.Optional[int]:
+    """Packs a version core and whether it has a pre-release into one int
+
+    The packed key is ``major << 41 | minor << 21 | patch << 1 | release``, \
+    where ``release`` is 1 if there is no pre-release label. This fits in an \
+    unsigned 64-bit int, so comparing, hashing, and sorting packed keys is \
+    done on machine ints (NumPy can view an ``array('Q')`` of them as uint64).
+
+    Packed keys compare like the versions they were made from, except that \
+    pre-releases with the same version core have the same packed key. They \
+    are exact for versions without pre-release labels.
+
+    Args:
+        major (int): Major version number
+        minor (int): Minor version number
+        patch (int): Patch version number
+        has_pre (bool): If the version has a pre-release label
+
+    Returns:
+        Optional[int]: The packed key, or None if a version number is \
+        bigger than PACK_MAX
+    """
+
+    if major > PACK_MAX or minor > PACK_MAX or patch > PACK_MAX:
+        return None
+
+    return (
+        major << (2 * PACK_BITS + 1)
+        | minor << (PACK_BITS + 1)
+        | patch << 1
+        | (not has_pre)
+    )
+
+
+def unpack(key: int) -> t.Tuple[int, int, int, bool]:
+    """Unpacks a packed key
+
+    Args:
+        key (int): A key made by pack()
+
+    Returns:
+        Tuple[int, int, int, bool]: major, minor, patch, and if the version \
+        has a pre-release label
+    """
+
+    return (
+        key >> (2 * PACK_BITS + 1) & PACK_MAX,
+        key >> (PACK_BITS + 1) & PACK_MAX,
+        key >> 1 & PACK_MAX,
+        not key & 1,
+    )
@@ -1,42 +1,60 @@
 """
-Version operations on string objects
+Version operations on strings and Version objects
+
+Functions that take a version accept a version string or a Version (or \
+FrozenVersion) object. Functions that return a version return the same \
+kind of value they were given, and never change a Version that is passed \
+in. Passing Version objects through a chain of operations means the \
+version is only parsed and rendered once.
 """
 
-import re
 import typing as t
 
-from .constants import EXC_INVALID_POS, EXC_PRE_NO_VALUE_2, RE_FULL, VPos, VRm
-from .exc import InvalidPositionException, NoValueException
-from .version import Version, parse_version
+from .constants import (
+    EXC_INVALID_POS,
+    EXC_INVALID_STR,
+    EXC_PRE_NO_VALUE_2,
+    VPos,
+    VRm,
+)
+from .exc import InvalidPositionException, NoValueException, ParseException
+from .spans import BUILD, CLEAN_RE, FULL_RE, MAJOR, MINOR, PATCH, PRE, splice
+from .spans import compare as _compare_str
+from .version import FrozenVersion, Version, _from_groups, parse_version
+
+# a version string or Version object (the same type is returned)
+_V = t.TypeVar("_V", str, Version)
 
 
-def add(version: str, *operations: t.Union[VPos, str]) -> str:
-    """The Version + operator on a string representing a version
+def add(version: _V, *operations: t.Union[VPos, str]) -> _V:
+    """The Version + operator on a version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
         *operations (Union[VPos, str]): Operations to perform on \
-        the version string; should be the same as the rhs of the + \
+        the version; should be the same as the rhs of the + \
         operator
 
     Returns:
-        str: The version string after adding args from operations args
+        Union[str, Version]: The version after adding args from operations \
+        args (same type as version)
     """
 
-    v = parse_version(version)
+    v = _load(version)
     for operation in operations:
         v + operation
 
-    return str(v)
+    return _dump(v, version)
 
 
-def bump(version: str, pos: VPos, amt: int = 1, carry: bool = True) -> str:
+def bump(version: _V, pos: VPos, amt: int = 1, carry: bool = True) -> _V:
     """Bumps version position given in pos by amt
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
-        pos (VPos): The position (MAJOR, MINOR, PATCH, PRE) to bump (Note that bumping \
-        PRE is more ineffecient.)
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
+        pos (VPos): The position (MAJOR, MINOR, PATCH, PRE) to bump
         amt (int, optional): The amount to bump the position by. Defaults to 1.
         carry (bool, optional): If bumping the position should reset the positions \
         to the right of it (setting minor or patch version to 0, removing pre-release \
@@ -44,19 +62,19 @@ def bump(version: str, pos: VPos, amt: int = 1, carry: bool = True) -> str:
         carry is False. Defaults to True.
 
     Returns:
-        str: A string representing the bumped version
+        Union[str, Version]: The bumped version (same type as version)
     """
 
-    ret = parse_version(version)
+    ret = _load(version)
 
     if pos == VPos.PRE:
         if not ret.has_pre:
             raise NoValueException(EXC_PRE_NO_VALUE_2.format(repr(ret)))
 
-        for _ in range(amt):
-            ret.inc(VPos.PRE)
+        if amt > 0:
+            ret.inc(VPos.PRE, amt)
 
-        return str(ret)
+        return _dump(ret, version)
 
     # order of positions
     order = (VPos.MAJOR, VPos.MINOR, VPos.PATCH, VPos.PRE)
@@ -72,7 +90,7 @@ def bump(version: str, pos: VPos, amt: int = 1, carry: bool = True) -> str:
         raise InvalidPositionException(EXC_INVALID_POS.format(pos))
 
     if not carry:
-        return str(ret)
+        return _dump(ret, version)
 
     # reset positions to right if carry is True
     ind = order.index(pos)
@@ -84,7 +102,7 @@ def bump(version: str, pos: VPos, amt: int = 1, carry: bool = True) -> str:
         else:
             ret.pre = None
 
-    return str(ret)
+    return _dump(ret, version)
 
 
 def clean(version: str) -> str:
@@ -102,9 +120,7 @@ def clean(version: str) -> str:
         str: Cleaned up version string
     """
 
-    version = version.strip()
-    version = re.sub(r"^[v=]+", r"", version)
-    return version
+    return version.strip().lstrip("v=")
 
 
 def clean_and_parse(version: str) -> Version:
@@ -119,27 +135,39 @@ def clean_and_parse(version: str) -> Version:
         Version: parsed Version object of cleaned up string (if it is valid)
     """
 
-    string = clean(version)
-    return parse_version(string)
+    if type(version) is not str:
+        return parse_version(clean(version))
+
+    # cleans and matches in one pass
+    parsed = CLEAN_RE.match(version)
+    if not parsed:
+        raise ParseException(EXC_INVALID_STR.format("semantic version", clean(version)))
 
+    return _from_groups(parsed.groups()[1:], parsed.group(1))
 
-def compare(lhs: str, rhs: str) -> int:
-    """Compares lhs are rhs version strings
+
+def compare(lhs: t.Union[str, Version], rhs: t.Union[str, Version]) -> int:
+    """Compares lhs are rhs versions
 
     * If lhs == rhs (in terms of versioning), returns 0
     * If lhs < rhs (in terms of versioning), returns -1
     * If lhs > rhs (in terms of versioning), returns 1
 
     Args:
-        lhs (str): A version string; must not include 'v' in beginning
-        rhs (str): A version string; must not include 'v' in beginning
+        lhs (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
+        rhs (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
 
     Returns:
         int: The result of the comparison
     """
 
-    vlhs = parse_version(lhs)
-    vrhs = parse_version(rhs)
+    if type(lhs) is str and type(rhs) is str:
+        return _compare_str(lhs, rhs)
+
+    vlhs = _peek(lhs)
+    vrhs = _peek(rhs)
 
     if vlhs == vrhs:
         return 0
@@ -149,194 +177,237 @@ def compare(lhs: str, rhs: str) -> int:
         return 1
 
 
-def get_build(version: str) -> t.Optional[str]:
-    """Gets the build label from the version string
+def get_build(version: t.Union[str, Version]) -> t.Optional[str]:
+    """Gets the build label from the version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
 
     Returns:
         t.Optional[str]: The build label, or None if it does not have one
     """
 
-    v = parse_version(version)
+    v = _peek(version)
     return v.build
 
 
-def get_major(version: str) -> int:
-    """Gets the major version number from the version string
+def get_major(version: t.Union[str, Version]) -> int:
+    """Gets the major version number from the version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
 
     Returns:
         int: The major version number
     """
 
-    v = parse_version(version)
+    v = _peek(version)
     return v.major
 
 
-def get_minor(version: str) -> int:
-    """Gets the minor version number from the version string
+def get_minor(version: t.Union[str, Version]) -> int:
+    """Gets the minor version number from the version
 
     Args:
-        version(str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
 
     Returns:
         int: The minor version number
     """
 
-    v = parse_version(version)
+    v = _peek(version)
     return v.minor
 
 
-def get_patch(version: str) -> int:
-    """Gets the patch version number from the version string
+def get_patch(version: t.Union[str, Version]) -> int:
+    """Gets the patch version number from the version
 
     Args:
-        version(str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
 
     Returns:
         int: The patch version number
     """
 
-    v = parse_version(version)
+    v = _peek(version)
     return v.patch
 
 
-def get_pre(version: str) -> t.Optional[str]:
-    """Gets the pre-release label from the version string
+def get_pre(version: t.Union[str, Version]) -> t.Optional[str]:
+    """Gets the pre-release label from the version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
 
     Returns:
         t.Optional[str]: The pre-release label, or None if it does not have one
     """
 
-    v = parse_version(version)
+    v = _peek(version)
     return v.pre
 
 
-def get_pre_digit(version: str) -> t.Optional[int]:
+def get_pre_digit(version: t.Union[str, Version]) -> t.Optional[int]:
     """Gets the number in the rightmost dot-separated identifier in the pre-release
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
 
     Returns:
         t.Optional[str]: The pre-release digit, or None if it does not have one
     """
 
-    v = parse_version(version)
+    v = _peek(version)
     return v.pre_digit
 
 
-def set_build(version: str, build: str) -> str:
-    """Sets the build label in the version string
+def set_build(version: _V, build: str) -> _V:
+    """Sets the build label in the version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
         build (str): The build label to set in the string \
                 (must not include '+' in beginning)
 
     Returns:
-        str: The string with the build label set
+        Union[str, Version]: The version with the build label set (same type \
+        as version)
     """
 
-    v = parse_version(version)
+    if type(version) is str and (build is None or type(build) is str):
+        spliced = splice(version, BUILD, build)
+        if spliced is not None:
+            return spliced
+
+    v = _load(version)
     v.build = build
-    return str(v)
+    return _dump(v, version)
 
 
-def set_major(version: str, major: int) -> str:
-    """Sets the major version in the version string
+def set_major(version: _V, major: int) -> _V:
+    """Sets the major version in the version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
         major (int): The major version to set
 
     Returns:
-        str: The version string with the new major version
+        Union[str, Version]: The version with the new major version (same type \
+        as version)
     """
 
-    v = parse_version(version)
+    if type(version) is str and type(major) is int and major >= 0:
+        spliced = splice(version, MAJOR, str(major))
+        if spliced is not None:
+            return spliced
+
+    v = _load(version)
     v.major = major
-    return str(v)
+    return _dump(v, version)
 
 
-def set_minor(version: str, minor: int) -> str:
-    """Sets the minor version in the version string
+def set_minor(version: _V, minor: int) -> _V:
+    """Sets the minor version in the version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
         minor (int): The minor version to set
 
     Returns:
-        str: The version string with the new minor version
+        Union[str, Version]: The version with the new minor version (same type \
+        as version)
     """
 
-    v = parse_version(version)
+    if type(version) is str and type(minor) is int and minor >= 0:
+        spliced = splice(version, MINOR, str(minor))
+        if spliced is not None:
+            return spliced
+
+    v = _load(version)
     v.minor = minor
-    return str(v)
+    return _dump(v, version)
 
 
-def set_patch(version: str, patch: int) -> str:
-    """Sets the patch version in the version string
+def set_patch(version: _V, patch: int) -> _V:
+    """Sets the patch version in the version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
         patch (int): The patch version to set
 
     Returns:
-        str: The version string with the new patch version
+        Union[str, Version]: The version with the new patch version (same type \
+        as version)
     """
 
-    v = parse_version(version)
+    if type(version) is str and type(patch) is int and patch >= 0:
+        spliced = splice(version, PATCH, str(patch))
+        if spliced is not None:
+            return spliced
+
+    v = _load(version)
     v.patch = patch
-    return str(v)
+    return _dump(v, version)
 
 
-def set_pre(version: str, pre: str) -> str:
-    """Sets the pre-release label in the version string
+def set_pre(version: _V, pre: str) -> _V:
+    """Sets the pre-release label in the version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
         pre (str): The pre-release label to set in the string \
                 (must not include '-' in beginning)
 
     Returns:
-        str: The string with the pre-release label set
+        Union[str, Version]: The version with the pre-release label set (same \
+        type as version)
     """
 
-    v = parse_version(version)
+    if type(version) is str and (pre is None or type(pre) is str):
+        spliced = splice(version, PRE, pre)
+        if spliced is not None:
+            return spliced
+
+    v = _load(version)
     v.pre = pre
-    return str(v)
+    return _dump(v, version)
 
 
-def sub(version: str, *operations: t.Union[VPos, VRm]) -> str:
-    """The Version - operator on a string representing a version
+def sub(version: _V, *operations: t.Union[VPos, VRm]) -> _V:
+    """The Version - operator on a version
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
         *operations (Union[VPos, str]): Operations to perform on \
-        the version string; should be the same as the rhs of the - \
+        the version; should be the same as the rhs of the - \
         operator
 
     Returns:
-        str: The version string after subtracting args from operations args
+        Union[str, Version]: The version after subtracting args from operations \
+        args (same type as version)
     """
 
-    v = parse_version(version)
+    v = _load(version)
     for operation in operations:
         v - operation
 
-    return str(v)
+    return _dump(v, version)
 
 
-def update(version: str, *operations: t.Union[VPos, VRm, str]) -> str:
-    """Performs a series of operations on given version string
+def update(version: _V, *operations: t.Union[VPos, VRm, str]) -> _V:
+    """Performs a series of operations on given version
 
     Allowed operations are:
 
@@ -348,17 +419,19 @@ def update(version: str, *operations: t.Union[VPos, VRm, str]) -> str:
     Decrementing a release number is not supported.
 
     Args:
-        version (str): A version string; must not include 'v' in beginning
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
         *operations(Union[VPos, VRm, str]): The series of operations to perform on \
-        the version string, from left to right. If VPos or str, should be equivalent \
+        the version, from left to right. If VPos or str, should be equivalent \
         to the rhs of the + operator. If VRm, should be equivalent to the rhs of the \
         - operator.
 
     Returns:
-        str: The version string after performing the operations
+        Union[str, Version]: The version after performing the operations (same \
+        type as version)
     """
 
-    v = parse_version(version)
+    v = _load(version)
     for operation in operations:
         if isinstance(operation, (VPos, str)):
             # bumping or adding string; use + operator
@@ -367,7 +440,7 @@ def update(version: str, *operations: t.Union[VPos, VRm, str]) -> str:
             # VRm; use - operator
             v - operation
 
-    return str(v)
+    return _dump(v, version)
 
 
 def valid(version: str) -> bool:
@@ -383,6 +456,41 @@ def valid(version: str) -> bool:
     if not isinstance(version, str):
         return False
 
-    parsed = re.match(RE_FULL, version)
+    return FULL_RE.match(version) is not None
+
+
+def _peek(version: t.Union[str, Version]) -> Version:
+    """Version to read from (not copied, so must not be changed)"""
+
+    if type(version) is str or not isinstance(version, Version):
+        return parse_version(version)
+
+    return version
+
+
+def _load(version: t.Union[str, Version]) -> Version:
+    """Version to change (a copy if version is already a Version object)"""
+
+    if type(version) is str or not isinstance(version, Version):
+        return parse_version(version)
+
+    return version.copy()
+
+
+@t.overload
+def _dump(v: Version, like: str) -> str: ...
+
+
+@t.overload
+def _dump(v: Version, like: Version) -> Version: ...
+
+
+def _dump(v: Version, like: t.Union[str, Version]) -> t.Union[str, Version]:
+    """Converts v to the same kind of value as like"""
+
+    if type(like) is str or not isinstance(like, Version):
+        return str(v)
+    elif isinstance(like, FrozenVersion):
+        return v.freeze()
 
-    return parsed is not None
+    return v
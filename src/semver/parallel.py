@@ -0,0 +1,310 @@
+"""
+Parsing and sorting very many versions in worker processes
+
+The input is split into shards, and each shard is handled by a process in a \
+``concurrent.futures.ProcessPoolExecutor``. Workers send back plain columns \
+(lists of ints and strings) or sort keys instead of Version objects, since \
+those are much cheaper to pickle:
+
+.. code-block:: py
+
+    from semver import parallel
+
+    if __name__ == "__main__":
+        versions = parallel.parse_array(tags, workers=8)
+        ordered = parallel.sort_versions(tags, workers=8)
+
+As with any process pool, code that starts workers should be guarded by \
+``if __name__ == "__main__":`` on platforms that spawn processes.
+
+This module is not imported by ``semver`` itself.
+"""
+
+import concurrent.futures
+import heapq
+import os
+import typing as t
+
+from . import bulk
+from .bulk import VersionArray, _check_errors
+from .constants import EXC_BAD_ERRORS_ARRAY, EXC_INVALID_STR
+from .exc import ParseException
+from .keys import sort_key
+from .spans import FULL_RE
+from .version import Version, _from_groups
+
+# shards made per worker, so that workers that finish early get more work
+SHARDS_PER_WORKER = 4
+
+# fewer strings than this are handled in the calling process
+MIN_PARALLEL = 10000
+
+# (major, minor, patch, pre, build) columns of the valid strings of a shard,
+# and the indices (in all strings) of invalid strings
+_Columns = t.Tuple[
+    t.List[int],
+    t.List[int],
+    t.List[int],
+    t.List[t.Optional[str]],
+    t.List[t.Optional[str]],
+    t.List[int],
+]
+
+
+def parse_many(
+    versions: t.Iterable[str],
+    errors: str = "strict",
+    workers: t.Optional[int] = None,
+    executor: t.Optional[concurrent.futures.Executor] = None,
+) -> t.List[t.Optional[Version]]:
+    """Parses many version strings in worker processes (see bulk.parse_many())
+
+    Args:
+        versions (Iterable[str]): Version strings; must not include 'v' \
+        in beginning
+        errors (str, optional): What to do with invalid strings: 'strict' \
+        raises ParseException, 'skip' leaves them out, and 'none' puts None \
+        in their place. Defaults to 'strict'.
+        workers (Optional[int], optional): Number of worker processes. \
+        Defaults to the number of CPUs.
+        executor (Optional[Executor], optional): Executor to run the shards \
+        in (workers is then only used to size the shards). Defaults to a new \
+        ProcessPoolExecutor.
+
+    Raises:
+        ValueError: If errors is not a known error policy
+        ParseException: If errors is 'strict' and any string is invalid
+
+    Returns:
+        List[Optional[Version]]: The parsed versions, in input order
+    """
+
+    _check_errors(errors)
+    strings = list(versions)
+    if _in_process(strings, workers, executor):
+        return bulk.parse_many(strings, errors)
+
+    ret: t.List[t.Optional[Version]] = []
+    for start, columns in _run(strings, errors, workers, executor):
+        major, minor, patch, pre, build, bad = columns
+        valid = zip(major, minor, patch, pre, build)
+        invalid = set(bad)
+
+        # the columns only have the valid strings, so bad says where the
+        # invalid ones were
+        for index in range(start, start + len(major) + len(bad)):
+            if index not in invalid:
+                ret.append(_from_parts(next(valid), strings[index]))
+            elif errors == "none":
+                ret.append(None)
+
+    return ret
+
+
+def parse_array(
+    versions: t.Iterable[str],
+    errors: str = "strict",
+    workers: t.Optional[int] = None,
+    executor: t.Optional[concurrent.futures.Executor] = None,
+) -> VersionArray:
+    """Parses many version strings in worker processes into a VersionArray
+
+    The columns sent back by the workers are added to the array as they are, \
+    so no Version objects are made.
+
+    Args:
+        versions (Iterable[str]): Version strings; must not include 'v' \
+        in beginning
+        errors (str, optional): What to do with invalid strings: 'strict' \
+        raises ParseException, and 'skip' leaves them out. Defaults to 'strict'.
+        workers (Optional[int], optional): Number of worker processes. \
+        Defaults to the number of CPUs.
+        executor (Optional[Executor], optional): Executor to run the shards \
+        in (workers is then only used to size the shards). Defaults to a new \
+        ProcessPoolExecutor.
+
+    Raises:
+        ValueError: If errors is not 'strict' or 'skip'
+        ParseException: If errors is 'strict' and any string is invalid
+
+    Returns:
+        VersionArray: The parsed versions, in input order
+    """
+
+    _check_errors(errors)
+    if errors == "none":
+        raise ValueError(EXC_BAD_ERRORS_ARRAY.format(repr(errors)))
+
+    ret = VersionArray()
+    columns_out = (ret._major, ret._minor, ret._patch, ret._pre, ret._build)
+
+    for _, columns in _run(list(versions), errors, workers, executor):
+        # invalid strings were already left out by the worker
+        for column_out, column in zip(columns_out, columns):
+            column_out.extend(column)  # type: ignore[attr-defined]
+
+    return ret
+
+
+def sort_versions(
+    versions: t.Iterable[str],
+    workers: t.Optional[int] = None,
+    executor: t.Optional[concurrent.futures.Executor] = None,
+) -> t.List[str]:
+    """Sorts many version strings by precedence in worker processes
+
+    Each worker sorts one shard by sort key (see semver.keys.sort_key()), \
+    and the sorted shards are merged with a k-way merge. The sort is stable.
+
+    Args:
+        versions (Iterable[str]): Version strings; must not include 'v' \
+        in beginning
+        workers (Optional[int], optional): Number of worker processes. \
+        Defaults to the number of CPUs.
+        executor (Optional[Executor], optional): Executor to run the shards \
+        in (workers is then only used to size the shards). Defaults to a new \
+        ProcessPoolExecutor.
+
+    Raises:
+        ParseException: If any string is invalid
+
+    Returns:
+        List[str]: The version strings in ascending order
+    """
+
+    strings = list(versions)
+    if _in_process(strings, workers, executor):
+        return sorted(strings, key=sort_key)
+
+    shards = [result for _, result in _map(_sort_shard, strings, (), workers, executor)]
+
+    # (key, index) pairs are unique, so ties keep their input order
+    return [strings[i] for _, i in heapq.merge(*shards)]
+
+
+def _run(
+    strings: t.List[str],
+    errors: str,
+    workers: t.Optional[int],
+    executor: t.Optional[concurrent.futures.Executor],
+) -> t.Iterator[t.Tuple[int, _Columns]]:
+    """Parses shards of strings; yields (start of shard, columns) in order"""
+
+    return _map(_parse_shard, strings, (errors,), workers, executor)
+
+
+def _in_process(
+    strings: t.List[str],
+    workers: t.Optional[int],
+    executor: t.Optional[concurrent.futures.Executor],
+) -> bool:
+    """If strings should be handled in the calling process"""
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # starting processes and pickling shards costs more than it saves
+    return executor is None and (workers == 1 or len(strings) < MIN_PARALLEL)
+
+
+def _map(
+    func: t.Callable[..., t.Any],
+    strings: t.List[str],
+    args: t.Tuple[t.Any, ...],
+    workers: t.Optional[int],
+    executor: t.Optional[concurrent.futures.Executor],
+) -> t.Iterator[t.Tuple[int, t.Any]]:
+    """Calls func(shard, start, *args) on each shard of strings in executor; \
+    yields (start, result) in shard order
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    count = max(1, workers * SHARDS_PER_WORKER)
+    size = max(1, -(-len(strings) // count))
+    starts = range(0, len(strings), size)
+
+    if executor is not None:
+        yield from _submit(executor, func, strings, starts, size, args)
+    elif _in_process(strings, workers, executor):
+        yield 0, func(strings, 0, *args)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from _submit(pool, func, strings, starts, size, args)
+
+
+def _submit(
+    executor: concurrent.futures.Executor,
+    func: t.Callable[..., t.Any],
+    strings: t.List[str],
+    starts: t.Iterable[int],
+    size: int,
+    args: t.Tuple[t.Any, ...],
+) -> t.Iterator[t.Tuple[int, t.Any]]:
+    """Submits every shard first, so that all workers are busy; cancels the \
+    rest if a shard fails
+    """
+
+    futures = [
+        (start, executor.submit(func, strings[start : start + size], start, *args))
+        for start in starts
+    ]
+
+    try:
+        for start, future in futures:
+            yield start, future.result()
+    finally:
+        for _, future in futures:
+            future.cancel()
+
+
+def _parse_shard(strings: t.List[str], start: int, errors: str) -> _Columns:
+    """Worker: matches each string and returns the columns (bad holds indices \
+    in all strings)
+    """
+
+    major: t.List[int] = []
+    minor: t.List[int] = []
+    patch: t.List[int] = []
+    pre: t.List[t.Optional[str]] = []
+    build: t.List[t.Optional[str]] = []
+    bad: t.List[int] = []
+
+    match = FULL_RE.match
+    for i, string in enumerate(strings):
+        parsed = match(string)
+        if not parsed:
+            if errors == "strict":
+                raise ParseException(EXC_INVALID_STR.format("semantic version", string))
+            bad.append(start + i)
+            continue
+
+        smajor, sminor, spatch, spre, sbuild = parsed.groups()
+        major.append(int(smajor))
+        minor.append(int(sminor))
+        patch.append(int(spatch))
+        pre.append(spre)
+        build.append(sbuild)
+
+    return major, minor, patch, pre, build, bad
+
+
+def _sort_shard(strings: t.List[str], start: int) -> t.List[t.Tuple[bytes, int]]:
+    """Worker: sorted (sort key, index in all strings) pairs of a shard"""
+
+    return sorted((sort_key(string), start + i) for i, string in enumerate(strings))
+
+
+def _from_parts(
+    parts: t.Tuple[int, int, int, t.Optional[str], t.Optional[str]], string: str
+) -> Version:
+    """Version from components sent back by a worker"""
+
+    major, minor, patch, pre, build = parts
+
+    # RE_FULL allows a trailing newline, which is not rendered
+    return _from_groups(
+        (str(major), str(minor), str(patch), pre, build),
+        None if string[-1:] == "\n" else string,
+    )
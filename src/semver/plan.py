@@ -0,0 +1,331 @@
+"""
+Precompiled update() plans
+
+Applying the same update() operations to many versions repeats the same \
+type checks and bumps for every version. compile_update() checks the \
+operations once and folds them into a plan that changes each version \
+in a single step:
+
+.. code-block:: py
+
+    from semver import compile_update, VPos, VRm
+
+    plan = compile_update(VPos.MINOR, VRm.PRE, "+build.5")
+    plan("2.4.1-rc.1")  # '2.5.0+build.5'
+"""
+
+import typing as t
+
+from .bulk import VersionArray
+from .components import Build, Pre
+from .constants import (
+    EXC_BAD_TYPE,
+    EXC_INVALID_STR,
+    EXC_INVALID_STR_2,
+    VPos,
+    VRm,
+)
+from .exc import InvalidOperationException, ParseException
+from .operations import update
+from .spans import FULL_RE
+from .version import Version
+
+_V = t.TypeVar("_V", str, Version, VersionArray)
+
+# index of each version position in the version core
+_CORE_INDEX = {VPos.MAJOR: 0, VPos.MINOR: 1, VPos.PATCH: 2}
+
+# what happens to a label: "keep" the label of the version (after bumping its
+# digit a number of times, for pre-releases), "set" it to a new label, or
+# remove it ("none")
+_KEEP = "keep"
+_SET = "set"
+_NONE = "none"
+
+# (major, minor, patch, pre, build)
+_Parts = t.Tuple[int, int, int, t.Optional[str], t.Optional[str]]
+
+
+class UpdatePlan:
+    """A checked and folded series of update() operations
+
+    Calling the plan on a version does the same thing as calling update() \
+    with the operations, but the whole series is applied in one step. \
+    Consecutive bumps collapse into one, and a label that is added then \
+    removed is never made.
+
+    Plans can be called on version strings, Version objects, and \
+    VersionArray objects, and return the same kind of value.
+    """
+
+    def __init__(self, *operations: t.Union[VPos, VRm, str]) -> None:
+        """Constructor
+
+        Args:
+            *operations (Union[VPos, VRm, str]): The operations, same as in update()
+
+        Raises:
+            TypeError: If an operation is not a VPos, VRm, or str
+            InvalidOperationException: If a string operation does not start with \
+            '-' or '+'
+            ParseException: If a pre-release or build label is invalid
+        """
+
+        self._operations = operations
+
+        # (True, n) sets the number to n; (False, n) adds n to the number
+        self._core: t.List[t.Tuple[bool, int]] = [(False, 0)] * 3
+
+        # (_KEEP, number of digit bumps), (_SET, label), or (_NONE, None)
+        self._pre: t.Tuple[str, t.Any] = (_KEEP, 0)
+        self._build: t.Tuple[str, t.Any] = (_KEEP, None)
+
+        # what the version must have for the folded plan to be used; if
+        # anything is missing, the operations are done one by one so that
+        # the same exception as update() is raised
+        self._need_pre: t.Optional[bool] = None
+        self._need_digit = False
+        self._need_build: t.Optional[bool] = None
+
+        # set if the operations always fail, so they are done one by one
+        self._fails = False
+
+        for operation in operations:
+            self._fold(operation)
+
+    def __repr__(self) -> str:
+        """repr of UpdatePlan"""
+
+        return "UpdatePlan(operations={})".format(self._operations)
+
+    def __call__(self, version: _V) -> _V:
+        """Applies the plan to a version
+
+        Args:
+            version (Union[str, Version, VersionArray]): A version string (must \
+            not include 'v' in beginning), a Version object, or a VersionArray
+
+        Returns:
+            Union[str, Version, VersionArray]: The updated version(s) (same type \
+            as version). Version objects that are passed in are not changed.
+        """
+
+        if type(version) is str:
+            return self._apply_str(version)
+        elif isinstance(version, VersionArray):
+            return self._apply_array(version)
+        elif isinstance(version, Version):
+            return self._apply_version(version)
+
+        # str subclasses and anything else
+        return self._apply_str(version)
+
+    @property
+    def operations(self) -> t.Tuple[t.Union[VPos, VRm, str], ...]:
+        """The operations the plan was compiled from"""
+
+        return self._operations
+
+    def _fold(self, operation: t.Union[VPos, VRm, str]) -> None:
+        """Folds an operation into the plan"""
+
+        if isinstance(operation, VPos):
+            if operation == VPos.PRE:
+                self._fold_pre_bump()
+                return
+
+            ind = _CORE_INDEX[operation]
+            fixed, num = self._core[ind]
+            self._core[ind] = (fixed, num + 1)
+            for i in range(ind + 1, 3):
+                self._core[i] = (True, 0)
+        elif isinstance(operation, VRm):
+            if operation == VRm.PRE:
+                kind, _ = self._pre
+                if kind == _NONE:
+                    self._fails = True
+                elif kind == _KEEP:
+                    self._need_pre = True
+                self._pre = (_NONE, None)
+            else:
+                kind, _ = self._build
+                if kind == _NONE:
+                    self._fails = True
+                elif kind == _KEEP:
+                    self._need_build = True
+                self._build = (_NONE, None)
+        elif isinstance(operation, str):
+            if operation[:1] == "-":
+                label = Pre(operation[1:])
+                kind, bumps = self._pre
+                if kind == _SET or (kind == _KEEP and bumps > 0):
+                    self._fails = True
+                elif kind == _KEEP:
+                    self._need_pre = False
+                self._pre = (_SET, label)
+            elif operation[:1] == "+":
+                build = Build(operation[1:])
+                kind, _ = self._build
+                if kind == _SET:
+                    self._fails = True
+                elif kind == _KEEP:
+                    self._need_build = False
+                self._build = (_SET, build)
+            else:
+                raise InvalidOperationException(
+                    EXC_INVALID_STR_2.format("add", operation)
+                )
+        else:
+            raise TypeError(EXC_BAD_TYPE.format("+", type(operation)))
+
+    def _fold_pre_bump(self) -> None:
+        """Folds a pre-release bump into the plan"""
+
+        kind, value = self._pre
+        if kind == _KEEP:
+            self._need_pre = True
+            self._need_digit = True
+            self._pre = (_KEEP, value + 1)
+        elif kind == _SET and value.digit is not None:
+            label = value._copy()
+            label.inc()
+            self._pre = (_SET, label)
+        else:
+            self._fails = True
+
+    def _apply_parts(
+        self,
+        major: int,
+        minor: int,
+        patch: int,
+        pre: t.Optional[str],
+        build: t.Optional[str],
+    ) -> t.Optional[_Parts]:
+        """Applies the plan to version components, or returns None if the \
+        version does not have what the plan needs
+        """
+
+        if self._fails:
+            return None
+        if self._need_pre is not None and self._need_pre != (pre is not None):
+            return None
+        if self._need_build is not None and self._need_build != (build is not None):
+            return None
+        if self._need_digit and not (pre or "").rpartition(".")[2].isdigit():
+            return None
+
+        nums = [major, minor, patch]
+        for i, (fixed, num) in enumerate(self._core):
+            nums[i] = num if fixed else nums[i] + num
+
+        kind, value = self._pre
+        if kind == _SET:
+            pre = value.string
+        elif kind == _NONE:
+            pre = None
+        elif value and pre is not None:
+            # bump the digit of the version's own pre-release label
+            prefix, _, digit = pre.rpartition(".")
+            pre = "{}{}{}".format(prefix, "." if prefix else "", int(digit) + value)
+
+        kind, value = self._build
+        if kind == _SET:
+            build = value.string
+        elif kind == _NONE:
+            build = None
+
+        return nums[0], nums[1], nums[2], pre, build
+
+    def _apply_str(self, version: str) -> str:
+        parsed = FULL_RE.match(version)
+        if not parsed:
+            raise ParseException(EXC_INVALID_STR.format("semantic version", version))
+
+        major, minor, patch, pre, build = parsed.groups()
+        parts = self._apply_parts(int(major), int(minor), int(patch), pre, build)
+        if parts is None:
+            return update(version, *self._operations)
+
+        return _render(parts)
+
+    def _apply_version(self, version: Version) -> Version:
+        parts = self._apply_parts(
+            version.major, version.minor, version.patch, version.pre, version.build
+        )
+        if parts is None:
+            return update(version, *self._operations)
+
+        # the version is copied (keeping its class) and the labels are set
+        # directly, since they were already checked
+        ret = version._copy(type(version))
+        ret._core = list(parts[:3])
+
+        kind, value = self._pre
+        if kind == _SET:
+            ret._pre = value._copy()
+        elif kind == _NONE:
+            ret._pre = None
+        elif value:
+            assert ret._pre is not None, "pre-release was not checked"
+            ret._pre.inc(value)
+
+        kind, value = self._build
+        if kind == _SET:
+            ret._build = value
+        elif kind == _NONE:
+            ret._build = None
+
+        ret._str = None
+        return ret
+
+    def _apply_array(self, versions: VersionArray) -> VersionArray:
+        ret = VersionArray()
+
+        for i, parts in enumerate(
+            zip(
+                versions.major,
+                versions.minor,
+                versions.patch,
+                versions.pre,
+                versions.build,
+            )
+        ):
+            new_parts = self._apply_parts(*parts)
+            if new_parts is None:
+                ret.append(update(versions[i], *self._operations))
+            else:
+                ret._append(*new_parts)
+
+        return ret
+
+
+def compile_update(*operations: t.Union[VPos, VRm, str]) -> UpdatePlan:
+    """Checks and folds a series of update() operations into a plan that can \
+    be applied to many versions
+
+    Args:
+        *operations (Union[VPos, VRm, str]): The operations, same as in update()
+
+    Raises:
+        TypeError: If an operation is not a VPos, VRm, or str
+        InvalidOperationException: If a string operation does not start with \
+        '-' or '+'
+        ParseException: If a pre-release or build label is invalid
+
+    Returns:
+        UpdatePlan: The plan; call it on a version string, Version, or \
+        VersionArray
+    """
+
+    return UpdatePlan(*operations)
+
+
+def _render(parts: _Parts) -> str:
+    major, minor, patch, pre, build = parts
+    return "{}.{}.{}{}{}".format(
+        major,
+        minor,
+        patch,
+        "" if pre is None else "-" + pre,
+        "" if build is None else "+" + build,
+    )
@@ -0,0 +1,742 @@
+"""
+Version ranges
+
+A range is a set of comparators that a version can satisfy. The syntax is \
+the one used by npm:
+
+* Primitive comparators: ``<1.2.3``, ``<=1.2.3``, ``>1.2.3``, ``>=1.2.3``, \
+``=1.2.3`` (same as ``1.2.3``)
+* Partial versions and wildcards: ``1``, ``1.2``, ``1.x``, ``1.2.*``, ``*``
+* Caret and tilde ranges: ``^1.2.3``, ``~1.2``
+* Hyphen ranges: ``1.2.3 - 2.3``
+* Comparators separated by whitespace must all be satisfied, and \
+comparator sets separated by ``||`` are alternatives
+
+Versions are compared by precedence, so ``<2.0.0`` also includes \
+``2.0.0-rc.1``. Use ``<2.0.0-0`` to exclude all pre-releases of 2.0.0.
+
+Expressions used by satisfies() and the other functions that take range \
+expressions are compiled once and kept in range_cache (a RangeCache), so \
+expressions that recur are not parsed again. RangeIndex compiles its \
+ranges without the cache, so a large index does not push them out.
+
+Ranges can be combined with intersect(), union(), and complement(). These \
+work on the sorted, disjoint intervals of versions that a range allows, so \
+they take linear time in the number of intervals, and their results are \
+always simplified (see Range.simplify()).
+"""
+
+import collections
+import heapq
+import re
+import threading
+import typing as t
+
+from .constants import (
+    EXC_BAD_CACHE_SIZE,
+    EXC_INVALID_STR,
+    RE_COMPARATOR,
+    RE_PARTIAL,
+    RE_RANGE_OP,
+)
+from .exc import ParseException
+from .keys import sort_key
+from .version import FrozenVersion, Version, _from_parts
+
+# a primitive comparator: operator ("<", "<=", ">", ">=", "=") and (frozen) version
+Comparator = t.Tuple[str, Version]
+
+# the sort keys that a comparator set allows: lower key, if the lower key is
+# included, upper key, and if the upper key is included (None for no bound)
+KeyBounds = t.Tuple[t.Optional[bytes], bool, t.Optional[bytes], bool]
+
+# compiled ranges kept by a RangeCache by default
+RANGE_CACHE_SIZE = 1024
+
+# an end of an interval of versions: a version (without a build label) and
+# its sort key
+_Bound = t.Tuple[bytes, Version]
+
+# the versions from the first bound (inclusive, None for no lower bound) up
+# to the second bound (exclusive, None for no upper bound)
+_Interval = t.Tuple[t.Optional[_Bound], t.Optional[_Bound]]
+
+# the lowest version of all
+_LOWEST = FrozenVersion(0, 0, 0, "0")
+_LOWEST_KEY = sort_key(_LOWEST)
+
+# above every sort key (a sort key starts with at most five 0xff bytes,
+# followed by an ASCII digit)
+_KEY_MAX = b"\xff" * 6
+
+
+class Range:
+    """Represents a range of versions"""
+
+    def __init__(self, expression: str) -> None:
+        """Constructor
+
+        Args:
+            expression (str): The range expression
+
+        Raises:
+            ParseException: If the range expression is invalid
+        """
+
+        self._expression: t.Optional[str] = expression
+        self._sets: t.Optional[t.Tuple[t.Tuple[Comparator, ...], ...]] = _parse_range(
+            expression
+        )
+
+        # sort keys of the comparator versions, so testing a version only
+        # needs bytes comparisons
+        self._key_sets = tuple(
+            tuple((op, sort_key(v)) for op, v in comparators)
+            for comparators in self._sets
+        )
+
+        # made when first needed (see _intervals()); the results of the
+        # interval operations only have these, and make the expression and
+        # the sets from them when they are first needed (see _render())
+        self._canonical: t.Optional[t.List[_Interval]] = None
+
+    def __repr__(self) -> str:
+        """repr of Range"""
+
+        return "Range(expression='{}')".format(self.expression)
+
+    def __str__(self) -> str:
+        """Range in terms of primitive comparators"""
+
+        return " || ".join(
+            " ".join("{}{}".format(op, v) for op, v in comparators) or "*"
+            for comparators in self.sets
+        )
+
+    def __contains__(self, version: t.Union[str, Version]) -> bool:
+        """Same as test()"""
+
+        return self.test(version)
+
+    def test(self, version: t.Union[str, Version]) -> bool:
+        """If the version satisfies the range
+
+        Args:
+            version (Union[str, Version]): A version string (must not include 'v' \
+            in beginning) or a Version object
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            bool: If the version is in the range
+        """
+
+        key = sort_key(version)
+
+        for comparators in self._key_sets:
+            for op, bound in comparators:
+                if not _test_op(op, key, bound):
+                    break
+            else:
+                # every comparator in the set is satisfied
+                return True
+
+        return False
+
+    @property
+    def expression(self) -> str:
+        """The range expression that was parsed (or, for the results of \
+        intersect(), union(), complement(), and simplify(), the simplified \
+        expression)
+        """
+
+        if self._expression is None:
+            self._render()
+        assert self._expression is not None
+
+        return self._expression
+
+    @property
+    def sets(self) -> t.Tuple[t.Tuple[Comparator, ...], ...]:
+        """Alternative sets of primitive comparators. A version is in the range \
+        if it satisfies every comparator in any of the sets.
+        """
+
+        if self._sets is None:
+            self._render()
+        assert self._sets is not None
+
+        return self._sets
+
+    def intersect(self, other: t.Union[str, "Range"]) -> "Range":
+        """Range of the versions that satisfy both ranges
+
+        Args:
+            other (Union[str, Range]): A range expression or Range object
+
+        Raises:
+            ParseException: If the range expression is invalid
+
+        Returns:
+            Range: The simplified intersection
+        """
+
+        return _from_intervals(
+            _intersect(self._intervals(), _range(other)._intervals())
+        )
+
+    def union(self, other: t.Union[str, "Range"]) -> "Range":
+        """Range of the versions that satisfy either range
+
+        Args:
+            other (Union[str, Range]): A range expression or Range object
+
+        Raises:
+            ParseException: If the range expression is invalid
+
+        Returns:
+            Range: The simplified union
+        """
+
+        return _from_intervals(_union(self._intervals(), _range(other)._intervals()))
+
+    def complement(self) -> "Range":
+        """Range of the versions that do not satisfy the range
+
+        Returns:
+            Range: The simplified complement
+        """
+
+        return _from_intervals(_complement(self._intervals()))
+
+    def is_subset(self, other: t.Union[str, "Range"]) -> bool:
+        """If every version that satisfies the range also satisfies other
+
+        Args:
+            other (Union[str, Range]): A range expression or Range object
+
+        Raises:
+            ParseException: If the range expression is invalid
+
+        Returns:
+            bool: If the range is a subset of other
+        """
+
+        intervals = self._intervals()
+        return _keys(_intersect(intervals, _range(other)._intervals())) == _keys(
+            intervals
+        )
+
+    def simplify(self) -> "Range":
+        """Equivalent range with the fewest comparators
+
+        Overlapping and adjacent comparator sets are merged, and each set has \
+        at most a lower and an upper bound. Ranges that allow the same \
+        versions simplify to the same expression, for example \
+        ``^1.2 || ~1.5.1`` and ``>=1.2.0 <2.0.0-0`` both simplify to \
+        ``>=1.2.0 <2.0.0-0``, and a range that no version satisfies \
+        simplifies to ``<0.0.0-0``.
+
+        Returns:
+            Range: The simplified range
+        """
+
+        return _from_intervals(self._intervals())
+
+    def _intervals(self) -> t.List[_Interval]:
+        """Sorted, disjoint, and non-adjacent intervals of the versions in \
+        the range
+        """
+
+        if self._canonical is None:
+            intervals = [
+                interval
+                for interval in map(_interval, self.sets, self._key_sets)
+                if interval is not None
+            ]
+            if len(intervals) > 1:
+                intervals.sort(key=lambda interval: _start_key(interval[0]))
+                intervals = _union(intervals, [])
+            self._canonical = intervals
+
+        return self._canonical
+
+    def _render(self) -> None:
+        """Makes the comparators and the expression of the intervals"""
+
+        assert self._canonical is not None
+        self._sets = _comparators(self._canonical)
+        self._expression = " || ".join(
+            " ".join(str(v) if op == "=" else op + str(v) for op, v in comparators)
+            or "*"
+            for comparators in self._sets
+        )
+
+
+class CacheInfo(t.NamedTuple):
+    """Statistics of a RangeCache (like those of functools.lru_cache)"""
+
+    hits: int
+    misses: int
+    maxsize: t.Optional[int]
+    currsize: int
+
+
+class RangeCache:
+    """A thread-safe cache of compiled ranges, keyed by expression, that \
+    discards the least recently used range when it is full
+
+    Invalid expressions are not cached. Ranges are compiled without holding \
+    the lock, so threads that miss the same expression at the same time may \
+    each compile it.
+    """
+
+    def __init__(self, maxsize: t.Optional[int] = RANGE_CACHE_SIZE) -> None:
+        """Constructor
+
+        Args:
+            maxsize (Optional[int], optional): Most ranges to keep (0 keeps \
+            none, None keeps every range). Defaults to RANGE_CACHE_SIZE.
+
+        Raises:
+            ValueError: If maxsize is negative
+        """
+
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(EXC_BAD_CACHE_SIZE.format(maxsize))
+
+        self._maxsize = maxsize
+        self._ranges: "collections.OrderedDict[str, Range]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        """repr of RangeCache"""
+
+        return "RangeCache(maxsize={})".format(self._maxsize)
+
+    def __len__(self) -> int:
+        """Number of cached ranges"""
+
+        return len(self._ranges)
+
+    def get(self, expression: str) -> Range:
+        """The compiled range of an expression
+
+        Args:
+            expression (str): The range expression
+
+        Raises:
+            ParseException: If the range expression is invalid
+
+        Returns:
+            Range: The range (shared by every caller that asks for the same \
+            expression while it is cached)
+        """
+
+        with self._lock:
+            cached = self._ranges.get(expression)
+            if cached is not None:
+                self._ranges.move_to_end(expression)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        compiled = Range(expression)
+        if self._maxsize == 0:
+            return compiled
+
+        with self._lock:
+            self._ranges[expression] = compiled
+            if self._maxsize is not None and len(self._ranges) > self._maxsize:
+                self._ranges.popitem(last=False)
+
+        return compiled
+
+    def cache_info(self) -> CacheInfo:
+        """Hits, misses, maximum size, and current size of the cache
+
+        Returns:
+            CacheInfo: The statistics
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._ranges))
+
+    def cache_clear(self) -> None:
+        """Discards every cached range and resets the statistics"""
+
+        with self._lock:
+            self._ranges.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# the cache used for range expressions given to the functions of semver
+range_cache = RangeCache()
+
+
+def satisfies(version: t.Union[str, Version], expression: str) -> bool:
+    """If the version satisfies the range expression
+
+    Args:
+        version (Union[str, Version]): A version string (must not include 'v' \
+        in beginning) or a Version object
+        expression (str): The range expression
+
+    Raises:
+        ParseException: If the version string or range expression is invalid
+
+    Returns:
+        bool: If the version is in the range
+    """
+
+    return range_cache.get(expression).test(version)
+
+
+def _test_op(op: str, key: bytes, bound: bytes) -> bool:
+    """Tests a sort key against a comparator"""
+
+    if op == "<":
+        return key < bound
+    elif op == "<=":
+        return key <= bound
+    elif op == ">":
+        return key > bound
+    elif op == ">=":
+        return key >= bound
+    else:
+        return key == bound
+
+
+def _key_bounds(comparators: t.Iterable[t.Tuple[str, bytes]]) -> t.Optional[KeyBounds]:
+    """Narrowest bounds of a set of (operator, sort key) comparators, or None \
+    if no version satisfies all of them
+    """
+
+    low: t.Optional[bytes] = None
+    low_inclusive = True
+    high: t.Optional[bytes] = None
+    high_inclusive = True
+
+    for op, key in comparators:
+        if op in (">", ">=", "="):
+            inclusive = op != ">"
+            if low is None or key > low or (key == low and not inclusive):
+                low, low_inclusive = key, inclusive
+        if op in ("<", "<=", "="):
+            inclusive = op != "<"
+            if high is None or key < high or (key == high and not inclusive):
+                high, high_inclusive = key, inclusive
+
+    if low is not None and high is not None:
+        if low > high or (low == high and not (low_inclusive and high_inclusive)):
+            return None
+
+    return low, low_inclusive, high, high_inclusive
+
+
+def _parse_range(expression: str) -> t.Tuple[t.Tuple[Comparator, ...], ...]:
+    """Parses a range expression into sets of primitive comparators"""
+
+    sets = []
+    for alternative in expression.split("||"):
+        # join operators to their versions so that comparators are separated
+        # only by whitespace
+        tokens = re.sub(RE_RANGE_OP, r"\1", alternative).split()
+
+        comparators: t.List[Comparator] = []
+        if len(tokens) == 3 and tokens[1] == "-":
+            # hyphen range
+            comparators.extend(_desugar(">=", tokens[0], expression))
+            comparators.extend(_desugar("<=", tokens[2], expression))
+        else:
+            for token in tokens:
+                parsed = re.match(RE_COMPARATOR, token)
+                assert parsed is not None, "token is empty"
+
+                op, partial = parsed.groups()
+                comparators.extend(_desugar(op or "", partial, expression))
+
+        sets.append(tuple(comparators))
+
+    return tuple(sets)
+
+
+def _desugar(op: str, partial: str, expression: str) -> t.List[Comparator]:
+    """Turns an operator and a partial version into primitive comparators"""
+
+    parsed = re.match(RE_PARTIAL, partial)
+    if not parsed:
+        raise ParseException(EXC_INVALID_STR.format("range", expression))
+
+    groups = parsed.groups()
+    pre, build = groups[3], groups[4]
+
+    # everything after the first wildcard is a wildcard
+    nums: t.List[int] = []
+    for num in groups[:3]:
+        if num is None or num in "xX*":
+            break
+        nums.append(int(num))
+
+    if len(nums) < 3 and (pre is not None or build is not None):
+        raise ParseException(EXC_INVALID_STR.format("range", expression))
+
+    if not nums:
+        if op in ("<", ">"):
+            # nothing is below or above every version
+            return [("<", FrozenVersion(0, 0, 0, "0"))]
+        return []
+
+    if len(nums) == 3:
+        version = FrozenVersion(nums[0], nums[1], nums[2], pre, build)
+        major, minor, patch = nums
+
+        if op in ("", "="):
+            return [("=", version)]
+        elif op == "~":
+            return [(">=", version), ("<", FrozenVersion(major, minor + 1, 0, "0"))]
+        elif op == "^":
+            if major > 0:
+                upper = FrozenVersion(major + 1, 0, 0, "0")
+            elif minor > 0:
+                upper = FrozenVersion(0, minor + 1, 0, "0")
+            else:
+                upper = FrozenVersion(0, 0, patch + 1, "0")
+            return [(">=", version), ("<", upper)]
+
+        return [(op, version)]
+
+    # partial versions cover every release from the lowest version in them
+    # up to (but not including) the pre-releases of the next one
+    lowest = FrozenVersion(nums[0], nums[1] if len(nums) > 1 else 0, 0)
+    if len(nums) == 1 or (op == "^" and nums[0] > 0):
+        following = FrozenVersion(nums[0] + 1, 0, 0)
+    else:
+        following = FrozenVersion(nums[0], nums[1] + 1, 0)
+
+    if op == ">":
+        return [(">=", following)]
+    elif op == ">=":
+        return [(">=", lowest)]
+    elif op == "<":
+        return [("<", FrozenVersion(lowest.major, lowest.minor, 0, "0"))]
+    elif op == "<=":
+        return [("<", FrozenVersion(following.major, following.minor, 0, "0"))]
+
+    return [
+        (">=", lowest),
+        ("<", FrozenVersion(following.major, following.minor, 0, "0")),
+    ]
+
+
+def _range(expression: t.Union[str, Range]) -> Range:
+    """Range of an expression (compiled with range_cache) or a Range"""
+
+    return range_cache.get(expression) if isinstance(expression, str) else expression
+
+
+def _bound(version: Version, key: t.Optional[bytes] = None) -> _Bound:
+    """Bound at a version (its build label is dropped), with its sort key if \
+    it is known
+    """
+
+    if version.build is not None or not isinstance(version, FrozenVersion):
+        version = FrozenVersion(
+            version.major, version.minor, version.patch, version.pre
+        )
+
+    return sort_key(version) if key is None else key, version
+
+
+def _next(version: Version) -> Version:
+    """The lowest version that is higher than version"""
+
+    major, minor, patch, pre = version.major, version.minor, version.patch, version.pre
+    if pre is None:
+        return _from_parts(major, minor, patch + 1, "0", None, FrozenVersion)
+
+    return _from_parts(major, minor, patch, pre + ".0", None, FrozenVersion)
+
+
+def _previous(version: Version) -> t.Optional[Version]:
+    """The highest version that is lower than version, if there is one (a \
+    release has pre-releases of any length below it, for example)
+    """
+
+    major, minor, patch, pre = version.major, version.minor, version.patch, version.pre
+    if pre == "0" and patch > 0:
+        return _from_parts(major, minor, patch - 1, None, None, FrozenVersion)
+    if pre is not None and pre.endswith(".0"):
+        return _from_parts(major, minor, patch, pre[:-2], None, FrozenVersion)
+
+    return None
+
+
+def _is_next(version: Version, following: Version) -> bool:
+    """If following is _next(version)"""
+
+    if version.pre is None:
+        return following.pre == "0" and following._core == [
+            version.major,
+            version.minor,
+            version.patch + 1,
+        ]
+
+    return following._core == version._core and following.pre == version.pre + ".0"
+
+
+def _start_key(bound: t.Optional[_Bound]) -> bytes:
+    return _LOWEST_KEY if bound is None else bound[0]
+
+
+def _end_key(bound: t.Optional[_Bound]) -> bytes:
+    return _KEY_MAX if bound is None else bound[0]
+
+
+def _keys(intervals: t.List[_Interval]) -> t.List[t.Tuple[bytes, bytes]]:
+    return [(_start_key(start), _end_key(end)) for start, end in intervals]
+
+
+def _interval(
+    comparators: t.Tuple[Comparator, ...], keys: t.Tuple[t.Tuple[str, bytes], ...]
+) -> t.Optional[_Interval]:
+    """Interval of the versions that satisfy every comparator (given with \
+    the sort keys of their versions), or None if no version does
+    """
+
+    start: t.Optional[_Bound] = None
+    end: t.Optional[_Bound] = None
+
+    for (op, version), (_, key) in zip(comparators, keys):
+        low = high = None
+        if op in (">=", "="):
+            low = _bound(version, key)
+        elif op == ">":
+            low = _bound(_next(version))
+        if op == "<":
+            high = _bound(version, key)
+        elif op in ("<=", "="):
+            high = _bound(_next(version))
+
+        if low is not None and (start is None or low[0] > start[0]):
+            start = low
+        if high is not None and (end is None or high[0] < end[0]):
+            end = high
+
+    if start is not None and start[0] == _LOWEST_KEY:
+        start = None
+    if _start_key(start) >= _end_key(end):
+        return None
+
+    return start, end
+
+
+def _union(lhs: t.List[_Interval], rhs: t.List[_Interval]) -> t.List[_Interval]:
+    """Merges two lists of intervals sorted by their starts"""
+
+    ret: t.List[_Interval] = []
+    for start, end in heapq.merge(
+        lhs, rhs, key=lambda interval: _start_key(interval[0])
+    ):
+        if ret and _start_key(start) <= _end_key(ret[-1][1]):
+            # overlapping or adjacent
+            if _end_key(end) > _end_key(ret[-1][1]):
+                ret[-1] = (ret[-1][0], end)
+        else:
+            ret.append((start, end))
+
+    return ret
+
+
+def _intersect(lhs: t.List[_Interval], rhs: t.List[_Interval]) -> t.List[_Interval]:
+    ret: t.List[_Interval] = []
+    i = j = 0
+    while i < len(lhs) and j < len(rhs):
+        start = max(lhs[i][0], rhs[j][0], key=_start_key)
+        end = min(lhs[i][1], rhs[j][1], key=_end_key)
+        if _start_key(start) < _end_key(end):
+            ret.append((start, end))
+
+        # the interval that ends first cannot overlap anything else
+        if _end_key(lhs[i][1]) <= _end_key(rhs[j][1]):
+            i += 1
+        else:
+            j += 1
+
+    return ret
+
+
+def _complement(intervals: t.List[_Interval]) -> t.List[_Interval]:
+    ret: t.List[_Interval] = []
+    low: t.Optional[_Bound] = None
+    for start, end in intervals:
+        if start is not None:
+            ret.append((low, start))
+        if end is None:
+            return ret
+        low = end
+
+    ret.append((low, None))
+    return ret
+
+
+def _from_intervals(intervals: t.List[_Interval]) -> Range:
+    """Range of canonical intervals"""
+
+    # a comparator set of each interval, tested with the keys of the bounds
+    key_sets: t.List[t.Tuple[t.Tuple[str, bytes], ...]] = []
+    for start, end in intervals:
+        keys = []
+        if start is not None:
+            keys.append((">=", start[0]))
+        if end is not None:
+            keys.append(("<", end[0]))
+        key_sets.append(tuple(keys))
+
+    if not key_sets:
+        # nothing is below the lowest version
+        key_sets.append((("<", _LOWEST_KEY),))
+
+    ret = Range.__new__(Range)
+    ret._expression = None
+    ret._sets = None
+    ret._key_sets = tuple(key_sets)
+    ret._canonical = intervals
+
+    return ret
+
+
+def _comparators(
+    intervals: t.List[_Interval],
+) -> t.Tuple[t.Tuple[Comparator, ...], ...]:
+    """The fewest comparators for each of the canonical intervals"""
+
+    sets: t.List[t.Tuple[Comparator, ...]] = []
+    for start, end in intervals:
+        comparators: t.List[Comparator] = []
+        if start is not None and end is not None and _is_next(start[1], end[1]):
+            comparators.append(("=", start[1]))
+        else:
+            if start is not None:
+                below = _previous(start[1])
+                if below is None:
+                    comparators.append((">=", start[1]))
+                else:
+                    comparators.append((">", below))
+            if end is not None:
+                below = _previous(end[1])
+                if below is None:
+                    comparators.append(("<", end[1]))
+                else:
+                    comparators.append(("<=", below))
+        sets.append(tuple(comparators))
+
+    if not sets:
+        # nothing is below the lowest version
+        sets.append((("<", _LOWEST),))
+
+    return tuple(sets)
@@ -0,0 +1,128 @@
+"""
+Finding versions in text
+
+find_all() and iter_find() find every semantic version in text such as \
+build logs, changelogs, or user agent strings:
+
+.. code-block:: py
+
+    from semver import find_all
+
+    find_all("upgrade from 1.2.3 to 2.0.0-rc.1 (build 4.5.6.7)")
+    # [(13, Version(...1.2.3...)), (22, Version(...2.0.0-rc.1...))]
+
+A version is not found inside a longer dotted number (4.5.6.7 above) or \
+right after a digit or dot, and it must not be followed by a letter, digit, \
+or hyphen. A 'v' before the version is allowed (v1.2.3).
+"""
+
+import re
+import typing as t
+
+from .constants import EXC_BAD_CHUNK, RE_SEARCH
+from .version import Version, _from_groups
+
+# characters read at a time by iter_find()
+CHUNK_SIZE = 1 << 20
+
+# most characters that iter_find() carries over to the next chunk (versions
+# split between chunks are found if they are in a shorter run of characters
+# that can be part of a version)
+MAX_LENGTH = 256
+
+_SEARCH_RE = re.compile(RE_SEARCH)
+
+# the characters at the end of a string that can be part of a version (and
+# of the lookaheads after one)
+_TAIL_RE = re.compile(r"(?<![\da-zA-Z.+-])[\da-zA-Z.+-]*\Z")
+
+
+def find_all(text: str) -> t.List[t.Tuple[int, Version]]:
+    """Finds all semantic versions in text
+
+    Args:
+        text (str): Any text
+
+    Returns:
+        List[Tuple[int, Version]]: The offset of each version in the text, \
+        and the version
+    """
+
+    return list(_find(text, 0, 0))
+
+
+def iter_find(
+    stream: t.Union[t.TextIO, t.Iterable[str]], chunk_size: int = CHUNK_SIZE
+) -> t.Iterator[t.Tuple[int, Version]]:
+    """Finds all semantic versions in a stream of text, a chunk at a time
+
+    Versions that are split between chunks are found, unless the run of \
+    characters they are in (letters, digits, '.', '+', and '-') is longer \
+    than MAX_LENGTH, so long runs do not have to be kept in memory. Such \
+    versions are skipped, never returned cut short.
+
+    Args:
+        stream (Union[TextIO, Iterable[str]]): A text file (or anything with \
+        a read() method that returns str), or an iterable of strings
+        chunk_size (int, optional): Characters to read at a time when stream \
+        has a read() method. Defaults to CHUNK_SIZE (1 MiB).
+
+    Raises:
+        ValueError: If chunk_size is not positive
+
+    Yields:
+        Tuple[int, Version]: The offset of each version in the whole stream, \
+        and the version
+    """
+
+    if chunk_size <= 0:
+        raise ValueError(EXC_BAD_CHUNK.format(chunk_size))
+
+    chunks: t.Iterable[str]
+    if hasattr(stream, "read"):
+        read = t.cast(t.TextIO, stream).read
+        chunks = iter(lambda: read(chunk_size), "")
+    else:
+        chunks = stream
+
+    # offset of buffer in the stream
+    offset = 0
+    buffer = ""
+    # where the search starts in buffer (the character before it is kept,
+    # for the lookbehind of the regex)
+    start = 0
+
+    for chunk in chunks:
+        buffer += chunk
+
+        # a version at the end of the buffer may continue in the next chunk,
+        # so versions that start in the version characters at the end (at
+        # most the last MAX_LENGTH) are searched again with the next chunk
+        pos = max(start, len(buffer) - MAX_LENGTH)
+        tail = _TAIL_RE.search(buffer, pos)
+        cut = pos if tail is None else tail.start()
+
+        for found in _SEARCH_RE.finditer(buffer, start):
+            if found.start() >= cut:
+                break
+            start = found.end()
+            if start >= len(buffer) - 1 and buffer[start:] in ("", ".", "+"):
+                # the next chunk may make the version longer (it is longer
+                # than MAX_LENGTH, so it is skipped instead of carried over)
+                break
+            yield offset + found.start(), _from_groups(found.groups(), found.group())
+
+        start = max(start, cut)
+        keep = max(start - 1, 0)
+        offset += keep
+        buffer = buffer[keep:]
+        start -= keep
+
+    yield from _find(buffer, start, offset)
+
+
+def _find(text: str, start: int, offset: int) -> t.Iterator[t.Tuple[int, Version]]:
+    """Versions in text from start on, with offset added to each position"""
+
+    for found in _SEARCH_RE.finditer(text, start):
+        yield offset + found.start(), _from_groups(found.groups(), found.group())
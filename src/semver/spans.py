@@ -0,0 +1,172 @@
+"""
+Matching and span-based editing of version strings
+
+Changing one component of a version string does not need a Version object. \
+The string is matched once, and the new component is checked and spliced \
+in where the old one was.
+"""
+
+import re
+import typing as t
+
+from .constants import EXC_INVALID_STR, RE_BUILD, RE_CLEAN, RE_FULL, RE_PRE
+from .exc import ParseException
+
+# regex group of each component in RE_FULL
+MAJOR = 1
+MINOR = 2
+PATCH = 3
+PRE = 4
+BUILD = 5
+
+# compiled once, so matching skips the re module's pattern cache lookup
+FULL_RE = re.compile(RE_FULL)
+CLEAN_RE = re.compile(RE_CLEAN)
+_PRE = re.compile(RE_PRE)
+_BUILD = re.compile(RE_BUILD)
+
+# character before each label
+_SEP = {PRE: "-", BUILD: "+"}
+
+
+def scan(version: str) -> t.Match[str]:
+    """Matches a version string
+
+    Args:
+        version (str): Semantic version string
+
+    Raises:
+        ParseException: If the string is invalid
+
+    Returns:
+        Match: The match; group() and span() of MAJOR, MINOR, PATCH, PRE, \
+        and BUILD give each component
+    """
+
+    parsed = FULL_RE.match(version)
+    if not parsed:
+        raise ParseException(EXC_INVALID_STR.format("semantic version", version))
+
+    return parsed
+
+
+def splice(version: str, group: int, text: t.Optional[str]) -> t.Optional[str]:
+    """Replaces one component of a version string
+
+    The result is the same as parsing the string, setting the component on \
+    the Version, and rendering it again. Numbers are not checked (text must \
+    be the string of a non-negative int), but labels are.
+
+    Args:
+        version (str): Semantic version string
+        group (int): The component to replace (MAJOR, MINOR, PATCH, PRE, or BUILD)
+        text (Optional[str]): The new component (without '-' or '+'), or None \
+        to remove a label
+
+    Raises:
+        ParseException: If the version string or new label is invalid
+
+    Returns:
+        Optional[str]: The new version string, or None if the string uses \
+        non-ASCII digits (rendering a Version would change them, so the \
+        string cannot be spliced)
+    """
+
+    parsed = scan(version)
+
+    if text is not None:
+        if group == PRE and not _PRE.match(text):
+            raise ParseException(EXC_INVALID_STR.format("pre-release", text))
+        elif group == BUILD and not _BUILD.match(text):
+            raise ParseException(EXC_INVALID_STR.format("build/metadata", text))
+
+    if not version.isascii():
+        return None
+
+    sep = _SEP.get(group, "")
+    start, end = parsed.span(group)
+    if start == -1:
+        # label is not there yet: pre-release goes after the patch number,
+        # build at the end
+        start = end = parsed.end(PATCH) if group == PRE else parsed.end()
+    else:
+        start -= len(sep)
+
+    # the match may end before a trailing newline, which is not rendered
+    head = version[:start]
+    tail = version[end : parsed.end()]
+
+    if text is None:
+        return head + tail
+
+    return head + sep + text + tail
+
+
+def compare(lhs: str, rhs: str) -> int:
+    """Compares two version strings without making Version objects
+
+    The version numbers are compared first, and the pre-release labels are \
+    only split into identifiers if the numbers are the same. The result is \
+    the same as comparing Version objects.
+
+    Args:
+        lhs (str): Semantic version string
+        rhs (str): Semantic version string
+
+    Raises:
+        ParseException: If either string is invalid (lhs is checked first)
+
+    Returns:
+        int: 0 if lhs == rhs, -1 if lhs < rhs, and 1 if lhs > rhs
+    """
+
+    plhs = scan(lhs)
+    prhs = scan(rhs)
+
+    for group in (MAJOR, MINOR, PATCH):
+        nlhs = plhs.group(group)
+        nrhs = prhs.group(group)
+        if nlhs != nrhs:
+            # the same number can be written with different (non-ASCII) digits
+            ilhs = int(nlhs)
+            irhs = int(nrhs)
+            if ilhs != irhs:
+                return -1 if ilhs < irhs else 1
+
+    # Version compares labels as strings for equality, and by precedence
+    # for less than
+    prelhs = plhs.group(PRE)
+    prerhs = prhs.group(PRE)
+    if prelhs == prerhs:
+        return 0
+    elif prelhs is None:
+        return 1
+    elif prerhs is None:
+        return -1
+
+    return -1 if pre_lt(prelhs, prerhs) else 1
+
+
+def pre_lt(lhs: str, rhs: str) -> bool:
+    """If pre-release label lhs has lower precedence than rhs (both valid)"""
+
+    ids_lhs = lhs.split(".")
+    ids_rhs = rhs.split(".")
+
+    for id_lhs, id_rhs in zip(ids_lhs, ids_rhs):
+        if id_lhs == id_rhs:
+            continue
+
+        num_lhs = id_lhs.isdigit()
+        num_rhs = id_rhs.isdigit()
+        if num_lhs and num_rhs:
+            if int(id_lhs) == int(id_rhs):
+                continue
+            return int(id_lhs) < int(id_rhs)
+        elif num_lhs or num_rhs:
+            # numeric identifiers are lower than alphanumeric ones
+            return num_lhs
+
+        return id_lhs < id_rhs
+
+    return len(ids_lhs) < len(ids_rhs)
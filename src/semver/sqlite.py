@@ -0,0 +1,181 @@
+"""
+SQLite integration
+
+Registers a ``SEMVER`` collation and scalar functions on an \
+``sqlite3.Connection``:
+
+.. code-block:: py
+
+    import sqlite3
+    from semver.sqlite import register
+
+    conn = sqlite3.connect("catalog.db")
+    register(conn)
+    conn.execute("SELECT version FROM releases ORDER BY version COLLATE SEMVER")
+
+The collation and functions call into Python for every row (or every \
+comparison, for the collation). For large tables, store the sort key of \
+each version in its own indexed column. SQLite compares BLOBs byte by byte, \
+which is the same order as version precedence, so ``ORDER BY`` and range \
+scans on that column use the index and never call back into Python:
+
+.. code-block:: sql
+
+    CREATE TABLE releases (version TEXT NOT NULL, vkey BLOB NOT NULL);
+    CREATE INDEX releases_vkey ON releases (vkey);
+
+    -- semver_key() is registered by register(); keys can also be made in
+    -- Python with semver.keys.sort_key() and bound as parameters
+    INSERT INTO releases (version, vkey) VALUES (:v, semver_key(:v));
+
+    -- every version in >=1.2.0 <2.0.0-0, in version order
+    SELECT version FROM releases
+    WHERE vkey >= :lo AND vkey < :hi
+    ORDER BY vkey;
+
+Functions return NULL when given an invalid version string, and \
+semver_major(), semver_minor() and semver_patch() return NULL when the \
+number does not fit in an SQLite integer (signed 64-bit).
+"""
+
+import functools
+import sqlite3
+import sys
+import typing as t
+
+from .exc import ParseException
+from .keys import sort_key
+from .ranges import range_cache
+from .version import parse_version
+
+COLLATION = "SEMVER"
+
+# sort keys of recently collated strings; a sort calls the collation
+# O(n log n) times with the same strings
+_KEY_CACHE_SIZE = 1 << 16
+
+# largest integer that SQLite can store
+_MAX_INTEGER = (1 << 63) - 1
+
+
+def register(conn: sqlite3.Connection) -> None:
+    """Registers the ``SEMVER`` collation and the semver functions on a connection
+
+    Functions registered:
+
+    * ``semver_valid(v)``: 1 if v is a valid version, otherwise 0
+    * ``semver_major(v)``, ``semver_minor(v)``, ``semver_patch(v)``: version numbers
+    * ``semver_cmp(lhs, rhs)``: -1, 0 or 1 (same as compare())
+    * ``semver_satisfies(v, range)``: 1 if v is in the range, otherwise 0
+    * ``semver_key(v)``: sort key BLOB (see semver.keys.sort_key())
+
+    Args:
+        conn (sqlite3.Connection): The connection to register on
+    """
+
+    conn.create_collation(COLLATION, _collate)
+
+    _create_function(conn, "semver_valid", 1, _valid)
+    _create_function(conn, "semver_major", 1, _major)
+    _create_function(conn, "semver_minor", 1, _minor)
+    _create_function(conn, "semver_patch", 1, _patch)
+    _create_function(conn, "semver_cmp", 2, _cmp)
+    _create_function(conn, "semver_satisfies", 2, _satisfies)
+    _create_function(conn, "semver_key", 1, _key)
+
+
+def _create_function(
+    conn: sqlite3.Connection, name: str, narg: int, func: t.Callable
+) -> None:
+    """Registers a deterministic function (so it can be used in indexes)"""
+
+    if sys.version_info >= (3, 8):
+        conn.create_function(name, narg, func, deterministic=True)
+    else:  # pragma: no cover
+        conn.create_function(name, narg, func)
+
+
+@functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
+def _text_key(text: str) -> t.Tuple[int, t.Union[str, bytes]]:
+    """Collation key; invalid versions sort after valid ones, as text"""
+
+    try:
+        return (0, sort_key(text))
+    except ParseException:
+        return (1, text)
+
+
+def _collate(lhs: str, rhs: str) -> int:
+    klhs = _text_key(lhs)
+    krhs = _text_key(rhs)
+
+    if klhs == krhs:
+        return 0
+    elif klhs < krhs:
+        return -1
+    else:
+        return 1
+
+
+def _valid(version: t.Any) -> int:
+    return int(isinstance(version, str) and _text_key(version)[0] == 0)
+
+
+def _number(version: t.Any, attr: str) -> t.Optional[int]:
+    if not isinstance(version, str):
+        return None
+
+    try:
+        number: int = getattr(parse_version(version), attr)
+    except ParseException:
+        return None
+
+    return number if number <= _MAX_INTEGER else None
+
+
+def _major(version: t.Any) -> t.Optional[int]:
+    return _number(version, "major")
+
+
+def _minor(version: t.Any) -> t.Optional[int]:
+    return _number(version, "minor")
+
+
+def _patch(version: t.Any) -> t.Optional[int]:
+    return _number(version, "patch")
+
+
+def _key(version: t.Any) -> t.Optional[bytes]:
+    if not isinstance(version, str):
+        return None
+
+    kind, key = _text_key(version)
+    if kind != 0:
+        return None
+
+    assert isinstance(key, bytes), "valid version has no bytes key"
+    return key
+
+
+def _cmp(lhs: t.Any, rhs: t.Any) -> t.Optional[int]:
+    klhs = _key(lhs)
+    krhs = _key(rhs)
+    if klhs is None or krhs is None:
+        return None
+
+    if klhs == krhs:
+        return 0
+    elif klhs < krhs:
+        return -1
+    else:
+        return 1
+
+
+def _satisfies(version: t.Any, expression: t.Any) -> t.Optional[int]:
+    if not isinstance(version, str) or not isinstance(expression, str):
+        return None
+
+    try:
+        return int(range_cache.get(expression).test(version))
+    except ParseException:
+        return None
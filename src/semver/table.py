@@ -0,0 +1,594 @@
+"""
+Sorted tables of versions that can be shared between processes
+
+A version table is one buffer with the versions sorted by precedence: \
+their sort keys, number columns, and label strings. The buffer can be a \
+file (opened with mmap) or a block of shared memory, so many processes can \
+use the same table without each parsing and storing the versions:
+
+.. code-block:: py
+
+    from semver import VersionTable
+
+    # in the process that loads the catalog
+    table = VersionTable.create_shared(versions, name="catalog")
+
+    # in each worker process
+    table = VersionTable.attach_shared("catalog")
+    table.floor("1.4.0"), table.latest(), list(table.select("^1.2"))
+
+Shared memory tables need Python 3.8 or later (multiprocessing.shared_memory).
+
+Opening or attaching a table only reads its header. Queries binary search \
+the sort keys in the buffer, and only the versions that are returned are \
+read into Version objects.
+
+Layout (all ints are little-endian unsigned 64-bit):
+
+* Header: ``b"SVTB"``, layout number (4 bytes), count, and the sizes of the \
+key, pre-release, and build blobs
+* Key offsets (count + 1), major, minor, and patch columns (count each), \
+pre-release offsets and build offsets (count + 1 each)
+* Key blob, pre-release blob, and build blob (a version with no label has \
+an empty label)
+"""
+
+import mmap
+import os
+import platform
+import struct
+import sys
+import typing as t
+
+from .constants import (
+    EXC_BAD_TABLE,
+    EXC_INVALID_STR,
+    EXC_NO_SHARED_MEMORY,
+    EXC_TOO_LARGE,
+)
+from .exc import ParseException
+from .keys import _make_key, sort_key
+from .ranges import Range, _key_bounds, range_cache
+from .spans import FULL_RE
+from .version import Version, _from_parts
+
+_MAGIC = b"SVTB"
+_LAYOUT = 1
+_HEADER = struct.Struct("<4sIQQQQ")
+_INT = struct.Struct("<Q")
+_PAIR = struct.Struct("<QQ")
+
+# where POSIX shared memory blocks are files (on Linux)
+_SHM_DIR = "/dev/shm"
+
+# sort key of the lowest stable version
+_STABLE_KEY = _make_key("1", "0", "0", None)
+
+# largest number that fits in a column
+_MAX_NUMBER = (1 << 64) - 1
+
+# (sort key, major, minor, patch, pre, build) of a version being packed
+_Row = t.Tuple[bytes, int, int, int, t.Optional[str], t.Optional[str]]
+
+
+class VersionTable:
+    """A read-only table of versions sorted by precedence, stored in a buffer
+
+    Versions with the same precedence (that only differ by build label) \
+    keep the order they were packed in.
+    """
+
+    def __init__(self, buffer: t.Any, offset: int = 0) -> None:
+        """Constructor
+
+        Args:
+            buffer (Any): A bytes-like object (bytes, memoryview, mmap) with \
+            a table made by pack_table(); the table may be followed by \
+            unused bytes
+            offset (int, optional): Where the table starts in the buffer. \
+            Defaults to 0.
+
+        Raises:
+            ValueError: If the buffer does not hold a table
+        """
+
+        try:
+            header = _HEADER.unpack_from(buffer, offset)
+        except struct.error as e:
+            raise ValueError(EXC_BAD_TABLE.format(e)) from e
+
+        magic, layout, count, keys, pres, builds = header
+        if magic != _MAGIC or layout != _LAYOUT:
+            raise ValueError(EXC_BAD_TABLE.format("unknown header"))
+
+        self._buffer = buffer
+        self._count: int = count
+
+        # start of each section
+        self._key_offsets = offset + _HEADER.size
+        self._major = self._key_offsets + 8 * (count + 1)
+        self._minor = self._major + 8 * count
+        self._patch = self._minor + 8 * count
+        self._pre_offsets = self._patch + 8 * count
+        self._build_offsets = self._pre_offsets + 8 * (count + 1)
+        self._keys = self._build_offsets + 8 * (count + 1)
+        self._pres = self._keys + keys
+        self._builds = self._pres + pres
+        self._size: int = self._builds + builds - offset
+
+        if len(buffer) < offset + self._size:
+            raise ValueError(EXC_BAD_TABLE.format("buffer is too small"))
+
+        # what to release in close()
+        self._mmap: t.Optional[mmap.mmap] = None
+        self._shm: t.Any = None
+        # name of the shared memory block
+        self._name: t.Optional[str] = None
+
+    def __repr__(self) -> str:
+        """repr of VersionTable"""
+
+        return "VersionTable(count={})".format(self._count)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Version:
+        """The version at an index (in ascending order)"""
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("table index out of range")
+
+        return self._version(index)
+
+    def __iter__(self) -> t.Iterator[Version]:
+        for i in range(self._count):
+            yield self._version(i)
+
+    def __enter__(self) -> "VersionTable":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    @classmethod
+    def open(cls, path: t.Union[str, "os.PathLike[str]"]) -> "VersionTable":
+        """Opens a table file written by write_table() (the file is mapped \
+        read-only, not read)
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the file
+
+        Raises:
+            ValueError: If the file does not hold a table
+
+        Returns:
+            VersionTable: The table (close it when it is no longer used)
+        """
+
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # empty files cannot be mapped
+                raise ValueError(EXC_BAD_TABLE.format("file is empty"))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            ret = cls(mapped)
+        except ValueError:
+            mapped.close()
+            raise
+
+        ret._mmap = mapped
+        return ret
+
+    @classmethod
+    def create_shared(
+        cls,
+        versions: t.Iterable[t.Union[str, Version]],
+        name: t.Optional[str] = None,
+    ) -> "VersionTable":
+        """Packs versions into a new block of shared memory
+
+        The process that creates the block should call unlink() when no \
+        process needs the table anymore.
+
+        Args:
+            versions (Iterable[Union[str, Version]]): Version strings (must \
+            not include 'v' in beginning) or Version objects
+            name (Optional[str], optional): Name of the shared memory block. \
+            Defaults to a random name (see the name property).
+
+        Raises:
+            ParseException: If any of the version strings are invalid
+            ValueError: If a version number does not fit in 64 bits
+            FileExistsError: If a block with the name already exists
+            NotImplementedError: Before Python 3.8
+
+        Returns:
+            VersionTable: The table in the shared memory block
+        """
+
+        _check_shared_memory()
+        from multiprocessing import shared_memory
+
+        data = pack_table(versions)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        t.cast(memoryview, shm.buf)[: len(data)] = data
+
+        ret = cls(shm.buf)
+        ret._shm = shm
+        ret._name = shm.name
+        return ret
+
+    @classmethod
+    def attach_shared(cls, name: str) -> "VersionTable":
+        """Attaches to a table made by create_shared() (in any process)
+
+        Args:
+            name (str): Name of the shared memory block
+
+        Raises:
+            FileNotFoundError: If there is no block with the name
+            ValueError: If the block does not hold a table
+            NotImplementedError: Before Python 3.8
+
+        Returns:
+            VersionTable: The table (close it when it is no longer used)
+        """
+
+        _check_shared_memory()
+        if os.path.isdir(_SHM_DIR):
+            # blocks are files in _SHM_DIR on Linux, so the block is mapped
+            # read-only like a table file, without registering it with the
+            # resource tracker (which unlinks blocks that are still
+            # registered when it exits, but the block belongs to the process
+            # that created it)
+            ret = cls.open(os.path.join(_SHM_DIR, name))
+            ret._name = name
+            return ret
+
+        from multiprocessing import shared_memory
+
+        try:
+            if sys.version_info >= (3, 13):
+                shm = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                shm = shared_memory.SharedMemory(name=name)
+                if os.name == "posix":
+                    from multiprocessing import resource_tracker
+
+                    resource_tracker.unregister("/" + shm.name, "shared_memory")
+        except ValueError as e:
+            # an empty block cannot be mapped
+            raise ValueError(EXC_BAD_TABLE.format(e)) from e
+
+        try:
+            ret = cls(shm.buf)
+        except ValueError:
+            shm.close()
+            raise
+
+        ret._shm = shm
+        ret._name = name
+        return ret
+
+    @property
+    def name(self) -> t.Optional[str]:
+        """Name of the shared memory block, or None if the table is not in \
+        shared memory
+        """
+
+        return self._name
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the table in bytes"""
+
+        return self._size
+
+    def close(self) -> None:
+        """Releases the file or shared memory of the table (the table cannot \
+        be used after it is closed)
+        """
+
+        self._buffer = b""
+        self._count = 0
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self) -> None:
+        """Closes the table and frees its shared memory block (call once, in \
+        the process that called create_shared())
+        """
+
+        self.close()
+        if self._shm is not None:
+            self._shm.unlink()
+
+    def floor(self, version: t.Union[str, Version]) -> t.Optional[Version]:
+        """The highest version that is lower than or equal to version
+
+        Args:
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            Optional[Version]: The version (the last one packed, if several \
+            have the same precedence), or None if there is none
+        """
+
+        index = self._bisect(sort_key(version), True) - 1
+        return None if index < 0 else self._version(index)
+
+    def ceiling(self, version: t.Union[str, Version]) -> t.Optional[Version]:
+        """The lowest version that is higher than or equal to version
+
+        Args:
+            version (Union[str, Version]): A version string (must not include \
+            'v' in beginning) or a Version object
+
+        Raises:
+            ParseException: If the version string is invalid
+
+        Returns:
+            Optional[Version]: The version (the first one packed, if several \
+            have the same precedence), or None if there is none
+        """
+
+        index = self._bisect(sort_key(version), False)
+        return None if index >= self._count else self._version(index)
+
+    def latest(self, stable: bool = False) -> t.Optional[Version]:
+        """The version with the highest precedence
+
+        Args:
+            stable (bool, optional): Only look at stable versions (see \
+            Version.is_stable). Defaults to False.
+
+        Returns:
+            Optional[Version]: The version, or None if there is none
+        """
+
+        if not stable:
+            return self._version(self._count - 1) if self._count else None
+
+        # stable versions are at least 1.0.0, so the scan stops below it
+        lowest = self._bisect(_STABLE_KEY, right=False)
+        for index in range(self._count - 1, lowest - 1, -1):
+            if self._is_stable(index):
+                return self._version(index)
+
+        return None
+
+    def select(self, expression: t.Union[str, Range]) -> t.Iterator[Version]:
+        """Versions that satisfy a range, in ascending order
+
+        Args:
+            expression (Union[str, Range]): A range expression or Range object
+
+        Raises:
+            ParseException: If the range expression is invalid
+
+        Yields:
+            Version: Each version in the range
+        """
+
+        if isinstance(expression, str):
+            expression = range_cache.get(expression)
+
+        for start, end in self._spans(expression):
+            for index in range(start, end):
+                yield self._version(index)
+
+    def count(self, expression: t.Union[str, Range]) -> int:
+        """Number of versions that satisfy a range (without reading them)
+
+        Args:
+            expression (Union[str, Range]): A range expression or Range object
+
+        Raises:
+            ParseException: If the range expression is invalid
+
+        Returns:
+            int: The number of versions in the range
+        """
+
+        if isinstance(expression, str):
+            expression = range_cache.get(expression)
+
+        return sum(end - start for start, end in self._spans(expression))
+
+    def _spans(self, expression: Range) -> t.List[t.Tuple[int, int]]:
+        """Sorted, non-overlapping (start, end) index spans of the versions \
+        in a range
+        """
+
+        spans = []
+        for comparators in expression._key_sets:
+            bounds = _key_bounds(comparators)
+            if bounds is None:
+                continue
+
+            low, low_inclusive, high, high_inclusive = bounds
+            start = 0 if low is None else self._bisect(low, not low_inclusive)
+            end = self._count if high is None else self._bisect(high, high_inclusive)
+            if start < end:
+                spans.append((start, end))
+
+        # comparator sets can overlap
+        spans.sort()
+        merged: t.List[t.Tuple[int, int]] = []
+        for start, end in spans:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+            else:
+                merged.append((start, end))
+
+        return merged
+
+    def _bisect(self, key: bytes, right: bool) -> int:
+        """Index to insert key at (after equal keys if right is True)"""
+
+        lo = 0
+        hi = self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = self._key(mid)
+            if probe < key or (right and probe == key):
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return lo
+
+    def _key(self, index: int) -> bytes:
+        start, end = _PAIR.unpack_from(self._buffer, self._key_offsets + 8 * index)
+        return bytes(self._buffer[self._keys + start : self._keys + end])
+
+    def _label(self, offsets: int, blob: int, index: int) -> t.Optional[str]:
+        start, end = _PAIR.unpack_from(self._buffer, offsets + 8 * index)
+        if start == end:
+            return None
+
+        return bytes(self._buffer[blob + start : blob + end]).decode()
+
+    def _number(self, column: int, index: int) -> int:
+        return int(_INT.unpack_from(self._buffer, column + 8 * index)[0])
+
+    def _is_stable(self, index: int) -> bool:
+        """Same as Version.is_stable, without reading the labels"""
+
+        buffer = self._buffer
+        pre = _PAIR.unpack_from(buffer, self._pre_offsets + 8 * index)
+        build = _PAIR.unpack_from(buffer, self._build_offsets + 8 * index)
+        return (
+            self._number(self._major, index) > 0
+            and pre[0] == pre[1]
+            and (build[0] == build[1])
+        )
+
+    def _version(self, index: int) -> Version:
+        return _from_parts(
+            self._number(self._major, index),
+            self._number(self._minor, index),
+            self._number(self._patch, index),
+            self._label(self._pre_offsets, self._pres, index),
+            self._label(self._build_offsets, self._builds, index),
+        )
+
+
+def pack_table(versions: t.Iterable[t.Union[str, Version]]) -> bytes:
+    """Packs versions into a table (see VersionTable)
+
+    Args:
+        versions (Iterable[Union[str, Version]]): Version strings (must not \
+        include 'v' in beginning) or Version objects
+
+    Raises:
+        ParseException: If any of the version strings are invalid
+        ValueError: If a version number does not fit in 64 bits
+
+    Returns:
+        bytes: The table
+    """
+
+    # sorted() is stable, so equal keys keep their order
+    return _pack_rows(sorted((_row(v) for v in versions), key=lambda row: row[0]))
+
+
+def write_table(
+    versions: t.Iterable[t.Union[str, Version]],
+    path: t.Union[str, "os.PathLike[str]"],
+) -> None:
+    """Packs versions into a table file (see VersionTable.open())
+
+    Args:
+        versions (Iterable[Union[str, Version]]): Version strings (must not \
+        include 'v' in beginning) or Version objects
+        path (Union[str, os.PathLike]): Path of the file (replaced if it exists)
+
+    Raises:
+        ParseException: If any of the version strings are invalid
+        ValueError: If a version number does not fit in 64 bits
+    """
+
+    data = pack_table(versions)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _row(version: t.Union[str, Version]) -> _Row:
+    """Sort key and components of a version"""
+
+    if isinstance(version, str):
+        parsed = FULL_RE.match(version)
+        if not parsed:
+            raise ParseException(EXC_INVALID_STR.format("semantic version", version))
+
+        smajor, sminor, spatch, pre, build = parsed.groups()
+        key = _make_key(smajor, sminor, spatch, pre)
+        major, minor, patch = int(smajor), int(sminor), int(spatch)
+    else:
+        key = sort_key(version)
+        major, minor, patch = version.major, version.minor, version.patch
+        pre, build = version.pre, version.build
+
+    if max(major, minor, patch) > _MAX_NUMBER:
+        raise ValueError(EXC_TOO_LARGE.format("a version table", version))
+
+    return key, major, minor, patch, pre, build
+
+
+def _pack_rows(rows: t.Sequence[_Row]) -> bytes:
+    """Packs rows that are already sorted by key into a table"""
+
+    count = len(rows)
+
+    keys = [row[0] for row in rows]
+    pres = [(row[4] or "").encode() for row in rows]
+    builds = [(row[5] or "").encode() for row in rows]
+    blobs = [b"".join(keys), b"".join(pres), b"".join(builds)]
+
+    columns = (
+        _offsets(keys)
+        + [row[1] for row in rows]
+        + [row[2] for row in rows]
+        + [row[3] for row in rows]
+        + _offsets(pres)
+        + _offsets(builds)
+    )
+
+    return b"".join(
+        [
+            _HEADER.pack(_MAGIC, _LAYOUT, count, *(len(blob) for blob in blobs)),
+            struct.pack("<{}Q".format(len(columns)), *columns),
+        ]
+        + blobs
+    )
+
+
+def _offsets(blobs: t.List[bytes]) -> t.List[int]:
+    """Start of each blob when they are joined, and the end of the last one"""
+
+    ret = [0]
+    for blob in blobs:
+        ret.append(ret[-1] + len(blob))
+
+    return ret
+
+
+def _check_shared_memory() -> None:
+    """Raises NotImplementedError if there is no multiprocessing.shared_memory"""
+
+    if sys.version_info < (3, 8):
+        raise NotImplementedError(
+            EXC_NO_SHARED_MEMORY.format(platform.python_version())
+        )
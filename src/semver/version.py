@@ -12,11 +12,15 @@ from .components import Build, Pre, VersionNumber
 from .constants import (
     EXC_BAD_TYPE,
     EXC_CANNOT_ADD,
+    EXC_CANNOT_DEC,
     EXC_CANNOT_RM,
+    EXC_FROZEN,
     EXC_INVALID_POS,
     EXC_INVALID_STR,
     EXC_INVALID_STR_2,
     EXC_MUST_CMP,
+    EXC_MUST_POSITIVE,
+    EXC_MUST_TYPE,
     EXC_PRE_NO_VALUE_2,
     RE_FULL,
     VPos,
@@ -25,9 +29,14 @@ from .constants import (
 from .exc import (
     InvalidOperationException,
     InvalidPositionException,
+    NegativeValueException,
     NoValueException,
     ParseException,
 )
+from .keys import pack
+
+# index of each version position in the version core
+_CORE_INDEX = {VPos.MAJOR: 0, VPos.MINOR: 1, VPos.PATCH: 2}
 
 
 class Version(Core):
@@ -69,39 +78,38 @@ class Version(Core):
                                         string AFTER the plus sign. Defaults to None.
         """
 
-        self._major: VersionNumber = self._conv_type(major, VersionNumber)
-        self._minor: VersionNumber = self._conv_type(minor, VersionNumber)
-        self._patch: VersionNumber = self._conv_type(patch, VersionNumber)
+        # major, minor, patch (indexed by _CORE_INDEX)
+        self._core: t.List[int] = [
+            self._conv_number(major),
+            self._conv_number(minor),
+            self._conv_number(patch),
+        ]
 
         # pre-release and build labels are set to None if they don't exist
         self._pre: t.Optional[Pre] = self._conv_type(pre, Pre)
         self._build: t.Optional[Build] = self._conv_type(build, Build)
 
-        # for incrementing, decrementing (lookups)
-        self._id_ref: t.Dict[VPos, t.Union[VersionNumber, Pre, None]] = {
-            VPos.MAJOR: self._major,
-            VPos.MINOR: self._minor,
-            VPos.PATCH: self._patch,
-            VPos.PRE: None,
-        }
-        self._id_order = (VPos.MAJOR, VPos.MINOR, VPos.PATCH)
+        # rendered string, reset to None whenever the version is changed
+        self._str: t.Optional[str] = None
 
     def __repr__(self) -> str:
         """repr of Version"""
 
-        return "Version(major={}, minor={}, patch={}, pre={}, build={})".format(
-            self._major, self._minor, self._patch, repr(self._pre), repr(self._build)
+        return "{}(major={}, minor={}, patch={}, pre={}, build={})".format(
+            type(self).__name__, *self._core, repr(self._pre), repr(self._build)
         )
 
     def __str__(self) -> str:
         """{MAJOR}.{MINOR}.{PATCH}-{PRE}+{BUILD}"""
 
+        if self._str is not None:
+            return self._str
+
         pre_str = "" if self._pre is None else str(self._pre)
         build_str = "" if self._build is None else str(self._build)
 
-        return "{}.{}.{}{}{}".format(
-            str(self._major), str(self._minor), str(self._patch), pre_str, build_str
-        )
+        self._str = "{}.{}.{}{}{}".format(*self._core, pre_str, build_str)
+        return self._str
 
     def __lt__(self, other: t.Any) -> bool:
         """Compares less than
@@ -110,33 +118,33 @@ class Version(Core):
         """
 
         if not isinstance(other, Version):
+            if _is_view(other):
+                # VersionView.__gt__ compares it with this version
+                return NotImplemented
             raise TypeError(EXC_MUST_CMP.format("Version", type(other)))
 
-        def cmp(lhs: t.Any, rhs: t.Any) -> bool:
-            if lhs is None and rhs is not None:
-                # if rhs does have a pre-release (and lhs does not), then lhs > rhs
-                return False
-            elif lhs is not None and rhs is None:
-                # if rhs does not have a pre-release (and lhs does), then lhs < rhs
-                return True
-            else:
-                return bool(lhs < rhs)
-
-        l1 = [self._major, self._minor, self._patch, self._pre]
-        l2 = [other._major, other._minor, other._patch, other._pre]
+        if self._core != other._core:
+            return self._core < other._core
 
-        return self._calc_lt(l1, l2, cmp)
+        if self._pre is None:
+            # if rhs does have a pre-release (and lhs does not), then lhs > rhs
+            return False
+        elif other._pre is None:
+            # if rhs does not have a pre-release (and lhs does), then lhs < rhs
+            return True
+        else:
+            return self._pre < other._pre
 
     def __eq__(self, other: t.Any) -> bool:
         """Compares equality (excluding build versions)"""
 
         if not isinstance(other, Version):
+            if _is_view(other):
+                # VersionView.__eq__ compares it with this version
+                return NotImplemented
             raise TypeError(EXC_MUST_CMP.format("Version", type(other)))
 
-        l1 = [self._major, self._minor, self._patch, self._pre]
-        l2 = [other._major, other._minor, other._patch, other._pre]
-
-        return self._calc_eq(l1, l2)
+        return self._core == other._core and self._pre == other._pre
 
     def __add__(self, other: t.Any) -> Version:
         """Multi-use operator to add things
@@ -165,6 +173,7 @@ class Version(Core):
                         EXC_CANNOT_ADD.format("pre-release", repr(self))
                     )
                 self._pre = self._conv_type(other[1:], Pre)
+                self._str = None
             elif other[0] == "+":
                 # set build if it doesn't exist
                 if self.has_build:
@@ -172,6 +181,7 @@ class Version(Core):
                         EXC_CANNOT_ADD.format("build metadata", repr(self))
                     )
                 self._build = self._conv_type(other[1:], Build)
+                self._str = None
             else:
                 # unknown string
                 raise InvalidOperationException(EXC_INVALID_STR_2.format("add", other))
@@ -216,8 +226,8 @@ class Version(Core):
 
         return self
 
-    def inc(self, pos: t.Optional[VPos] = None) -> None:
-        """Increments/bumps given position by 1
+    def inc(self, pos: t.Optional[VPos] = None, amount: int = 1) -> None:
+        """Increments/bumps given position by amount (1 by default)
 
         Increments are based on:
 
@@ -238,48 +248,52 @@ class Version(Core):
             pos (Optional[VPos], optional): Which part of the version to increment \
             (values should come from the VPos enum). Defaults to None (which \
             will evaluate to VPos.PRE).
+            amount (int, optional): The amount to increment by; must be positive. \
+            Defaults to 1.
         """
 
         if pos is None:
             pos = VPos.PRE
 
-        if not isinstance(pos, VPos) or pos not in self._id_ref:
+        if not isinstance(pos, VPos):
             raise InvalidPositionException(EXC_INVALID_POS.format(pos))
 
         if pos == VPos.PRE:
             if self._pre is None:
                 raise NoValueException(EXC_PRE_NO_VALUE_2.format(repr(self)))
 
-            self._pre.inc()
+            self._pre.inc(amount)
+            self._str = None
             return
 
-        # make mypy happy
-        cur = self._id_ref[pos]
-        assert cur is not None, "lookup pos is None"
+        if amount < 0:
+            raise NegativeValueException(EXC_MUST_POSITIVE.format(amount))
+
+        self._str = None
 
         # increase current version and reset ones to the right of it
         # (except pre-release)
-        cur.inc()
-        ind = self._id_order.index(pos)
-        for v in self._id_order[ind + 1 :]:
-            to_reset = self._id_ref[v]
-            assert to_reset is not None, "one of major, minor, micro is None"
-
-            to_reset.reset()
+        ind = _CORE_INDEX[pos]
+        self._core[ind] += amount
+        for i in range(ind + 1, 3):
+            self._core[i] = 0
 
-    def dec(self, pos: t.Optional[VPos] = None) -> None:
-        """Decrements a given position by 1
+    def dec(self, pos: t.Optional[VPos] = None, amount: int = 1) -> None:
+        """Decrements a given position by amount (1 by default)
 
         Note that decrementing any parts of a version will not affect any \
         other parts of a version. (Example: decrementing the major version of \
         2.6.12-beta.5+meta will result in 1.6.12-beta.5+meta)
 
-        An exception will be raised if the digit that is to be decremented is 0.
+        An exception will be raised if the digit that is to be decremented is \
+        less than amount.
 
         Args:
             pos (Optional[VPos], optional): Which part of the version to decrement \
             (values should come from the VPos enum). Defaults to None (which will \
             evaluate to VPos.PRE)
+            amount (int, optional): The amount to decrement by; must be positive. \
+            Defaults to 1.
         """
 
         if pos is None:
@@ -289,20 +303,23 @@ class Version(Core):
             raise InvalidPositionException(EXC_INVALID_POS.format(pos))
 
         if pos == VPos.PRE:
-            # not decrementing from lookup dict because
-            # self._pre can be None on initialization
             if self._pre is None:
                 raise NoValueException(EXC_PRE_NO_VALUE_2.format(repr(self)))
 
-            self._pre.dec()
+            self._pre.dec(amount)
+            self._str = None
             return
 
-        # make mypy happy
-        cur = self._id_ref[pos]
-        assert cur is not None, "lookup pos is None"
+        if amount < 0:
+            raise NegativeValueException(EXC_MUST_POSITIVE.format(amount))
 
         # decrease version position and ignore all other ones
-        cur.dec()
+        ind = _CORE_INDEX[pos]
+        if self._core[ind] < amount:
+            raise NegativeValueException(EXC_CANNOT_DEC)
+
+        self._core[ind] -= amount
+        self._str = None
 
     def remove_pre(self) -> None:
         """Removes the pre-release label
@@ -313,6 +330,7 @@ class Version(Core):
         """
 
         self._pre = None
+        self._str = None
 
     def remove_build(self) -> None:
         """Removes the build label
@@ -323,15 +341,15 @@ class Version(Core):
         """
 
         self._build = None
+        self._str = None
 
     def reset(self) -> None:
         """Resets version to 0.0.0"""
 
-        self._major = VersionNumber(0)
-        self._minor = VersionNumber(0)
-        self._patch = VersionNumber(0)
+        self._core = [0, 0, 0]
         self._pre = None
         self._build = None
+        self._str = None
 
     @property
     def major(self) -> int:
@@ -342,11 +360,12 @@ class Version(Core):
         Sets major version number if positive
         """
 
-        return self._major.number
+        return self._core[0]
 
     @major.setter
     def major(self, num: t.Union[int, VersionNumber]) -> None:
-        self._major = self._conv_type(num, VersionNumber)
+        self._core[0] = self._conv_number(num)
+        self._str = None
 
     @property
     def minor(self) -> int:
@@ -357,11 +376,12 @@ class Version(Core):
         Sets minor version number if positive
         """
 
-        return self._minor.number
+        return self._core[1]
 
     @minor.setter
     def minor(self, num: t.Union[int, VersionNumber]) -> None:
-        self._minor = self._conv_type(num, VersionNumber)
+        self._core[1] = self._conv_number(num)
+        self._str = None
 
     @property
     def patch(self) -> int:
@@ -372,11 +392,12 @@ class Version(Core):
         Sets patch version number if positive
         """
 
-        return self._patch.number
+        return self._core[2]
 
     @patch.setter
     def patch(self, num: t.Union[int, VersionNumber]) -> None:
-        self._patch = self._conv_type(num, VersionNumber)
+        self._core[2] = self._conv_number(num)
+        self._str = None
 
     @property
     def pre(self) -> t.Optional[str]:
@@ -397,6 +418,7 @@ class Version(Core):
     @pre.setter
     def pre(self, pre: t.Optional[t.Union[str, Pre]]) -> None:
         self._pre = self._conv_type(pre, Pre)
+        self._str = None
 
     @property
     def pre_digit(self) -> t.Optional[int]:
@@ -435,6 +457,7 @@ class Version(Core):
     @build.setter
     def build(self, build: t.Optional[t.Union[str, Pre]]) -> None:
         self._build = self._conv_type(build, Build)
+        self._str = None
 
     @property
     def has_build(self) -> bool:
@@ -519,6 +542,70 @@ class Version(Core):
 
         return self.major > 0 and self.is_final
 
+    @property
+    def packed(self) -> t.Optional[int]:
+        """Packed 64-bit key of the version (see semver.keys.pack())
+
+        Packed keys compare and hash as plain ints. They are exact for versions \
+        without a pre-release label; pre-releases with the same major, minor, \
+        and patch versions have the same key.
+
+        If any version number is bigger than semver.keys.PACK_MAX, returns None.
+        """
+
+        return pack(self.major, self.minor, self.patch, self._pre is not None)
+
+    def copy(self) -> Version:
+        """Returns a copy of the version that can be changed independently
+
+        Returns:
+            Version: The copy (always a mutable Version)
+        """
+
+        return self._copy(Version)
+
+    def freeze(self) -> FrozenVersion:
+        """Returns an immutable copy of the version
+
+        Returns:
+            FrozenVersion: The immutable copy
+        """
+
+        return self._copy(FrozenVersion)
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickles only the components (see _from_parts())"""
+
+        return (_from_parts, (*self._core, self.pre, self.build, type(self)))
+
+    def _copy(self, cls: t.Type[_V]) -> _V:
+        """Copies the version into a new object of type cls without \
+        validating the components again
+        """
+
+        ret = cls.__new__(cls)
+        ret._core = self._core[:]
+        ret._pre = None if self._pre is None else self._pre._copy()
+        # Version never changes a Build object in place
+        ret._build = self._build
+        ret._str = self._str
+
+        return ret
+
+    def _conv_number(self, val: t.Union[int, VersionNumber]) -> int:
+        """Checks that val is a positive int (or unwraps a VersionNumber)"""
+
+        if isinstance(val, VersionNumber):
+            return val.number
+
+        if not isinstance(val, int):
+            raise TypeError(EXC_MUST_TYPE.format("int", type(val)))
+
+        if val < 0:
+            raise NegativeValueException(EXC_MUST_POSITIVE.format(val))
+
+        return val
+
     def _conv_type(self, val: t.Any, cls: t.Type) -> t.Any:
         """If val is of type cls, then returns. Otherwise converts to cls type"""
 
@@ -531,6 +618,104 @@ class Version(Core):
         return cls(val)
 
 
+_V = t.TypeVar("_V", bound=Version)
+
+
+class FrozenVersion(Version):
+    """An immutable version that can be hashed (and used in sets or as dict keys)
+
+    Everything that would change the version (inc(), dec(), remove_pre(), \
+    remove_build(), reset(), the +, - operators, and the setters) raises \
+    InvalidOperationException instead. Use copy() to get a Version that \
+    can be changed.
+
+    Frozen versions are equal to (and hash the same as) other frozen versions \
+    with the same precedence, so build labels are ignored.
+    """
+
+    def __hash__(self) -> int:
+        return hash((*self._core, self.pre))
+
+    def __add__(self, other: t.Any) -> Version:
+        self._raise_frozen()
+
+    def __sub__(self, other: t.Any) -> Version:
+        self._raise_frozen()
+
+    def inc(self, pos: t.Optional[VPos] = None, amount: int = 1) -> None:
+        self._raise_frozen()
+
+    def dec(self, pos: t.Optional[VPos] = None, amount: int = 1) -> None:
+        self._raise_frozen()
+
+    def remove_pre(self) -> None:
+        self._raise_frozen()
+
+    def remove_build(self) -> None:
+        self._raise_frozen()
+
+    def reset(self) -> None:
+        self._raise_frozen()
+
+    def freeze(self) -> FrozenVersion:
+        """Returns the version itself (it is already immutable)"""
+
+        return self
+
+    @property
+    def major(self) -> int:
+        """Major version number (read-only)"""
+
+        return self._core[0]
+
+    @major.setter
+    def major(self, num: t.Union[int, VersionNumber]) -> None:
+        self._raise_frozen()
+
+    @property
+    def minor(self) -> int:
+        """Minor version number (read-only)"""
+
+        return self._core[1]
+
+    @minor.setter
+    def minor(self, num: t.Union[int, VersionNumber]) -> None:
+        self._raise_frozen()
+
+    @property
+    def patch(self) -> int:
+        """Patch version number (read-only)"""
+
+        return self._core[2]
+
+    @patch.setter
+    def patch(self, num: t.Union[int, VersionNumber]) -> None:
+        self._raise_frozen()
+
+    @property
+    def pre(self) -> t.Optional[str]:
+        """Pre-release string, without the first hyphen (read-only)"""
+
+        return None if self._pre is None else self._pre.string
+
+    @pre.setter
+    def pre(self, pre: t.Optional[t.Union[str, Pre]]) -> None:
+        self._raise_frozen()
+
+    @property
+    def build(self) -> t.Optional[str]:
+        """Build/metadata string, without the first plus-sign (read-only)"""
+
+        return None if self._build is None else self._build.string
+
+    @build.setter
+    def build(self, build: t.Optional[t.Union[str, Pre]]) -> None:
+        self._raise_frozen()
+
+    def _raise_frozen(self) -> t.NoReturn:
+        raise InvalidOperationException(EXC_FROZEN.format(repr(self)))
+
+
 def parse_version(version: str) -> Version:
     """Parses a semantic version string into a Version class
 
@@ -549,8 +734,60 @@ def parse_version(version: str) -> Version:
     if not parsed:
         raise ParseException(EXC_INVALID_STR.format("semantic version", version))
 
-    # get versions from groups
-    major, minor, patch, pre, build = parsed.groups()
-    major, minor, patch = map(int, (major, minor, patch))
+    # the regex can match before a trailing newline, which is not rendered
+    string = version if parsed.end() == len(version) else None
+    return _from_groups(parsed.groups(), string)
+
+
+def _from_groups(
+    groups: t.Sequence[t.Optional[str]], string: t.Optional[str] = None
+) -> Version:
+    """Makes a Version from the (major, minor, patch, pre, build) regex groups \
+    of a valid version string (the whole string, if it was matched exactly)
+    """
+
+    major, minor, patch, pre, build = groups
+    assert major is not None and minor is not None and patch is not None
+
+    # the groups were checked by the regex, so they are not checked again
+    ret = Version.__new__(Version)
+    ret._core = [int(major), int(minor), int(patch)]
+    ret._pre = None if pre is None else Pre._from_valid(pre)
+    ret._build = None if build is None else Build._from_valid(build)
+
+    # a valid string is already rendered the same way (unless numbers use
+    # non-ASCII digits)
+    ret._str = string if string is not None and string.isascii() else None
+
+    return ret
+
+
+def _from_parts(
+    major: int,
+    minor: int,
+    patch: int,
+    pre: t.Optional[str],
+    build: t.Optional[str],
+    cls: t.Type[Version] = Version,
+) -> Version:
+    """Makes a version of type cls from components that were already checked \
+    (used to unpickle versions)
+    """
+
+    ret = cls.__new__(cls)
+    ret._core = [major, minor, patch]
+    ret._pre = None if pre is None else Pre._from_valid(pre)
+    ret._build = None if build is None else Build._from_valid(build)
+    ret._str = None
+
+    return ret
+
+
+def _is_view(other: t.Any) -> bool:
+    """If other is a VersionView (which compares itself with versions, so \
+    the operators of Version defer to it)
+    """
+
+    from .views import VersionView
 
-    return Version(major, minor, patch, pre, build)
+    return isinstance(other, VersionView)
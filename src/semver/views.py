@@ -0,0 +1,256 @@
+"""
+Versions in bytes buffers
+
+parse_bytes() finds a version in a bytes-like buffer (bytes, bytearray, \
+memoryview, or mmap) without decoding it. The VersionView it returns keeps \
+the buffer and the offsets of each component; numbers and labels are read \
+from the buffer when they are used:
+
+.. code-block:: py
+
+    import mmap
+    from semver import parse_bytes
+
+    with open("tags.txt", "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = parse_bytes(buf, 0, buf.find(b"\\n"))
+        view.major, view.pre  # read from the mapped file
+
+Only ASCII digits are allowed in buffers.
+"""
+
+import re
+import typing as t
+
+from .constants import EXC_INVALID_STR, EXC_MUST_CMP, RE_FULL
+from .exc import ParseException
+from .spans import pre_lt
+from .version import Version, _from_groups
+
+# with a bytes pattern, \d only matches ASCII digits; '^' is left out since
+# it only matches at the start of the buffer (match() starts at pos anyway)
+_FULL_BYTES_RE = re.compile(RE_FULL[1:].encode())
+
+# a bytes-like object that can be matched with a bytes regex and sliced
+# (bytes, bytearray, memoryview, mmap)
+Buffer = t.Any
+
+
+class VersionView:
+    """A read-only version that is stored in a bytes buffer
+
+    Views compare with other views by reading the buffers directly (version \
+    numbers are compared by their digits, and pre-release labels are only \
+    decoded when the version numbers are the same). Views can also be \
+    compared with Version objects.
+
+    The buffer must not be changed while a view of it is used.
+    """
+
+    __slots__ = ("_buffer", "_spans", "_version")
+
+    def __init__(
+        self, buffer: Buffer, start: int = 0, end: t.Optional[int] = None
+    ) -> None:
+        """Constructor
+
+        Args:
+            buffer (Buffer): A bytes-like object (bytes, bytearray, memoryview, \
+            mmap)
+            start (int, optional): Where the version starts. Defaults to 0.
+            end (Optional[int], optional): Where the version ends (a newline \
+            right before end is allowed). Defaults to the end of the buffer.
+
+        Raises:
+            ParseException: If buffer[start:end] is not a valid version
+        """
+
+        if end is None:
+            end = len(buffer)
+
+        parsed = _FULL_BYTES_RE.match(buffer, start, end)
+        if not parsed:
+            raise ParseException(
+                EXC_INVALID_STR.format(
+                    "semantic version",
+                    bytes(buffer[start:end]).decode(errors="replace"),
+                )
+            )
+
+        self._buffer = buffer
+        # (start, end) of major, minor, patch, pre, build; (-1, -1) for a
+        # label that does not exist
+        self._spans = (
+            *parsed.span(1),
+            *parsed.span(2),
+            *parsed.span(3),
+            *parsed.span(4),
+            *parsed.span(5),
+        )
+        self._version: t.Optional[Version] = None
+
+    def __repr__(self) -> str:
+        """repr of VersionView"""
+
+        return "VersionView(version='{}')".format(self)
+
+    def __str__(self) -> str:
+        return bytes(self).decode()
+
+    def __bytes__(self) -> bytes:
+        """The version, copied from the buffer"""
+
+        spans = self._spans
+        return bytes(self._buffer[spans[0] : max(spans[5], spans[7], spans[9])])
+
+    def __hash__(self) -> int:
+        # same as FrozenVersion
+        return hash((self.major, self.minor, self.patch, self.pre))
+
+    def __eq__(self, other: t.Any) -> bool:
+        """Compares equality (excluding build versions)"""
+
+        return self._compare(other) == 0
+
+    def __ne__(self, other: t.Any) -> bool:
+        return self._compare(other) != 0
+
+    def __lt__(self, other: t.Any) -> bool:
+        """Compares less than
+
+        https://semver.org/spec/v2.0.0.html#spec-item-11
+        """
+
+        return self._compare(other) < 0
+
+    def __le__(self, other: t.Any) -> bool:
+        return self._compare(other) <= 0
+
+    def __gt__(self, other: t.Any) -> bool:
+        return self._compare(other) > 0
+
+    def __ge__(self, other: t.Any) -> bool:
+        return self._compare(other) >= 0
+
+    @property
+    def major(self) -> int:
+        """Major version number"""
+
+        return int(self._slice(0))
+
+    @property
+    def minor(self) -> int:
+        """Minor version number"""
+
+        return int(self._slice(2))
+
+    @property
+    def patch(self) -> int:
+        """Patch version number"""
+
+        return int(self._slice(4))
+
+    @property
+    def pre(self) -> t.Optional[str]:
+        """Pre-release label, or None if it does not have one"""
+
+        if self._spans[6] == -1:
+            return None
+
+        return self._slice(6).decode()
+
+    @property
+    def build(self) -> t.Optional[str]:
+        """Build label, or None if it does not have one"""
+
+        if self._spans[8] == -1:
+            return None
+
+        return self._slice(8).decode()
+
+    @property
+    def version(self) -> Version:
+        """The version as a Version object (made on first use, and should not \
+        be modified)
+        """
+
+        if self._version is None:
+            self._version = _from_groups(
+                (
+                    self._slice(0).decode(),
+                    self._slice(2).decode(),
+                    self._slice(4).decode(),
+                    self.pre,
+                    self.build,
+                ),
+                str(self),
+            )
+
+        return self._version
+
+    def _slice(self, index: int) -> bytes:
+        """Bytes between self._spans[index] and self._spans[index + 1]"""
+
+        return bytes(self._buffer[self._spans[index] : self._spans[index + 1]])
+
+    def _compare(self, other: t.Any) -> int:
+        """-1, 0, or 1 if self is lower than, equal to, or higher than other"""
+
+        if isinstance(other, Version):
+            lhs = self.version
+            if lhs == other:
+                return 0
+            return -1 if lhs < other else 1
+
+        if not isinstance(other, VersionView):
+            raise TypeError(EXC_MUST_CMP.format("VersionView", type(other)))
+
+        spans = self._spans
+        ospans = other._spans
+
+        for i in (0, 2, 4):
+            # digits have no leading zeros, so a longer number is larger
+            length = spans[i + 1] - spans[i]
+            olength = ospans[i + 1] - ospans[i]
+            if length != olength:
+                return -1 if length < olength else 1
+
+        # every number has the same length as in other (and the dots are in
+        # the same places), so the version cores compare like their bytes
+        core = bytes(self._buffer[spans[0] : spans[5]])
+        ocore = bytes(other._buffer[ospans[0] : ospans[5]])
+        if core != ocore:
+            return -1 if core < ocore else 1
+
+        if spans[6] == -1 or ospans[6] == -1:
+            return (spans[6] == -1) - (ospans[6] == -1)
+
+        # Version compares labels as strings for equality, and by precedence
+        # for less than
+        pre = self._slice(6).decode()
+        opre = other._slice(6).decode()
+        if pre == opre:
+            return 0
+
+        return -1 if pre_lt(pre, opre) else 1
+
+
+def parse_bytes(
+    buffer: Buffer, start: int = 0, end: t.Optional[int] = None
+) -> VersionView:
+    """Parses a version in a bytes-like buffer without copying it
+
+    Args:
+        buffer (Buffer): A bytes-like object (bytes, bytearray, memoryview, mmap)
+        start (int, optional): Where the version starts. Defaults to 0.
+        end (Optional[int], optional): Where the version ends (a newline right \
+        before end is allowed). Defaults to the end of the buffer.
+
+    Raises:
+        ParseException: If buffer[start:end] is not a valid version
+
+    Returns:
+        VersionView: A view of the version in the buffer
+    """
+
+    return VersionView(buffer, start, end)
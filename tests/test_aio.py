@@ -0,0 +1,161 @@
+"""
+semver.aio: parse_stream(), valid_stream(), sort_versions(), max_version()
+"""
+
+import asyncio
+import concurrent.futures
+import random
+
+import pytest
+import semver.bulk
+from semver import aio
+from semver.exc import ParseException
+from semver.keys import sort_key
+from semver.version import parse_version
+
+_LINES = ["1.2.3\n", "1.0.0-rc.1\r\n", "\n", "2.0.0+b", "1.2", "v1.2.3\n", "0.1.0\n"]
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(agen):
+    return [batch async for batch in agen]
+
+
+def _corpus(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        "{}.{}.{}{}".format(
+            rng.randrange(4),
+            rng.randrange(4),
+            rng.randrange(4),
+            rng.choice(["", "-rc.1", "-rc.2", "-alpha", "+b1", "-1+b2"]),
+        )
+        for _ in range(count)
+    ]
+
+
+class TestParseStream:
+    @pytest.mark.parametrize("errors", ["skip", "none"])
+    @pytest.mark.parametrize("batch_size", [1, 2, 3, 100])
+    def test_same_as_bulk(self, errors, batch_size):
+        batches = asyncio.run(
+            _collect(aio.parse_stream(_aiter(_LINES), batch_size, errors))
+        )
+
+        lines = [line.rstrip("\r\n") for line in _LINES if line.strip()]
+        expected = semver.bulk.parse_many(lines, errors)
+        assert [v for batch in batches for v in batch] == expected
+        assert all(batch for batch in batches)
+        if errors == "none":
+            assert [len(batch) for batch in batches[:-1]] == [batch_size] * (
+                len(batches) - 1
+            )
+
+    def test_bytes(self):
+        lines = [line.encode() for line in ["1.2.3\n", "1.0.0-rc.1\r\n", "\n"]]
+        batches = asyncio.run(_collect(aio.parse_stream(_aiter(lines))))
+        assert batches == [[parse_version("1.2.3"), parse_version("1.0.0-rc.1")]]
+
+    def test_strict(self):
+        with pytest.raises(ParseException):
+            asyncio.run(_collect(aio.parse_stream(_aiter(_LINES))))
+
+    @pytest.mark.parametrize("kwargs", [{"errors": "ignore"}, {"batch_size": 0}])
+    def test_bad_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            asyncio.run(_collect(aio.parse_stream(_aiter(_LINES), **kwargs)))
+
+    def test_executor(self):
+        lines = [line + "\n" for line in _corpus(50)]
+
+        async def run():
+            with concurrent.futures.ThreadPoolExecutor(2) as executor:
+                return await _collect(
+                    aio.parse_stream(_aiter(lines), 7, executor=executor)
+                )
+
+        batches = asyncio.run(run())
+        assert [len(batch) for batch in batches] == [7] * 7 + [1]
+        assert [str(v) for batch in batches for v in batch] == [
+            line[:-1] for line in lines
+        ]
+
+    def test_backpressure(self):
+        read = []
+
+        async def lines():
+            for line in _corpus(100):
+                read.append(line)
+                yield line
+
+        async def run():
+            stream = aio.parse_stream(lines(), 10)
+            await stream.__anext__()
+            count = len(read)
+            await stream.aclose()
+            return count
+
+        # only the first batch has been read
+        assert asyncio.run(run()) == 10
+
+    def test_yields_to_loop(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def run():
+            task = asyncio.ensure_future(ticker())
+            await _collect(aio.parse_stream(_aiter(_corpus(100)), 10))
+            task.cancel()
+
+        asyncio.run(run())
+        assert len(ticks) >= 10
+
+
+def test_valid_stream():
+    batches = asyncio.run(_collect(aio.valid_stream(_aiter(_LINES), 4)))
+    assert batches == [[True, True, True, False], [False, True]]
+
+
+class TestSortVersions:
+    @pytest.mark.parametrize("batch_size", [1, 3, 64, 1000])
+    def test_same_as_sorted(self, batch_size):
+        strings = _corpus(500, seed=1)
+        result = asyncio.run(aio.sort_versions(strings, batch_size))
+
+        # stable, like sorted()
+        assert result == sorted(strings, key=sort_key)
+
+    def test_versions(self):
+        versions = [parse_version(v) for v in _corpus(100, seed=2)]
+        result = asyncio.run(aio.sort_versions(versions, 16))
+        assert result == sorted(versions, key=sort_key)
+
+    def test_invalid(self):
+        with pytest.raises(ParseException):
+            asyncio.run(aio.sort_versions(["1.2.3", "1.2"]))
+
+    def test_empty(self):
+        assert asyncio.run(aio.sort_versions([])) == []
+
+
+class TestMaxVersion:
+    @pytest.mark.parametrize("batch_size", [1, 3, 1000])
+    def test_same_as_max(self, batch_size):
+        strings = _corpus(300, seed=3)
+        result = asyncio.run(aio.max_version(strings, batch_size))
+        assert result is max(strings, key=sort_key)
+
+    def test_empty(self):
+        assert asyncio.run(aio.max_version([])) is None
+
+    def test_bad_batch_size(self):
+        with pytest.raises(ValueError):
+            asyncio.run(aio.max_version(["1.2.3"], 0))
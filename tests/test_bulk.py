@@ -0,0 +1,223 @@
+"""
+VersionArray, parse_many(), clean_many(), clean_and_parse_many(), pack_many(), \
+parse_file(), parse_file_array(), packed keys
+"""
+
+import random
+
+import pytest
+import semver.bulk
+from semver.bulk import (
+    VersionArray,
+    clean_and_parse_many,
+    clean_many,
+    pack_many,
+    parse_file,
+    parse_file_array,
+    parse_many,
+)
+from semver.exc import ParseException
+from semver.keys import PACK_MAX, PACK_OVERFLOW, pack, unpack
+from semver.version import Version, parse_version
+
+
+@pytest.mark.parametrize(
+    "major, minor, patch, has_pre",
+    [(0, 0, 0, False), (1, 2, 3, True), (PACK_MAX, PACK_MAX, PACK_MAX, False)],
+)
+def test_pack_unpack(major, minor, patch, has_pre):
+    key = pack(major, minor, patch, has_pre)
+    assert key is not None and 0 <= key < PACK_OVERFLOW
+    assert unpack(key) == (major, minor, patch, has_pre)
+
+
+@pytest.mark.parametrize(
+    "v",
+    ["{}.0.0".format(PACK_MAX + 1), "0.{}.0".format(PACK_MAX + 1), "0.0.1" + "0" * 8],
+)
+def test_packed_overflow(v):
+    assert parse_version(v).packed is None
+
+
+@pytest.mark.parametrize(
+    "lhs, rhs",
+    [
+        ("1.2.3", "1.2.4"),
+        ("1.2.3-alpha", "1.2.3"),
+        ("1.2.3", "1.3.0-rc.1"),
+        ("0.999.999", "1.0.0"),
+    ],
+)
+def test_packed_order(lhs, rhs):
+    assert parse_version(lhs).packed < parse_version(rhs).packed
+
+
+def test_packed_same_core_pre():
+    assert parse_version("1.2.3-alpha").packed == parse_version("1.2.3-beta").packed
+
+
+def test_parse_many():
+    strings = ["1.2.3", "bad", "2.0.0-rc.1"]
+
+    with pytest.raises(ParseException):
+        parse_many(strings)
+
+    assert [str(v) for v in parse_many(strings, errors="skip")] == [
+        "1.2.3",
+        "2.0.0-rc.1",
+    ]
+
+    res = parse_many(strings, errors="none")
+    assert res[1] is None
+    assert str(res[2]) == "2.0.0-rc.1"
+
+
+def test_clean_many():
+    strings = [" v1.2.3 ", "=v 1.0.0", "v=2.0.0-rc.1+b\n"]
+
+    with pytest.raises(ParseException, match=" 1.0.0"):
+        clean_many(strings)
+
+    assert clean_many(strings, errors="skip") == ["1.2.3", "2.0.0-rc.1+b"]
+    assert clean_many(strings, errors="none") == ["1.2.3", None, "2.0.0-rc.1+b"]
+
+
+def test_clean_and_parse_many():
+    strings = [" v1.2.3 ", "=v 1.0.0", "v=2.0.0-rc.1+b\n"]
+
+    with pytest.raises(ParseException, match=" 1.0.0"):
+        clean_and_parse_many(strings)
+
+    res = clean_and_parse_many(strings, errors="none")
+    assert str(res[0]) == "1.2.3"
+    assert res[1] is None
+    assert str(res[2]) == "2.0.0-rc.1+b"
+    assert clean_and_parse_many(strings, errors="skip") == [res[0], res[2]]
+
+
+@pytest.fixture
+def version_file(tmp_path):
+    """Writes a file of versions and returns its path"""
+
+    def write(data):
+        path = tmp_path / "versions.txt"
+        path.write_bytes(data)
+        return path
+
+    return write
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 7, 1 << 20])
+def test_parse_file(version_file, monkeypatch, block_size):
+    monkeypatch.setattr(semver.bulk, "FILE_BLOCK_SIZE", block_size)
+    strings = ["1.2.3", "10.20.30-rc.1+build.5", "0.0.0", "2.0.0-alpha"] * 5
+    path = version_file(("\n".join(strings) + "\n").encode())
+
+    res = list(parse_file(path))
+    assert all(type(v) is Version for v in res)
+    assert [str(v) for v in res] == strings
+    assert [str(v) for v in parse_file_array(path)] == strings
+
+    # str path, no newline at the end
+    path = version_file("\n".join(strings).encode())
+    assert [str(v) for v in parse_file(str(path))] == strings
+
+
+def test_parse_file_lines(version_file):
+    path = version_file(b"\n1.2.3\r\n\n\r\n  \n2.0.0-rc.1\n\n")
+
+    with pytest.raises(ParseException, match="  "):
+        list(parse_file(path))
+
+    assert [str(v) for v in parse_file(path, errors="skip")] == ["1.2.3", "2.0.0-rc.1"]
+    assert [str(v) for v in parse_file_array(path, errors="skip")] == [
+        "1.2.3",
+        "2.0.0-rc.1",
+    ]
+
+    res = list(parse_file(path, errors="none"))
+    assert len(res) == 3
+    assert res[1] is None
+
+
+def test_parse_file_empty(version_file):
+    path = version_file(b"")
+    assert list(parse_file(path)) == []
+    assert len(parse_file_array(path)) == 0
+
+
+def test_parse_file_not_utf8(version_file):
+    path = version_file(b"1.2.3\n1.2.\xff\n")
+
+    with pytest.raises(ParseException):
+        list(parse_file(path))
+    assert [str(v) for v in parse_file(path, errors="skip")] == ["1.2.3"]
+
+
+def test_parse_file_array_none(version_file):
+    with pytest.raises(ValueError, match="cannot fill a VersionArray"):
+        parse_file_array(version_file(b"1.2.3\n"), errors="none")
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        parse_many,
+        clean_many,
+        clean_and_parse_many,
+        parse_file,
+        parse_file_array,
+    ],
+)
+def test_bad_error_policy(func):
+    with pytest.raises(ValueError, match="Unknown error policy: 'ignore'"):
+        func(["1.2.3"], errors="ignore")
+
+
+def test_parse_file_bad_error_policy(version_file):
+    # raised by the call, before the file is read
+    with pytest.raises(ValueError, match="Unknown error policy: 'bogus'"):
+        parse_file(version_file(b"1.2.3\n"), errors="bogus")
+
+
+def test_pack_many():
+    keys, overflow = pack_many(["1.2.3", Version(2, 0, 0), "1.10000000.0"])
+    assert keys.typecode == "Q"
+    assert list(keys[:2]) == [pack(1, 2, 3, False), pack(2, 0, 0, False)]
+    assert keys[2] == PACK_OVERFLOW
+    assert overflow == [2]
+
+
+class TestVersionArray:
+    def test_columns(self):
+        arr = VersionArray(["1.2.3-rc.1+b5", Version(4, 5, 6)])
+        assert len(arr) == 2
+        assert arr.major == [1, 4]
+        assert arr.minor == [2, 5]
+        assert arr.patch == [3, 6]
+        assert arr.pre == ["rc.1", None]
+        assert arr.build == ["b5", None]
+        assert str(arr[0]) == "1.2.3-rc.1+b5"
+        assert [str(v) for v in arr] == ["1.2.3-rc.1+b5", "4.5.6"]
+
+    def test_error(self):
+        with pytest.raises(ParseException):
+            VersionArray(["1.2.3", "1.2"])
+
+    @pytest.mark.parametrize(
+        "extra", [[], ["1.0.0-rc.1", "1.0.0-alpha", "0.5.0-0"], ["3.10000000.0"]]
+    )
+    def test_sort(self, extra):
+        rng = random.Random(3)
+        strings = [
+            "{}.{}.{}".format(rng.randrange(5), rng.randrange(5), rng.randrange(5))
+            for _ in range(200)
+        ] + extra
+        rng.shuffle(strings)
+
+        arr = VersionArray(strings)
+        order = arr.argsort()
+        assert [strings[i] for i in order] == sorted(strings, key=parse_version)
+
+        arr.sort()
+        assert [str(v) for v in arr] == sorted(strings, key=parse_version)
@@ -54,6 +54,8 @@ def test_error_bump_no_pre_digit():
         ("2.5.3-alpha.52+meta34", VPos.MINOR, 2, "2.7.3-alpha.52+meta34"),
         ("2.5.3-alpha.52+meta34", VPos.PATCH, 9, "2.5.12-alpha.52+meta34"),
         ("2.5.3-alpha.52+meta34", VPos.PRE, 3, "2.5.3-alpha.55+meta34"),
+        ("2.5.3-alpha.52+meta34", VPos.PRE, 100000, "2.5.3-alpha.100052+meta34"),
+        ("2.5.3-alpha", VPos.PRE, 0, "2.5.3-alpha"),
     ],
 )
 def test_bump_no_carry(orig, pos, amt, res):
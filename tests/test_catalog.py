@@ -0,0 +1,232 @@
+"""
+VersionCatalog, ConcurrentCatalog, CatalogSnapshot
+"""
+
+import random
+import threading
+
+import pytest
+from semver import CatalogSnapshot, ConcurrentCatalog, VersionCatalog
+from semver.catalog import CHANNELS
+from semver.exc import ParseException
+from semver.keys import sort_key
+from semver.ranges import Range
+from semver.version import FrozenVersion, Version, parse_version
+
+_PACKAGES = ["requests", "flask", "numpy"]
+
+
+def _entries(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        (
+            rng.choice(_PACKAGES),
+            "{}.{}.{}{}{}".format(
+                rng.randrange(4),
+                rng.randrange(4),
+                rng.randrange(4),
+                rng.choice(["", "", "-rc.1", "-rc.2", "-beta", "-alpha.1", "-1"]),
+                rng.choice(["", "", "+b1", "+b2"]),
+            ),
+        )
+        for _ in range(count)
+    ]
+
+
+def _expected(entries, package):
+    # first of each string, stably sorted by precedence
+    seen = []
+    for p, v in entries:
+        if p == package and v not in seen:
+            seen.append(v)
+    return sorted(seen, key=sort_key)
+
+
+def _strs(versions):
+    return [str(v) for v in versions]
+
+
+@pytest.fixture(scope="module")
+def entries():
+    return _entries(400)
+
+
+@pytest.fixture(params=["update", "add", "concurrent", "snapshot"])
+def catalog(request, entries):
+    if request.param == "update":
+        return VersionCatalog(entries)
+    if request.param == "concurrent":
+        return ConcurrentCatalog(entries)
+
+    ret = VersionCatalog() if request.param == "add" else ConcurrentCatalog()
+    for package, version in entries:
+        ret.add(package, version)
+    return ret if request.param == "add" else ret.snapshot()
+
+
+@pytest.fixture(params=[VersionCatalog, ConcurrentCatalog])
+def cls(request):
+    return request.param
+
+
+class TestQueries:
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test_versions(self, catalog, entries, package):
+        assert _strs(catalog.versions(package)) == _expected(entries, package)
+        assert all(isinstance(v, FrozenVersion) for v in catalog.versions(package))
+
+    @pytest.mark.parametrize("channel", [None] + list(CHANNELS))
+    @pytest.mark.parametrize("major", [None, 0, 2, 9])
+    def test_latest(self, catalog, entries, channel, major):
+        expected = [
+            v
+            for v in _expected(entries, "flask")
+            if (channel is None or CHANNELS[channel](parse_version(v)))
+            and (major is None or parse_version(v).major == major)
+        ]
+        latest = catalog.latest("flask", channel=channel, major=major)
+        assert (None if latest is None else str(latest)) == (
+            expected[-1] if expected else None
+        )
+
+    @pytest.mark.parametrize(
+        "expression", ["*", "1.x", "^1.2", "~0.2.1", "<1.0.0 || >=3.0.0-0", ">3 <1"]
+    )
+    def test_select(self, catalog, entries, expression):
+        expected = [v for v in _expected(entries, "numpy") if Range(expression).test(v)]
+        assert _strs(catalog.select("numpy", expression)) == expected
+        assert _strs(catalog.select("numpy", Range(expression))) == expected
+
+    def test_missing_package(self, catalog):
+        assert "django" not in catalog and "flask" in catalog
+        assert catalog.versions("django") == []
+        assert catalog.latest("django") is None
+        assert catalog.select("django", "*") == []
+
+    def test_bad_channel(self, catalog):
+        with pytest.raises(ValueError, match="Unknown release channel"):
+            catalog.latest("flask", channel="nightly")
+
+
+class TestChanges:
+    def test_add(self, cls):
+        catalog = cls([("a", "1.0.0"), ("a", "2.0.0-rc.1")])
+        assert str(catalog.latest("a")) == "2.0.0-rc.1"
+        assert str(catalog.latest("a", channel="stable")) == "1.0.0"
+
+        assert catalog.add("a", Version(2, 0, 0))
+        assert not catalog.add("a", "2.0.0")
+        assert str(catalog.latest("a", channel="stable")) == "2.0.0"
+        assert _strs(catalog.versions("a")) == ["1.0.0", "2.0.0-rc.1", "2.0.0"]
+
+    def test_builds(self, cls):
+        catalog = cls()
+        assert catalog.add("a", "1.0.0+b2")
+        assert catalog.add("a", "1.0.0+b1")
+        assert catalog.update([("a", "1.0.0+b2"), ("a", "1.0.0"), ("a", "1.0.0")]) == 1
+        assert _strs(catalog.versions("a")) == ["1.0.0+b2", "1.0.0+b1", "1.0.0"]
+        assert str(catalog.latest("a", channel="final")) == "1.0.0"
+
+    def test_discard(self, cls):
+        catalog = cls([("a", "1.0.0"), ("a", "1.1.0-rc.1"), ("b", "1.0.0")])
+        assert catalog.discard("a", "1.1.0-rc.1")
+        assert not catalog.discard("a", "1.1.0-rc.1")
+        assert not catalog.discard("c", "1.0.0")
+        assert catalog.latest("a", channel="rc") is None
+        assert str(catalog.latest("a")) == "1.0.0"
+
+        assert catalog.discard("b", Version(1, 0, 0))
+        assert list(catalog.packages()) == ["a"] and len(catalog) == 1
+
+    def test_invalid(self, cls):
+        catalog = cls([("a", "1.0.0")])
+        with pytest.raises(ParseException):
+            catalog.add("b", "1.2")
+        with pytest.raises(ParseException):
+            catalog.update([("a", "2.0.0"), ("a", "1.2.3.4")])
+
+        assert list(catalog.packages()) == ["a"]
+        assert _strs(catalog.versions("a")) == ["1.0.0"]
+
+    def test_copies(self, cls):
+        version = Version(1, 2, 3)
+        catalog = cls([("a", version)])
+        version.major = 5
+        catalog.versions("a").clear()
+        assert _strs(catalog.versions("a")) == ["1.2.3"]
+
+
+class TestConcurrent:
+    def test_snapshots(self):
+        catalog = ConcurrentCatalog([("a", "1.0.0"), ("b", "1.0.0")])
+        before = catalog.snapshot()
+        assert isinstance(before, CatalogSnapshot)
+
+        catalog.add("a", "2.0.0")
+        catalog.update([("b", "2.0.0"), ("c", "1.0.0")])
+        catalog.discard("a", "1.0.0")
+
+        # old snapshots do not change
+        assert _strs(before.versions("a")) == ["1.0.0"]
+        assert _strs(before.versions("b")) == ["1.0.0"] and "c" not in before
+        after = catalog.snapshot()
+        assert _strs(after.versions("a")) == ["2.0.0"]
+        assert _strs(after.versions("b")) == ["1.0.0", "2.0.0"] and "c" in after
+        assert str(catalog.latest("b")) == "2.0.0"
+
+        # unchanged packages are shared, and unchanged catalogs keep the snapshot
+        catalog.add("a", "3.0.0")
+        assert catalog.snapshot()._packages["b"] is after._packages["b"]
+        snapshot = catalog.snapshot()
+        assert not catalog.add("a", "3.0.0") and not catalog.discard("a", "9.0.0")
+        assert catalog.update([]) == 0
+        assert catalog.snapshot() is snapshot
+
+    def test_shared_lists(self):
+        catalog = ConcurrentCatalog([("a", "1.0.0"), ("a", "2.0.0-rc.1")])
+        before = catalog.snapshot()._packages["a"]
+
+        # only the lists of the channels that change are copied
+        catalog.add("a", "2.0.0-beta.1")
+        after = catalog.snapshot()._packages["a"]
+        assert after.channels["stable"] is before.channels["stable"]
+        assert after.channels["rc"] is before.channels["rc"]
+        assert after.channels["pre"] is not before.channels["pre"]
+        assert _strs(before.channels["pre"].versions) == ["2.0.0-rc.1"]
+
+        catalog.discard("a", "2.0.0-rc.1")
+        last = catalog.snapshot()._packages["a"]
+        assert "rc" not in last.channels and "rc" in after.channels
+        assert last.channels["beta"] is after.channels["beta"]
+        assert _strs(last.all.versions) == ["1.0.0", "2.0.0-beta.1"]
+
+    def test_threads(self):
+        catalog = ConcurrentCatalog([("a", "1.0.0")])
+        done = threading.Event()
+        errors = []
+
+        def write():
+            for minor in range(1, 200):
+                catalog.add("a", "1.{}.0-rc.1".format(minor))
+                catalog.add("a", "1.{}.0".format(minor))
+            done.set()
+
+        def read():
+            while not done.is_set():
+                snapshot = catalog.snapshot()
+                versions = snapshot.versions("a")
+                stable = snapshot.latest("a", channel="stable")
+                # a snapshot is consistent: the latest stable version is the
+                # last or the one before the latest pre-release
+                if stable is None or str(stable) not in _strs(versions[-2:]):
+                    errors.append((stable, versions[-2:]))
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        writer = threading.Thread(target=write)
+        for thread in readers + [writer]:
+            thread.start()
+        for thread in readers + [writer]:
+            thread.join()
+
+        assert errors == []
+        assert str(catalog.latest("a")) == "1.199.0"
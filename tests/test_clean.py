@@ -2,9 +2,13 @@
 clean(), clean_and_parse()
 """
 
+import random
+import re
+
 import pytest
 from semver.exc import ParseException
 from semver.operations import clean, clean_and_parse
+from semver.version import parse_version
 
 
 @pytest.mark.parametrize(
@@ -101,3 +105,38 @@ def test_clean_and_good_parse(s, res):
 def test_clean_and_bad_parse_error(s):
     with pytest.raises(ParseException):
         clean_and_parse(s)
+
+
+def _old_clean(version):
+    version = version.strip()
+    return re.sub(r"^[v=]+", r"", version)
+
+
+def _result(func, *args):
+    """str() of the result of func, or the type and message of the exception"""
+
+    try:
+        return str(func(*args))
+    except Exception as e:
+        return type(e), str(e)
+
+
+def test_same_as_separate_passes():
+    rng = random.Random(0)
+    parts = [" ", "\t", "\n", "\u3000", "\x1c", "v", "=", "V", "1.2.3", "-rc.1"]
+    parts += ["+b", "x", "01", "\u0661", ".", ""]
+
+    corpus = [
+        "".join(rng.choice(parts) for _ in range(rng.randint(0, 6)))
+        for _ in range(20000)
+    ]
+
+    good = 0
+    for s in corpus:
+        expected = _result(lambda v: parse_version(_old_clean(v)), s)
+        assert clean(s) == _old_clean(s)
+        assert _result(clean_and_parse, s) == expected
+        good += isinstance(expected, str)
+
+    # both valid and invalid strings are tested
+    assert 0 < good < len(corpus)
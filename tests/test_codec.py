@@ -0,0 +1,174 @@
+"""
+semver.codec, pickling versions
+"""
+
+import copy
+import pickle
+import struct
+
+import pytest
+from semver import codec
+from semver.bulk import VersionArray
+from semver.constants import VPos
+from semver.version import FrozenVersion, Version, parse_version
+
+_VERSIONS = [
+    "0.0.0",
+    "1.2.3",
+    "1.2.3-rc.1",
+    "1.2.3+build.5",
+    "1.2.3-alpha-1.beta+exp.sha.5114f85",
+    "4294967295.0.0",
+    "4294967296.1.2-rc",
+    "0.0.18446744073709551615",
+    "18446744073709551616.0.0-x+y",
+]
+
+
+def _same(lhs, rhs):
+    assert type(lhs) is type(rhs)
+    assert str(lhs) == str(rhs)
+    assert (lhs.major, lhs.minor, lhs.patch, lhs.pre, lhs.build) == (
+        rhs.major,
+        rhs.minor,
+        rhs.patch,
+        rhs.pre,
+        rhs.build,
+    )
+
+
+class TestPickle:
+    @pytest.mark.parametrize("v", _VERSIONS)
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_round_trip(self, v, protocol):
+        version = parse_version(v)
+        _same(pickle.loads(pickle.dumps(version, protocol)), version)
+
+        frozen = version.freeze()
+        loaded = pickle.loads(pickle.dumps(frozen, protocol))
+        _same(loaded, frozen)
+        assert hash(loaded) == hash(frozen)
+
+    def test_smaller(self):
+        version = parse_version("1.2.3-rc.1+build.5")
+        assert len(pickle.dumps(version)) < 100
+
+    def test_changed(self):
+        version = parse_version("1.2.3-rc.1")
+        version.inc(VPos.PRE)
+        loaded = pickle.loads(pickle.dumps(version))
+        assert str(loaded) == "1.2.3-rc.2"
+
+        # the pre-release can still be changed after loading
+        loaded.inc(VPos.PRE)
+        assert str(loaded) == "1.2.3-rc.3" and loaded.pre_digit == 3
+
+    def test_copy(self):
+        version = parse_version("1.2.3-rc.1")
+        for other in (copy.copy(version), copy.deepcopy(version)):
+            _same(other, version)
+            other.inc(VPos.PRE)
+            assert str(version) == "1.2.3-rc.1"
+
+
+class TestCodec:
+    @pytest.mark.parametrize("v", _VERSIONS)
+    def test_round_trip(self, v):
+        version = parse_version(v)
+        data = codec.encode(version)
+        _same(codec.decode(data), version)
+        _same(codec.decode(memoryview(data)), version)
+
+    def test_many(self):
+        versions = [parse_version(v) for v in _VERSIONS[:-1]]
+        data = codec.encode_many(versions)
+        for version, decoded in zip(versions, codec.decode_many(data)):
+            _same(decoded, version)
+
+        assert len(codec.decode_many(data)) == len(versions)
+        assert list(codec.decode_array(data)) == versions
+
+    @pytest.mark.parametrize("count", [1, 5])
+    def test_many_text(self, count):
+        versions = [Version(1 << 70, 0, i, "rc", "b") for i in range(count)]
+        data = codec.encode_many(versions)
+        assert data[:2] == codec._TEXT
+        assert [str(v) for v in codec.decode_many(data)] == [str(v) for v in versions]
+
+    def test_many_inputs(self):
+        versions = ["1.2.3", "1.0.0-rc.1+b"]
+        data = codec.encode_many(versions)
+        assert codec.encode_many(VersionArray(versions)) == data
+        assert codec.encode_many(parse_version(v) for v in versions) == data
+        assert [str(v) for v in codec.decode_many(data)] == versions
+
+    def test_empty(self):
+        assert codec.decode_many(codec.encode_many([])) == []
+        assert len(codec.decode_array(codec.encode_many([]))) == 0
+
+    @pytest.mark.parametrize(
+        "version, size",
+        [
+            (Version(1, 2, 3), 1),
+            (Version(255, 0, 0), 1),
+            (Version(256, 0, 0), 2),
+            (Version(0, 1 << 16, 0), 4),
+            (Version(0, 0, 1 << 32), 8),
+        ],
+    )
+    def test_widths(self, version, size):
+        assert len(codec.encode(version)) == 2 + 3 * size + 2
+
+        small = codec.encode_many([Version(1, 2, 3)] * 9 + [Version(0, 0, 0)])
+        large = codec.encode_many([Version(1, 2, 3)] * 9 + [version])
+        assert len(large) - len(small) == 10 * 3 * (size - 1)
+
+    def test_long_label(self):
+        version = Version(1, 2, 3, "a" * 300)
+        assert codec.encode(version)[:2] == b"BH"
+        _same(codec.decode(codec.encode(version)), version)
+        assert codec.decode_many(codec.encode_many([version] * 3)) == [version] * 3
+
+    def test_smaller_than_pickle(self):
+        versions = [parse_version("1.{}.3-rc.{}".format(i, i)) for i in range(100)]
+        assert len(codec.encode_many(versions)) * 2 < len(pickle.dumps(versions))
+
+    def test_frozen_decoded_as_version(self):
+        decoded = codec.decode(codec.encode(FrozenVersion(1, 2, 3)))
+        assert type(decoded) is Version
+
+
+class TestBadData:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"\x07",
+            b"XY" + bytes(10),
+            codec.encode(parse_version("1.2.3-rc"))[:-1],
+            codec.encode(parse_version("1.2.3-rc")) + b"x",
+            codec.encode(parse_version("1.2.3"))[:4],
+            b"TT1.2",
+            b"BB" + struct.pack("<3B2B", 1, 2, 3, 2, 0) + b"\xff",
+        ],
+    )
+    def test_decode(self, data):
+        with pytest.raises(ValueError, match="Invalid encoded version data"):
+            codec.decode(data)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"XY" + bytes(8),
+            codec.encode_many(["1.2.3-rc", "1.2.3"])[:-1],
+            codec.encode_many(["1.2.3-rc", "1.2.3"]) + b"x",
+            codec.encode_many(["1.2.3", "1.2.3"])[:14],
+            struct.pack("<2sQ", b"TT", 2) + b"1.2.3",
+            struct.pack("<2sQ", b"TT", 1) + b"1.2",
+        ],
+    )
+    def test_decode_many(self, data):
+        for func in (codec.decode_many, codec.decode_array):
+            with pytest.raises(ValueError, match="Invalid encoded version data"):
+                func(data)
@@ -0,0 +1,84 @@
+"""
+compare()
+"""
+
+import itertools
+
+import pytest
+from semver.exc import ParseException
+from semver.operations import compare
+from semver.version import parse_version
+
+VERSIONS = [
+    "0.0.0",
+    "1.0.0",
+    "1.0.0+build",
+    "1.0.0-0",
+    "1.0.0-1",
+    "1.0.0-2",
+    "1.0.0-10",
+    "1.0.0-1١",
+    "1.0.0-11",
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.10",
+    "1.0.0-alpha.beta",
+    "1.0.0-alpha.1.1",
+    "1.0.0-alpha-1",
+    "1.0.0-Alpha",
+    "1.0.0-rc.1+build.5",
+    "1.0.0-0alpha",
+    "1.0.0-alpha\n",
+    "1.0.1",
+    "1.1١.0",
+    "1.11.0",
+    "1.1.0",
+    "1.10.0",
+    "2.0.0",
+    "10.0.0",
+    "99999999999999999999.0.0",
+]
+
+
+def _compare_versions(lhs, rhs):
+    """compare() done with Version objects"""
+
+    vlhs = parse_version(lhs)
+    vrhs = parse_version(rhs)
+    if vlhs == vrhs:
+        return 0
+    elif vlhs < vrhs:
+        return -1
+    else:
+        return 1
+
+
+@pytest.mark.parametrize("lhs, rhs", list(itertools.product(VERSIONS, repeat=2)))
+def test_same_as_version(lhs, rhs):
+    assert compare(lhs, rhs) == _compare_versions(lhs, rhs)
+
+
+@pytest.mark.parametrize(
+    "lhs, rhs, res",
+    [
+        ("1.0.0-alpha", "1.0.0-alpha.1", -1),
+        ("1.0.0-alpha.1", "1.0.0-alpha.beta", -1),
+        ("1.0.0-beta.2", "1.0.0-beta.11", -1),
+        ("1.0.0-rc.1", "1.0.0", -1),
+        ("1.0.0+a", "1.0.0+b", 0),
+        ("2.1.1", "2.1.0", 1),
+    ],
+)
+def test_compare(lhs, rhs, res):
+    assert compare(lhs, rhs) == res
+    assert compare(rhs, lhs) == -res
+
+
+@pytest.mark.parametrize(
+    "lhs, rhs, bad", [("1.2", "1.0.0", "1.2"), ("1.0.0", "x", "x"), ("a", "b", "a")]
+)
+def test_invalid(lhs, rhs, bad):
+    with pytest.raises(ParseException) as e:
+        compare(lhs, rhs)
+
+    assert bad in str(e.value)
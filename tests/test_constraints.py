@@ -0,0 +1,108 @@
+"""
+RangeIndex
+"""
+
+import random
+
+import pytest
+from semver import RangeIndex
+from semver.exc import ParseException
+from semver.ranges import Range, range_cache
+from semver.version import parse_version
+
+
+def _version(rng):
+    return "{}.{}.{}{}".format(
+        rng.randrange(4),
+        rng.randrange(4),
+        rng.randrange(4),
+        rng.choice(["", "", "-rc.1", "-0", "-alpha"]),
+    )
+
+
+def _expressions(count, seed=0):
+    rng = random.Random(seed)
+    ret = []
+    for _ in range(count):
+        kind = rng.randrange(7)
+        if kind == 0:
+            ret.append("^" + _version(rng))
+        elif kind == 1:
+            ret.append("~" + _version(rng))
+        elif kind == 2:
+            ret.append(">={} <{}".format(_version(rng), _version(rng)))
+        elif kind == 3:
+            ret.append(
+                "{}{} || {}".format(
+                    rng.choice(["<", "<=", ">", ">="]), _version(rng), _version(rng)
+                )
+            )
+        elif kind == 4:
+            ret.append("{}.x".format(rng.randrange(4)))
+        elif kind == 5:
+            ret.append("{} - {}".format(_version(rng), _version(rng)))
+        else:
+            ret.append(rng.choice(["*", _version(rng), "^1.2 || ~1.2.1 || 1.x"]))
+    return ret
+
+
+@pytest.fixture(scope="module")
+def expressions():
+    return _expressions(500)
+
+
+@pytest.fixture(scope="module")
+def index(expressions):
+    return RangeIndex(expressions)
+
+
+@pytest.mark.parametrize("version", [_version(random.Random(i)) for i in range(40)])
+def test_match(index, expressions, version):
+    expected = [i for i, e in enumerate(expressions) if Range(e).test(version)]
+    assert sorted(index.match(version)) == expected
+    assert sorted(index.match(parse_version(version))) == expected
+    assert sorted(map(str, index.matching(version))) == sorted(
+        str(Range(expressions[i])) for i in expected
+    )
+
+
+@pytest.mark.parametrize(
+    "version", ["0.0.0-0", "0.0.0", "1.2.3-rc.1", "99999999999999999999.0.0"]
+)
+def test_edges(version):
+    expressions = [
+        "*",
+        "<1.2.3",
+        "<=1.2.3-rc.1",
+        ">1.2.3-rc.1",
+        ">=1.2.3-rc.1 <1.2.3-rc.1",
+        "<0.0.0-0",
+        ">=0.0.0-0",
+        ">99999999999999999999.0.0 || 99999999999999999999.x",
+    ]
+    expected = [i for i, e in enumerate(expressions) if Range(e).test(version)]
+    assert sorted(RangeIndex(expressions).match(version)) == expected
+
+
+def test_ranges():
+    index = RangeIndex(["^1.0.0", Range("~2.1.0")])
+    assert len(index) == 2
+    assert index[0].expression == "^1.0.0" and index[1].expression == "~2.1.0"
+    assert index.match("2.1.5") == [1] and index.matching("1.5.0") == [index[0]]
+
+    empty = RangeIndex([])
+    assert len(empty) == 0 and empty.match("1.0.0") == []
+
+
+def test_no_range_cache():
+    range_cache.cache_clear()
+    range_cache.get("^1.0.0")
+    RangeIndex(["^1.0.0", "~2.1.0"])
+    assert range_cache.cache_info()[:2] == (0, 1) and len(range_cache) == 1
+
+
+def test_invalid():
+    with pytest.raises(ParseException):
+        RangeIndex(["^1.0.0", "1.2.3.4"])
+    with pytest.raises(ParseException):
+        RangeIndex(["^1.0.0"]).match("1.2")
@@ -0,0 +1,212 @@
+"""
+semver.index: build(), open(), VersionIndex
+"""
+
+import os
+import random
+import stat
+import struct
+
+import pytest
+from semver import index
+from semver.exc import ParseException
+from semver.keys import sort_key
+from semver.ranges import Range
+from semver.version import Version, parse_version
+
+_PACKAGES = ["requests", "flask", "numpy", "émoji", "a"]
+
+
+def _entries(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        (
+            rng.choice(_PACKAGES),
+            "{}.{}.{}{}".format(
+                rng.randrange(4),
+                rng.randrange(4),
+                rng.randrange(4),
+                rng.choice(["", "", "-rc.1", "-alpha"]),
+            ),
+        )
+        for _ in range(count)
+    ]
+
+
+def _expected(entries, package):
+    return sorted((v for p, v in entries if p == package), key=sort_key)
+
+
+def _strs(versions):
+    return [str(v) for v in versions]
+
+
+@pytest.fixture(scope="module")
+def entries():
+    return _entries(500)
+
+
+@pytest.fixture(params=[index.CHUNK_SIZE, 7], ids=["one-chunk", "many-chunks"])
+def built(request, tmp_path, entries):
+    path = tmp_path / "catalog.idx"
+    assert index.build(entries, path, chunk_size=request.param) == len(entries)
+    with index.open(path) as idx:
+        yield idx
+
+
+class TestQueries:
+    def test_packages(self, built):
+        assert len(built) == len(_PACKAGES)
+        assert list(built.packages()) == sorted(_PACKAGES, key=lambda p: p.encode())
+        assert "flask" in built and "django" not in built
+
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test_tables(self, built, entries, package):
+        # equal versions keep the order they were given in
+        assert _strs(built[package]) == _expected(entries, package)
+
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test_latest(self, built, entries, package):
+        expected = _expected(entries, package)
+        assert str(built.latest(package)) == expected[-1]
+
+        stable = [v for v in expected if parse_version(v).is_stable]
+        assert str(built.latest_stable(package)) == stable[-1]
+
+    @pytest.mark.parametrize("version", ["0.0.0", "1.2.3", "2.0.0-rc.1", "9.9.9"])
+    def test_floor_ceiling(self, built, entries, version):
+        expected = _expected(entries, "numpy")
+        key = sort_key(version)
+
+        lower = [v for v in expected if sort_key(v) <= key]
+        floor = built.floor(version, "numpy")
+        assert (None if floor is None else str(floor)) == (lower[-1] if lower else None)
+
+        higher = [v for v in expected if sort_key(v) >= key]
+        ceiling = built.ceiling(parse_version(version), "numpy")
+        assert (None if ceiling is None else str(ceiling)) == (
+            higher[0] if higher else None
+        )
+
+    @pytest.mark.parametrize("expression", ["*", "^1.2", "~0.2.1", ">=3.0.0-0"])
+    def test_select(self, built, entries, expression):
+        expected = [v for v in _expected(entries, "émoji") if Range(expression).test(v)]
+        assert _strs(built.select(expression, "émoji")) == expected
+        assert _strs(built.select(Range(expression), "émoji")) == expected
+
+    def test_missing_package(self, built):
+        assert built.latest("django") is None
+        assert built.latest_stable("django") is None
+        assert built.floor("1.0.0", "django") is None
+        assert built.ceiling("1.0.0", "django") is None
+        assert list(built.select("*", "django")) == []
+
+        with pytest.raises(KeyError):
+            built["django"]
+
+    def test_invalid(self, built):
+        with pytest.raises(ParseException):
+            built.floor("1.2", "flask")
+        with pytest.raises(ParseException):
+            list(built.select("1.2.3.4", "flask"))
+
+
+class TestBuild:
+    def test_default_package(self, tmp_path):
+        path = tmp_path / "plain.idx"
+        index.build(["1.2.3", Version(1, 0, 0), "1.1.0-rc.1"], path)
+
+        with index.open(path) as idx:
+            assert list(idx.packages()) == [index.DEFAULT_PACKAGE]
+            assert _strs(idx[""]) == ["1.0.0", "1.1.0-rc.1", "1.2.3"]
+            assert str(idx.latest()) == "1.2.3"
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "empty.idx"
+        assert index.build([], path) == 0
+
+        with index.open(path) as idx:
+            assert len(idx) == 0 and list(idx.packages()) == []
+            assert idx.latest() is None
+
+    def test_replaces_file(self, tmp_path):
+        path = tmp_path / "catalog.idx"
+        index.build([("a", "1.0.0")], path)
+
+        with index.open(path) as old:
+            index.build([("a", "2.0.0")], path, chunk_size=1)
+            # the open index still maps the old file
+            assert str(old.latest("a")) == "1.0.0"
+
+        with index.open(path) as new:
+            assert str(new.latest("a")) == "2.0.0"
+        assert [p.name for p in tmp_path.iterdir()] == ["catalog.idx"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    @pytest.mark.parametrize("umask, mode", [(0o022, 0o644), (0o027, 0o640)])
+    def test_file_mode(self, tmp_path, umask, mode):
+        path = tmp_path / "catalog.idx"
+        old = os.umask(umask)
+        try:
+            index.build([("a", "1.0.0")], path)
+            # build() does not change the umask
+            assert os.umask(old) == umask
+        finally:
+            os.umask(old)
+
+        assert stat.S_IMODE(path.stat().st_mode) == mode
+
+    def test_no_stable(self, tmp_path):
+        path = tmp_path / "catalog.idx"
+        index.build([("a", "0.{}.0".format(minor)) for minor in range(1000)], path)
+        with index.open(path) as idx:
+            assert idx.latest_stable("a") is None
+            assert str(idx.latest("a")) == "0.999.0"
+
+        index.build([("a", "0.9.0"), ("a", "1.0.0-rc.1"), ("a", "2.0.0+b1")], path)
+        with index.open(path) as idx:
+            assert idx.latest_stable("a") is None
+            assert str(idx.latest("a")) == "2.0.0+b1"
+
+    def test_invalid(self, tmp_path):
+        path = tmp_path / "catalog.idx"
+        with pytest.raises(ParseException):
+            index.build([("a", "1.2.3"), ("a", "1.2")], path, chunk_size=1)
+        with pytest.raises(ValueError):
+            index.build(["1.2.3"], path, chunk_size=0)
+        with pytest.raises(ValueError):
+            index.build([Version(1 << 64, 0, 0)], path)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestOpen:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"not an index" * 10,
+            struct.pack("<4sIQQQ", b"SVIX", 2, 0, 32, 0),
+            struct.pack("<4sIQQQ", b"SVIX", 1, 3, 32, 0),
+        ],
+    )
+    def test_bad_file(self, tmp_path, data):
+        path = tmp_path / "bad.idx"
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            index.open(path)
+
+    def test_buffer(self, tmp_path, entries):
+        path = tmp_path / "catalog.idx"
+        index.build(entries, path)
+
+        idx = index.VersionIndex(path.read_bytes())
+        assert str(idx.latest("flask")) == _expected(entries, "flask")[-1]
+
+    def test_close(self, tmp_path):
+        path = tmp_path / "catalog.idx"
+        index.build(["1.0.0"], path)
+
+        idx = index.open(path)
+        idx.close()
+        assert len(idx) == 0 and idx.latest() is None
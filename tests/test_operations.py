@@ -1,6 +1,24 @@
 import pytest
 from semver.constants import VPos, VRm
-from semver.operations import add, sub, update
+from semver.operations import (
+    add,
+    bump,
+    compare,
+    get_build,
+    get_major,
+    get_minor,
+    get_patch,
+    get_pre,
+    get_pre_digit,
+    set_build,
+    set_major,
+    set_minor,
+    set_patch,
+    set_pre,
+    sub,
+    update,
+)
+from semver.version import FrozenVersion, Version, parse_version
 
 """
 add(), sub(), update(), bump()
@@ -78,3 +96,60 @@ def test_sub(v, res, op):
 )
 def test_update(v, res, op):
     assert res == update(v, *op)
+
+
+"""
+Version and FrozenVersion arguments
+"""
+
+
+@pytest.mark.parametrize("cls", [Version, FrozenVersion])
+@pytest.mark.parametrize(
+    "func, args, res",
+    [
+        (add, (VPos.MINOR, "+meta"), "2.6.0-alpha.5+meta"),
+        (sub, (VRm.PRE, VPos.PATCH), "2.5.4"),
+        (update, (VPos.PRE, VRm.PRE, "+b"), "2.5.5+b"),
+        (bump, (VPos.PRE, 3), "2.5.5-alpha.8"),
+        (bump, (VPos.MAJOR,), "3.0.0"),
+        (set_build, ("b.1",), "2.5.5-alpha.5+b.1"),
+        (set_major, (7,), "7.5.5-alpha.5"),
+        (set_minor, (7,), "2.7.5-alpha.5"),
+        (set_patch, (7,), "2.5.7-alpha.5"),
+        (set_pre, ("rc",), "2.5.5-rc"),
+    ],
+)
+def test_version_in_version_out(cls, func, args, res):
+    v = parse_version("2.5.5-alpha.5")
+    if cls is FrozenVersion:
+        v = v.freeze()
+
+    ret = func(v, *args)
+    assert type(ret) is cls
+    assert str(ret) == res
+    assert func("2.5.5-alpha.5", *args) == res
+
+    # the argument is not changed
+    assert str(v) == "2.5.5-alpha.5"
+
+
+def test_version_chain():
+    v = parse_version("1.2.3")
+    v = bump(set_pre(v, "rc.1"), VPos.PRE, 2)
+    v = add(set_build(v, "b"), VPos.MINOR)
+    assert isinstance(v, Version)
+    assert str(v) == "1.3.0-rc.3+b"
+
+
+def test_version_getters_and_compare():
+    v = parse_version("1.2.3-rc.4+b")
+    assert get_major(v) == 1
+    assert get_minor(v) == 2
+    assert get_patch(v) == 3
+    assert get_pre(v) == "rc.4"
+    assert get_pre_digit(v) == 4
+    assert get_build(v.freeze()) == "b"
+
+    assert compare(v, "1.2.3") == -1
+    assert compare("1.2.3", v.freeze()) == 1
+    assert compare(v, v) == 0
@@ -0,0 +1,138 @@
+"""
+semver.parallel: parse_many(), parse_array(), sort_versions()
+"""
+
+import concurrent.futures
+import random
+
+import pytest
+import semver.bulk
+from semver import parallel
+from semver.exc import ParseException
+from semver.keys import sort_key
+
+_VERSIONS = [
+    "1.2.3",
+    "0.0.0",
+    "1.2.3-rc.1",
+    "1.2.3-rc.1+build.5",
+    "1.2.3+build",
+    "10.20.30-alpha.beta.1",
+    "1.1١.0",
+    "1.2.3\n",
+    "1.0.0-1",
+]
+_INVALID = ["", "1.2", "v1.2.3", "01.2.3", "1.2.3-"]
+
+
+def _corpus(count, invalid=0.0, seed=0):
+    rng = random.Random(seed)
+    ret = []
+    for _ in range(count):
+        if rng.random() < invalid:
+            ret.append(rng.choice(_INVALID))
+            continue
+
+        version = "{}.{}.{}".format(
+            rng.randrange(5), rng.randrange(5), rng.randrange(5)
+        )
+        if rng.random() < 0.4:
+            version += "-" + rng.choice(["rc.1", "rc.2", "alpha", "1", "beta.11"])
+        if rng.random() < 0.2:
+            version += "+b" + str(rng.randrange(3))
+        ret.append(version)
+    return ret
+
+
+def _render(versions):
+    return [None if v is None else (str(v), v.pre, v.build) for v in versions]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("errors", ["skip", "none"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parse_many_same_as_bulk(errors, workers):
+    strings = _VERSIONS + _INVALID + _corpus(500, invalid=0.1)
+    expected = semver.bulk.parse_many(strings, errors)
+
+    # a thread pool runs the same shards without starting processes
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        result = parallel.parse_many(strings, errors, workers, executor)
+
+    assert _render(result) == _render(expected)
+    assert _render(parallel.parse_many(strings, errors, workers)) == _render(expected)
+
+
+def test_parse_many_processes(pool):
+    strings = _corpus(2000, invalid=0.05, seed=1)
+    result = parallel.parse_many(strings, "none", 2, pool)
+    assert _render(result) == _render(semver.bulk.parse_many(strings, "none"))
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_parse_array(workers):
+    strings = _VERSIONS + _INVALID + _corpus(300, invalid=0.1)
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        array = parallel.parse_array(strings, "skip", workers, executor)
+
+    expected = semver.bulk.parse_many(strings, "skip")
+    assert _render(list(array)) == _render(expected)
+
+
+def test_parse_array_processes(pool):
+    strings = _corpus(2000, seed=2)
+    array = parallel.parse_array(strings, workers=2, executor=pool)
+    assert list(array) == semver.bulk.parse_many(strings)
+
+
+@pytest.mark.parametrize("func", [parallel.parse_many, parallel.parse_array])
+def test_strict(func, pool):
+    strings = _corpus(1000)
+    strings[700] = "1.2.x"
+    with pytest.raises(ParseException, match="1.2.x"):
+        func(strings, workers=2, executor=pool)
+
+
+@pytest.mark.parametrize(
+    "func, errors",
+    [
+        (parallel.parse_many, "ignore"),
+        (parallel.parse_array, "ignore"),
+        (parallel.parse_array, "none"),
+    ],
+)
+def test_bad_error_policy(func, errors):
+    with pytest.raises(ValueError):
+        func(["1.2.3"], errors)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 5])
+def test_sort_versions(workers):
+    strings = _VERSIONS + _corpus(500, seed=3)
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        result = parallel.sort_versions(strings, workers, executor)
+
+    # stable, like sorted()
+    assert result == sorted(strings, key=sort_key)
+
+
+def test_sort_versions_processes(pool):
+    strings = _corpus(5000, seed=4)
+    result = parallel.sort_versions(strings, workers=2, executor=pool)
+    assert result == sorted(strings, key=sort_key)
+
+
+def test_sort_versions_invalid(pool):
+    with pytest.raises(ParseException):
+        parallel.sort_versions(_corpus(100) + ["1.2"], workers=2, executor=pool)
+
+
+def test_empty():
+    assert parallel.parse_many([]) == []
+    assert len(parallel.parse_array([])) == 0
+    assert parallel.sort_versions([]) == []
@@ -0,0 +1,153 @@
+"""
+compile_update() and UpdatePlan
+"""
+
+import itertools
+
+import pytest
+from semver.bulk import VersionArray
+from semver.constants import VPos, VRm
+from semver.exc import InvalidOperationException, NoValueException, ParseException
+from semver.operations import update
+from semver.plan import UpdatePlan, compile_update
+from semver.version import FrozenVersion, Version, parse_version
+
+VERSIONS = [
+    "1.2.3",
+    "0.0.0",
+    "4.5.6-rc.1",
+    "4.5.6-alpha",
+    "4.5.6-alpha.beta.9",
+    "7.8.9+build.1",
+    "7.8.9-rc.0+build.1",
+    "10.20.30-2+exp",
+]
+
+OPERATIONS = [
+    VPos.MAJOR,
+    VPos.MINOR,
+    VPos.PATCH,
+    VPos.PRE,
+    VRm.PRE,
+    VRm.BUILD,
+    "-beta.1",
+    "-dev",
+    "+build.5",
+]
+
+
+def _result(func, *args):
+    """The result of func, or the type and message of the exception"""
+
+    try:
+        return func(*args)
+    except Exception as e:
+        return type(e), str(e)
+
+
+@pytest.mark.parametrize(
+    "ops",
+    [ops for n in range(4) for ops in itertools.product(OPERATIONS, repeat=n)],
+)
+def test_same_as_update(ops):
+    plan = compile_update(*ops)
+    for v in VERSIONS:
+        assert _result(plan, v) == _result(update, v, *ops)
+
+
+@pytest.mark.parametrize(
+    "ops",
+    [
+        (VPos.MINOR, VRm.PRE, "+build.5"),
+        (VPos.PRE, VPos.PRE, VPos.PATCH),
+        ("-rc.1", VPos.PRE, VPos.PRE),
+        (VRm.BUILD, "+b", VPos.MAJOR),
+    ],
+)
+def test_version_input(ops):
+    plan = compile_update(*ops)
+    for v in VERSIONS:
+        version = parse_version(v)
+        expected = _result(update, v, *ops)
+        result = _result(plan, version)
+
+        if isinstance(result, Version):
+            assert type(result) is Version
+            assert str(result) == expected
+            assert result is not version
+        else:
+            assert result == expected
+
+        # input is not changed
+        assert str(version) == v
+
+
+def test_version_result_is_independent():
+    plan = compile_update("-rc.1", VPos.PRE)
+    first = plan(Version(1, 2, 3))
+    second = plan(Version(1, 2, 3))
+
+    first.inc(VPos.PRE)
+    assert str(first) == "1.2.3-rc.3"
+    assert str(second) == "1.2.3-rc.2"
+
+
+def test_frozen_input():
+    version = FrozenVersion(1, 2, 3, "rc.1")
+    result = compile_update(VPos.PRE, "+b")(version)
+
+    assert isinstance(result, FrozenVersion)
+    assert str(result) == "1.2.3-rc.2+b"
+    assert str(version) == "1.2.3-rc.1"
+
+
+def test_version_array():
+    plan = compile_update(VPos.MINOR, "+build.5")
+    arr = VersionArray(["1.2.3", "4.5.6-rc.1", "0.0.1-alpha"])
+    result = plan(arr)
+
+    assert isinstance(result, VersionArray)
+    assert [str(v) for v in result] == [
+        "1.3.0+build.5",
+        "4.6.0-rc.1+build.5",
+        "0.1.0-alpha+build.5",
+    ]
+    assert [str(v) for v in arr] == ["1.2.3", "4.5.6-rc.1", "0.0.1-alpha"]
+
+
+def test_version_array_error():
+    plan = compile_update(VPos.PRE)
+
+    assert [str(v) for v in plan(VersionArray(["1.2.3-rc.1"]))] == ["1.2.3-rc.2"]
+    with pytest.raises(NoValueException):
+        plan(VersionArray(["1.2.3-rc.1", "1.2.3"]))
+
+
+@pytest.mark.parametrize(
+    "ops, exc",
+    [
+        ((VPos.MAJOR, "build"), InvalidOperationException),
+        (("",), InvalidOperationException),
+        (("-a..b",), ParseException),
+        (("+build_1",), ParseException),
+        ((1,), TypeError),
+        ((None,), TypeError),
+    ],
+)
+def test_bad_operations(ops, exc):
+    with pytest.raises(exc):
+        compile_update(*ops)
+
+
+def test_invalid_version():
+    with pytest.raises(ParseException):
+        compile_update(VPos.MAJOR)("1.2")
+
+
+def test_plan():
+    ops = (VPos.MINOR, VRm.PRE)
+    plan = compile_update(*ops)
+
+    assert isinstance(plan, UpdatePlan)
+    assert plan.operations == ops
+    assert repr(plan) == "UpdatePlan(operations={})".format(ops)
@@ -337,6 +337,27 @@ class TestInc:
         p.inc()
         assert p == Pre(res)
 
+    @pytest.mark.parametrize(
+        "orig, amount, res",
+        [
+            ("4.5", 0, "4.5"),
+            ("alpha.4.5.x.2", 10000, "alpha.4.5.x.10002"),
+            ("9", 991, "1000"),
+        ],
+    )
+    def test_inc_amount(self, orig, amount, res):
+        p = Pre(orig)
+        p.inc(amount)
+        assert p.string == res
+        assert p == Pre(res)
+        assert p.digit == Pre(res).digit
+
+    def test_inc_negative_amount(self):
+        with pytest.raises(
+            NegativeValueException, match=re.escape("Number must be positive: -1")
+        ):
+            Pre("rc.1").inc(-1)
+
 
 class TestDec:
     @pytest.mark.parametrize(
@@ -370,6 +391,25 @@ class TestDec:
         p.dec()
         assert p == Pre(res)
 
+    @pytest.mark.parametrize(
+        "orig, amount, res",
+        [("4.5", 5, "4.0"), ("alpha.1000", 991, "alpha.9"), ("rc.3", 0, "rc.3")],
+    )
+    def test_dec_amount(self, orig, amount, res):
+        p = Pre(orig)
+        p.dec(amount)
+        assert p.string == res
+        assert p == Pre(res)
+
+    def test_dec_amount_too_big(self):
+        p = Pre("rc.3")
+        with pytest.raises(
+            NegativeValueException,
+            match=re.escape("Cannot decrement number to a negative value"),
+        ):
+            p.dec(4)
+        assert p.string == "rc.3"
+
     @pytest.mark.parametrize(
         "zeroed", ["4.0", "alpha.4.5.x.0", "DEV-SNAPSHOT.0", "rc.0", "r.---.0"]
     )
@@ -438,3 +478,63 @@ def test_is_beta(pre, true):
 )
 def test_is_rc(pre, true):
     assert Pre(pre).is_rc == true
+
+
+class TestLazy:
+    """The comparison list and digit are only found when needed"""
+
+    def test_not_split_on_init(self):
+        pre = Pre("alpha.beta.1")
+        assert pre._cmp is None
+        assert str(pre) == "-alpha.beta.1"
+        assert pre._cmp is None
+
+        assert pre < Pre("alpha.beta.2")
+        assert pre._cmp == ["alpha", "beta", 1]
+
+    def test_inc_before_compare(self):
+        pre = Pre("rc.9")
+        pre.inc(2)
+        assert pre._cmp is None
+        assert pre.digit == 11
+        assert Pre("rc.10") < pre < Pre("rc.12")
+        assert pre._cmp == ["rc", 11]
+
+    def test_inc_after_compare(self):
+        pre = Pre("rc.9")
+        assert pre < Pre("rc.10")
+        pre.inc(2)
+        assert pre._cmp == ["rc", 11]
+        assert not pre < Pre("rc.10")
+
+    def test_string_setter(self):
+        pre = Pre("rc.1")
+        assert pre.digit == 1
+        assert pre < Pre("rc.2")
+
+        pre.string = "beta"
+        assert pre.digit is None
+        assert pre < Pre("rc")
+        assert not pre < Pre("alpha")
+
+        with pytest.raises(NoValueException):
+            pre.inc()
+
+    def test_reset(self):
+        pre = Pre("rc.1")
+        pre.reset()
+        assert pre.digit is None
+        assert pre.string == "-"
+        assert pre < Pre("a")
+
+    @pytest.mark.parametrize("compared", [False, True])
+    def test_copy(self, compared):
+        pre = Pre("rc.1")
+        if compared:
+            assert pre < Pre("rc.2")
+
+        copy = pre._copy()
+        copy.inc()
+        assert pre.digit == 1
+        assert pre < copy
+        assert str(copy) == "-rc.2"
@@ -0,0 +1,316 @@
+"""
+Range, satisfies(), sort_key(), range algebra
+"""
+
+import functools
+import random
+import threading
+
+import pytest
+from semver.exc import ParseException
+from semver.keys import sort_key
+from semver.ranges import Range, RangeCache, range_cache, satisfies
+from semver.version import parse_version
+
+ORDERED = [
+    "0.0.0-0",
+    "0.0.0-0.0",
+    "0.0.0",
+    "0.9.9",
+    "1.0.0-0",
+    "1.0.0-9",
+    "1.0.0-10",
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-alpha0",
+    "1.0.0-beta",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "1.0.1",
+    "1.2.0",
+    "1.10.0",
+    "2.0.0",
+    "10.0.0",
+    "99999999999999999999.0.0",
+]
+
+
+@pytest.mark.parametrize("lhs, rhs", list(zip(ORDERED, ORDERED[1:])))
+def test_sort_key_order(lhs, rhs):
+    assert sort_key(lhs) < sort_key(rhs)
+    assert sort_key(parse_version(lhs)) == sort_key(lhs)
+
+
+def test_sort_key_ignores_build():
+    assert sort_key("1.2.3-rc.1+b.1") == sort_key("1.2.3-rc.1+b.2")
+
+
+def test_sort_key_matches_version_order():
+    shuffled = ORDERED[:]
+    random.Random(42).shuffle(shuffled)
+
+    by_version = sorted(shuffled, key=parse_version)
+    by_key = sorted(shuffled, key=sort_key)
+    assert by_key == by_version == ORDERED
+
+
+def test_sort_key_long_number():
+    huge = "1" * 300
+    assert sort_key("99.0.0") < sort_key(huge + ".0.0")
+    assert sort_key(huge + ".0.0") < sort_key("1" + huge + ".0.0")
+
+
+@pytest.mark.parametrize("bad", ["1.2", "v1.2.3", "01.2.3", ""])
+def test_sort_key_error(bad):
+    with pytest.raises(ParseException):
+        sort_key(bad)
+
+
+@pytest.mark.parametrize(
+    "expression, normalized",
+    [
+        ("1.2.3", "=1.2.3"),
+        ("=1.2.3", "=1.2.3"),
+        ("> 1.2.3", ">1.2.3"),
+        (">=1.2.3 <2", ">=1.2.3 <2.0.0-0"),
+        ("1.x", ">=1.0.0 <2.0.0-0"),
+        ("1.2.*", ">=1.2.0 <1.3.0-0"),
+        ("*", "*"),
+        ("", "*"),
+        ("x", "*"),
+        ("<*", "<0.0.0-0"),
+        (">1", ">=2.0.0"),
+        (">1.2", ">=1.3.0"),
+        ("<1.2", "<1.2.0-0"),
+        ("<=1.2", "<1.3.0-0"),
+        ("~1.2.3", ">=1.2.3 <1.3.0-0"),
+        ("~1", ">=1.0.0 <2.0.0-0"),
+        ("^1.2.3", ">=1.2.3 <2.0.0-0"),
+        ("^0.2.3", ">=0.2.3 <0.3.0-0"),
+        ("^0.0.3", ">=0.0.3 <0.0.4-0"),
+        ("^1.2", ">=1.2.0 <2.0.0-0"),
+        ("^0.2", ">=0.2.0 <0.3.0-0"),
+        ("^1.2.3-beta.2", ">=1.2.3-beta.2 <2.0.0-0"),
+        ("1.2.3 - 2.3", ">=1.2.3 <2.4.0-0"),
+        ("1.2 - 2.3.4", ">=1.2.0 <=2.3.4"),
+        ("^1 || >=3.1 <=3.4", ">=1.0.0 <2.0.0-0 || >=3.1.0 <3.5.0-0"),
+    ],
+)
+def test_normalize(expression, normalized):
+    assert str(Range(expression)) == normalized
+
+
+@pytest.mark.parametrize(
+    "bad",
+    ["1.2.3.4", "abc", ">=01.2", "1.2-beta", "1.x.3-alpha", ">=1.2.3 ! 2", "~>1"],
+)
+def test_invalid_range(bad):
+    with pytest.raises(ParseException, match="Invalid range string"):
+        Range(bad)
+
+
+@pytest.mark.parametrize(
+    "version, expression, res",
+    [
+        ("1.2.3", "^1.2.0", True),
+        ("2.0.0", "^1.2.0", False),
+        ("2.0.0-rc.1", "^1.2.0", False),
+        ("2.0.0-rc.1", "<2.0.0", True),
+        ("1.2.3+build", "=1.2.3", True),
+        ("1.2.3-alpha", "1.2.3", False),
+        ("3.2.0", "^1 || >=3.1 <=3.4", True),
+        ("2.2.0", "^1 || >=3.1 <=3.4", False),
+        ("0.0.1", "*", True),
+        ("0.0.0-0", "<*", False),
+    ],
+)
+def test_satisfies(version, expression, res):
+    assert satisfies(version, expression) is res
+    assert (parse_version(version) in Range(expression)) is res
+
+
+@functools.lru_cache()
+def _corpus():
+    rng = random.Random(7)
+    labels = [None, "0", "1", "alpha", "alpha.1", "rc.2", "beta.10"]
+    return [
+        "{}.{}.{}{}".format(
+            rng.randrange(4),
+            rng.randrange(4),
+            rng.randrange(4),
+            "" if label is None else "-" + label,
+        )
+        for label in (rng.choice(labels) for _ in range(300))
+    ]
+
+
+@pytest.mark.parametrize("bound", ["1.1.1", "2.0.0-alpha.1", "0.3.0"])
+def test_primitive_matches_version_operators(bound):
+    v_bound = parse_version(bound)
+    for version in _corpus():
+        v = parse_version(version)
+        assert satisfies(version, "<" + bound) is (v < v_bound)
+        assert satisfies(version, "<=" + bound) is (v <= v_bound)
+        assert satisfies(version, ">" + bound) is (v > v_bound)
+        assert satisfies(version, ">=" + bound) is (v >= v_bound)
+        assert satisfies(version, "=" + bound) is (v == v_bound)
+
+
+_ALGEBRA = [
+    "*",
+    "<*",
+    "1.2.3",
+    "^1.2",
+    "~1.2.1",
+    "1.x || 3.x",
+    ">=1.0.0 <2.0.0-0",
+    ">1.2.3 <=2.0.0-rc.1",
+    "<1.0.0 || >=1.0.0",
+    "<=1.2.3-rc.1 || >1.2.3-rc.1.0",
+    ">2 <1",
+    "0.x || 2.0.0 - 2.1 || ^3.1.1-alpha",
+    "^0.0.3 || ~0.1 || 1.1.1",
+]
+
+
+@functools.lru_cache()
+def _boundaries():
+    # every version, and the versions right after them
+    labels = [None, "0", "0.0", "alpha", "rc.1", "rc.1.0"]
+    return [
+        "{}.{}.{}{}".format(major, minor, patch, "" if label is None else "-" + label)
+        for major in range(4)
+        for minor in range(4)
+        for patch in range(4)
+        for label in labels
+    ]
+
+
+@pytest.mark.parametrize(
+    "expression, simplified",
+    [
+        ("^1.2 || ~1.5.1", ">=1.2.0 <2.0.0-0"),
+        ("1.2.3", "1.2.3"),
+        ("1.2.3 || 1.2.3", "1.2.3"),
+        ("<1.0.0 || >=1.0.0", "*"),
+        ("<=1.2.3 || 1.2.4-0", "<=1.2.4-0"),
+        ("1.2.3 - 1.4.5", ">=1.2.3 <=1.4.5"),
+        (">1.2.3-rc.1 <1.2.3-rc.1.0.0", "1.2.3-rc.1.0"),
+        (">2 <1 || <0.0.0-0", "<0.0.0-0"),
+        (">=0.0.0-0", "*"),
+        ("^1 || ^2", ">=1.0.0 <2.0.0-0 || >=2.0.0 <3.0.0-0"),
+    ],
+)
+def test_simplify(expression, simplified):
+    result = Range(expression).simplify()
+    assert result.expression == simplified
+    assert Range(simplified).simplify().expression == simplified
+    assert str(Range(simplified)) == str(result)
+
+
+@pytest.mark.parametrize("lhs", _ALGEBRA)
+@pytest.mark.parametrize("rhs", _ALGEBRA)
+def test_algebra(lhs, rhs):
+    left, right = Range(lhs), Range(rhs)
+    both = left.intersect(rhs)
+    either = left.union(right)
+    assert both.expression == right.intersect(left).expression
+    assert either.expression == Range(rhs).union(lhs).expression
+
+    subset = True
+    for version in _boundaries():
+        in_left, in_right = left.test(version), right.test(version)
+        assert both.test(version) is (in_left and in_right)
+        assert either.test(version) is (in_left or in_right)
+        subset = subset and (in_right or not in_left)
+
+    # the boundaries include a version in every difference of these ranges
+    assert left.is_subset(right) is subset
+
+
+@pytest.mark.parametrize("expression", _ALGEBRA)
+def test_complement(expression):
+    r = Range(expression)
+    complement = r.complement()
+    for version in _boundaries():
+        assert complement.test(version) is not r.test(version)
+
+    assert complement.complement().expression == r.simplify().expression
+    assert r.union(complement).expression == "*"
+    assert r.intersect(complement).expression == "<0.0.0-0"
+    assert r.simplify().is_subset(r) and r.is_subset(r.simplify())
+
+
+class TestRangeCache:
+    def test_lru(self):
+        cache = RangeCache(2)
+        first = cache.get(">=1.0.0")
+        assert cache.get(">=1.0.0") is first
+        cache.get("<2.0.0")
+        cache.get(">=1.0.0")
+        # <2.0.0 is the least recently used
+        cache.get("^1.2.3")
+        assert len(cache) == 2
+        assert cache.get(">=1.0.0") is first
+        assert cache.cache_info() == (3, 3, 2, 2)
+
+        cache.get("<2.0.0")
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (3, 4, 2)
+
+    def test_clear(self):
+        cache = RangeCache()
+        cache.get("1.x")
+        cache.get("1.x")
+        cache.cache_clear()
+        assert cache.cache_info() == (0, 0, 1024, 0)
+
+    def test_sizes(self):
+        uncached = RangeCache(0)
+        assert uncached.get("1.x") is not uncached.get("1.x")
+        assert uncached.cache_info() == (0, 2, 0, 0)
+
+        unbounded = RangeCache(None)
+        for minor in range(2000):
+            unbounded.get("1.{}.x".format(minor))
+        assert len(unbounded) == 2000
+
+        with pytest.raises(ValueError, match="Cache size must not be negative"):
+            RangeCache(-1)
+
+    def test_invalid(self):
+        cache = RangeCache()
+        with pytest.raises(ParseException):
+            cache.get("1.2.3.4")
+        assert len(cache) == 0
+
+    def test_shared(self):
+        range_cache.cache_clear()
+        assert satisfies("1.2.3", "^1.2.0") and not satisfies("2.0.0", "^1.2.0")
+        assert range_cache.cache_info()[:2] == (1, 1)
+
+    def test_threads(self):
+        cache = RangeCache(8)
+        expressions = ["^1.{}.0".format(minor) for minor in range(16)]
+        errors = []
+
+        def run(seed):
+            rng = random.Random(seed)
+            for _ in range(2000):
+                expression = rng.choice(expressions)
+                minor = int(expression.split(".")[1])
+                if not cache.get(expression).test("1.{}.5".format(minor)):
+                    errors.append(expression)
+
+        threads = [threading.Thread(target=run, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.cache_info()
+        assert errors == []
+        assert info.hits + info.misses == 8000 and info.currsize <= 8
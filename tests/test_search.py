@@ -0,0 +1,89 @@
+"""
+find_all(), iter_find()
+"""
+
+import io
+import random
+
+import pytest
+from semver.search import find_all, iter_find
+
+
+def _found(results):
+    return [(offset, str(v)) for offset, v in results]
+
+
+@pytest.mark.parametrize(
+    "text, res",
+    [
+        ("", []),
+        ("1.2.3", [(0, "1.2.3")]),
+        ("upgrade 1.2.3 -> 2.0.0-rc.1", [(8, "1.2.3"), (17, "2.0.0-rc.1")]),
+        ("v1.2.3, =1.2.4; (1.2.5)", [(1, "1.2.3"), (9, "1.2.4"), (17, "1.2.5")]),
+        ("pkg-1.0.0-linux.x86+b.1", [(4, "1.0.0-linux.x86+b.1")]),
+        ("Mozilla/5.0 Chrome/120.0.6099.109", []),
+        ("see 1.2.3.", [(4, "1.2.3")]),
+        ("1.2.3.4 11.2.3 01.2.3", [(8, "11.2.3")]),
+        ("x1.2.3y 1.2.3- 1.2.3+", [(15, "1.2.3")]),
+        ("1.2.3-rc.01 1.2.3-rc.1.", [(12, "1.2.3-rc.1")]),
+        ("1.2.3\n2.3.4\r\n", [(0, "1.2.3"), (6, "2.3.4")]),
+    ],
+)
+def test_find_all(text, res):
+    assert _found(find_all(text)) == res
+    assert _found(iter_find(io.StringIO(text))) == res
+
+
+def _log(count, seed=0):
+    rng = random.Random(seed)
+    words = ["INFO", "build", "v", "-", ".", " ", "\n", "1.2.3", "10.0.0-rc.1"]
+    words += ["2.0.0+sha.5114f85", "4.5", "6", "x", "1.0.0-alpha.beta", "٣"]
+    return "".join(rng.choice(words) for _ in range(count))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_iter_find_chunks(chunk_size):
+    text = _log(2000)
+    expected = _found(find_all(text))
+
+    assert expected
+    assert _found(iter_find(io.StringIO(text), chunk_size)) == expected
+
+    # iterable of strings
+    chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+    assert _found(iter_find(chunks)) == expected
+
+
+def test_offsets():
+    # non-ASCII digits are rendered as ASCII in the versions
+    text = _log(2000, seed=1).replace("٣", "3")
+    for offset, version in find_all(text):
+        assert text.startswith(str(version), offset)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_bad_chunk_size(chunk_size):
+    with pytest.raises(ValueError, match="Chunk size must be positive"):
+        next(iter_find(io.StringIO("1.2.3"), chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 4096])
+def test_iter_find_long_runs(chunk_size):
+    # runs with no separators are not carried over whole to the next chunk
+    text = "1.2." * 500000 + " 1.2.3 " + "9" * 500000 + " v2.0.0"
+    expected = [(2000001, "1.2.3"), (2500009, "2.0.0")]
+
+    assert _found(find_all(text)) == expected
+    assert _found(iter_find(io.StringIO(text), chunk_size)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [100, 300, 1000])
+@pytest.mark.parametrize("rest", [".1 end", "b end", " end"])
+def test_iter_find_long_version(chunk_size, rest):
+    # a version longer than MAX_LENGTH that is split between chunks is
+    # skipped, not found cut short
+    text = "see 1.2.3-" + "a" * 400 + rest + " 4.5.6"
+    found = _found(iter_find(io.StringIO(text), chunk_size))
+
+    assert found[-1] == (len(text) - 5, "4.5.6")
+    assert all(v == "4.5.6" or (o, v) in _found(find_all(text)) for o, v in found)
@@ -4,6 +4,7 @@ set_build(), set_major(), set_minor(), set_micro(), set_pre()
 
 import pytest
 from semver.operations import set_build, set_major, set_minor, set_patch, set_pre
+from semver.version import parse_version
 
 
 @pytest.mark.parametrize(
@@ -69,3 +70,53 @@ def test_set_minor(orig, minor, res):
 )
 def test_set_patch(orig, patch, res):
     assert res == set_patch(orig, patch)
+
+
+def _result(func, *args):
+    """The result of func, or the type and message of the exception"""
+
+    try:
+        return func(*args)
+    except Exception as e:
+        return type(e), str(e)
+
+
+def _set_slow(attr):
+    """The setter done on a Version object (what the spliced string must match)"""
+
+    def func(version, value):
+        v = parse_version(version)
+        setattr(v, attr, value)
+        return str(v)
+
+    return func
+
+
+SETTERS = [
+    (set_major, "major"),
+    (set_minor, "minor"),
+    (set_patch, "patch"),
+    (set_pre, "pre"),
+    (set_build, "build"),
+]
+
+
+@pytest.mark.parametrize("func, attr", SETTERS)
+@pytest.mark.parametrize(
+    "orig",
+    [
+        "0.0.0",
+        "2.6.2-alpha.6",
+        "2.6.2+meta.12",
+        "2.6.2-alpha.6+meta.12",
+        "2.6.2-rc.1+meta\n",
+        "2.6٦.2-rc",
+        "2.6.2.3",
+        "",
+    ],
+)
+@pytest.mark.parametrize(
+    "value", [0, 17, -1, True, None, "rc.2", "x-y.0", "", "01", "a_b", "rc\n"]
+)
+def test_splice_same_as_version(func, attr, orig, value):
+    assert _result(func, orig, value) == _result(_set_slow(attr), orig, value)
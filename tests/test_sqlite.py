@@ -0,0 +1,83 @@
+"""
+semver.sqlite
+"""
+
+import sqlite3
+
+import pytest
+from semver.keys import sort_key
+from semver.sqlite import register
+
+VERSIONS = ["1.10.0", "1.2.0", "1.0.0-rc.1", "1.0.0", "0.9.0", "1.0.0-alpha", "2.0.0"]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    register(conn)
+    conn.execute("CREATE TABLE releases (version TEXT)")
+    conn.executemany("INSERT INTO releases VALUES (?)", [(v,) for v in VERSIONS])
+    yield conn
+    conn.close()
+
+
+def test_collation(conn):
+    rows = conn.execute("SELECT version FROM releases ORDER BY version COLLATE SEMVER")
+    assert [r[0] for r in rows] == [
+        "0.9.0",
+        "1.0.0-alpha",
+        "1.0.0-rc.1",
+        "1.0.0",
+        "1.2.0",
+        "1.10.0",
+        "2.0.0",
+    ]
+
+
+def test_collation_invalid_last(conn):
+    conn.execute("INSERT INTO releases VALUES ('not a version')")
+    rows = conn.execute(
+        "SELECT version FROM releases ORDER BY version COLLATE SEMVER DESC LIMIT 1"
+    )
+    assert rows.fetchone()[0] == "not a version"
+
+
+@pytest.mark.parametrize(
+    "sql, res",
+    [
+        ("SELECT semver_valid('1.2.3-rc.1')", 1),
+        ("SELECT semver_valid('v1.2.3')", 0),
+        ("SELECT semver_valid(5)", 0),
+        ("SELECT semver_major('12.3.4')", 12),
+        ("SELECT semver_minor('12.3.4')", 3),
+        ("SELECT semver_patch('12.3.4')", 4),
+        ("SELECT semver_major('1.2')", None),
+        ("SELECT semver_major('9223372036854775807.0.0')", (1 << 63) - 1),
+        ("SELECT semver_major('9223372036854775808.0.0')", None),
+        ("SELECT semver_patch('1.2.99999999999999999999')", None),
+        ("SELECT semver_cmp('1.2.3', '1.10.0')", -1),
+        ("SELECT semver_cmp('1.2.3+a', '1.2.3+b')", 0),
+        ("SELECT semver_cmp('1.2.3', '1.2.3-rc')", 1),
+        ("SELECT semver_cmp('1.2.3', 'bad')", None),
+        ("SELECT semver_satisfies('1.4.0', '^1.2')", 1),
+        ("SELECT semver_satisfies('2.0.0', '^1.2')", 0),
+        ("SELECT semver_satisfies('2.0.0', '^^1.2')", None),
+    ],
+)
+def test_functions(conn, sql, res):
+    assert conn.execute(sql).fetchone()[0] == res
+
+
+def test_key_column(conn):
+    conn.execute("ALTER TABLE releases ADD COLUMN vkey BLOB")
+    conn.execute("UPDATE releases SET vkey = semver_key(version)")
+    conn.execute("CREATE INDEX releases_vkey ON releases (vkey)")
+
+    query = "SELECT version FROM releases WHERE vkey >= ? AND vkey < ? ORDER BY vkey"
+    params = (sort_key("1.0.0"), sort_key("2.0.0-0"))
+
+    plan = " ".join(str(r) for r in conn.execute("EXPLAIN QUERY PLAN " + query, params))
+    assert "releases_vkey" in plan
+
+    rows = conn.execute(query, params)
+    assert [r[0] for r in rows] == ["1.0.0", "1.2.0", "1.10.0"]
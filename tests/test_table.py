@@ -0,0 +1,234 @@
+"""
+VersionTable, pack_table(), write_table()
+"""
+
+import multiprocessing
+import random
+import struct
+import sys
+
+import pytest
+from semver.exc import ParseException
+from semver.keys import sort_key
+from semver.ranges import Range
+from semver.table import VersionTable, pack_table, write_table
+from semver.version import Version, parse_version
+
+needs_shared_memory = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="shared memory needs Python 3.8"
+)
+
+_EXPRESSIONS = [
+    "*",
+    "1.2.3",
+    "^1.2",
+    "~0.2.1",
+    ">=1.0.0 <2.0.0-0",
+    ">1.1.1",
+    "<=0.3.3",
+    "1.x || >=3.1.0",
+    "0.1.0 - 1.2.3",
+    "<1.0.0 || >=1.0.0",
+    ">2.0.0 <1.0.0",
+    "^1.2 || ~1.2.1",
+]
+
+
+def _corpus(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        "{}.{}.{}{}{}".format(
+            rng.randrange(4),
+            rng.randrange(4),
+            rng.randrange(4),
+            rng.choice(["", "", "-rc.1", "-rc.2", "-alpha", "-1"]),
+            rng.choice(["", "", "+b1", "+b2"]),
+        )
+        for _ in range(count)
+    ]
+
+
+def _strs(versions):
+    return [str(v) for v in versions]
+
+
+def _floor(strings, version):
+    key = sort_key(version)
+    lower = [v for v in strings if sort_key(v) <= key]
+    return lower[-1] if lower else None
+
+
+@pytest.fixture(scope="module")
+def strings():
+    return sorted(_corpus(300), key=sort_key)
+
+
+@pytest.fixture(scope="module")
+def table(strings):
+    # packed out of order, so the table must sort them (stably)
+    shuffled = _corpus(300)
+    assert sorted(shuffled, key=sort_key) == strings
+    return VersionTable(pack_table(shuffled))
+
+
+class TestQueries:
+    def test_order(self, table, strings):
+        assert len(table) == len(strings)
+        assert _strs(table) == strings
+        assert str(table[0]) == strings[0] and str(table[-1]) == strings[-1]
+
+        with pytest.raises(IndexError):
+            table[len(strings)]
+
+    @pytest.mark.parametrize(
+        "version", ["0.0.0", "0.0.0-0", "1.2.3", "1.2.3-rc.1", "2.0.0", "9.9.9"]
+    )
+    def test_floor_ceiling(self, table, strings, version):
+        floor = table.floor(version)
+        assert (None if floor is None else str(floor)) == _floor(strings, version)
+
+        key = sort_key(version)
+        higher = [v for v in strings if sort_key(v) >= key]
+        ceiling = table.ceiling(parse_version(version))
+        assert (None if ceiling is None else str(ceiling)) == (
+            higher[0] if higher else None
+        )
+
+    def test_latest(self, table, strings):
+        assert str(table.latest()) == strings[-1]
+
+        stable = [v for v in strings if parse_version(v).is_stable]
+        assert str(table.latest(stable=True)) == stable[-1]
+
+    @pytest.mark.parametrize("expression", _EXPRESSIONS)
+    def test_select(self, table, strings, expression):
+        expected = [v for v in strings if Range(expression).test(v)]
+        assert _strs(table.select(expression)) == expected
+        assert _strs(table.select(Range(expression))) == expected
+        assert table.count(expression) == len(expected)
+
+    def test_invalid(self, table):
+        with pytest.raises(ParseException):
+            table.floor("1.2")
+        with pytest.raises(ParseException):
+            list(table.select("1.2.3.4"))
+
+    def test_empty(self):
+        table = VersionTable(pack_table([]))
+        assert len(table) == 0 and list(table) == []
+        assert table.floor("1.2.3") is None and table.ceiling("1.2.3") is None
+        assert table.latest() is None and list(table.select("*")) == []
+
+
+class TestPack:
+    def test_versions_and_strings(self):
+        versions = [Version(1, 2, 3, "rc.1", "b"), "1.0.0", "1.1١.0"]
+        table = VersionTable(pack_table(versions))
+        assert _strs(table) == ["1.0.0", "1.2.3-rc.1+b", "1.11.0"]
+
+    def test_large_numbers(self):
+        big = (1 << 64) - 1
+        table = VersionTable(pack_table([Version(big, 0, 0), "1.0.0"]))
+        assert table.latest() == Version(big, 0, 0)
+
+        with pytest.raises(ValueError):
+            pack_table([Version(big + 1, 0, 0)])
+
+    def test_invalid(self):
+        with pytest.raises(ParseException):
+            pack_table(["1.2.3", "1.2"])
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"XXXX" + bytes(36),
+            struct.pack("<4sIQQQQ", b"SVTB", 2, 0, 0, 0, 0),
+            pack_table(["1.2.3-rc"])[:-1],
+        ],
+    )
+    def test_bad_buffer(self, data):
+        with pytest.raises(ValueError, match="Invalid version table"):
+            VersionTable(data)
+
+    def test_extra_bytes(self):
+        table = VersionTable(pack_table(["1.2.3"]) + bytes(100))
+        assert _strs(table) == ["1.2.3"]
+
+
+class TestStorage:
+    def test_file(self, tmp_path, strings):
+        path = tmp_path / "table.bin"
+        write_table(strings, path)
+
+        with VersionTable.open(path) as table:
+            assert table.name is None
+            assert _strs(table) == strings
+            assert table.nbytes == path.stat().st_size
+        assert len(table) == 0
+
+    def test_bad_file(self, tmp_path):
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError):
+            VersionTable.open(path)
+
+        path.write_bytes(b"not a table" * 10)
+        with pytest.raises(ValueError):
+            VersionTable.open(path)
+
+    @needs_shared_memory
+    def test_shared(self, strings):
+        table = VersionTable.create_shared(strings)
+        try:
+            other = VersionTable.attach_shared(table.name)
+            assert _strs(other) == strings
+            assert str(other.floor("1.2.3")) == _floor(strings, "1.2.3")
+            other.close()
+
+            # closing an attached table does not free the block
+            with VersionTable.attach_shared(table.name) as again:
+                assert len(again) == len(strings)
+        finally:
+            table.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            VersionTable.attach_shared(table.name)
+
+    @needs_shared_memory
+    def test_shared_other_process(self, strings):
+        table = VersionTable.create_shared(strings)
+        try:
+            with multiprocessing.Pool(1) as pool:
+                result = pool.apply(_latest_in_worker, (table.name,))
+            assert result == strings[-1]
+
+            # the worker exiting did not free the block
+            with VersionTable.attach_shared(table.name) as again:
+                assert str(again.latest()) == strings[-1]
+        finally:
+            table.unlink()
+
+    @needs_shared_memory
+    def test_shared_empty_block(self):
+        from multiprocessing import shared_memory
+
+        block = shared_memory.SharedMemory(create=True, size=16)
+        try:
+            with pytest.raises(ValueError):
+                VersionTable.attach_shared(block.name)
+        finally:
+            block.close()
+            block.unlink()
+
+    @pytest.mark.skipif(sys.version_info >= (3, 8), reason="Python 3.7 only")
+    def test_shared_unavailable(self, strings):
+        with pytest.raises(NotImplementedError, match="Python 3.8"):
+            VersionTable.create_shared(strings)
+        with pytest.raises(NotImplementedError, match="Python 3.8"):
+            VersionTable.attach_shared("catalog")
+
+
+def _latest_in_worker(name):
+    with VersionTable.attach_shared(name) as table:
+        return str(table.latest())
@@ -1,8 +1,13 @@
 """
-valid()
+valid(), valid_many()
 """
 
+import random
+import re
+
 import pytest
+from semver.bulk import valid_many
+from semver.constants import RE_FULL
 from semver.operations import valid
 
 
@@ -102,3 +107,46 @@ def test_invalid(bad):
 )
 def test_valid(v):
     assert valid(v)
+
+
+def _corpus(count, seed=0):
+    """Random strings made mostly of version characters, and valid versions \
+    with one character changed
+    """
+
+    rng = random.Random(seed)
+    chars = "0123456789..--++abzAZ_ \n\u0661"
+    good = ["1.2.3", "10.20.30-rc.1+build.5", "0.0.0-0.a-b.01x+0.x-y"]
+
+    ret = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            ret.append("".join(rng.choice(chars) for _ in range(rng.randint(0, 16))))
+        else:
+            s = list(rng.choice(good))
+            s[rng.randrange(len(s))] = rng.choice(chars)
+            ret.append("".join(s))
+
+    return ret
+
+
+def test_same_as_regex():
+    corpus = _corpus(20000)
+    expected = [re.match(RE_FULL, s) is not None for s in corpus]
+
+    # both valid and invalid strings are tested
+    assert any(expected) and not all(expected)
+    assert [valid(s) for s in corpus] == expected
+    assert valid_many(corpus) == expected
+    assert valid_many(iter(corpus)) == expected
+
+
+def test_valid_many_not_str():
+    assert valid_many(["1.2.3", None, 1, b"1.2.3", "1.2"]) == [
+        True,
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert valid_many([]) == []
@@ -4,7 +4,14 @@ Version class
 
 import pytest
 import re
-from semver.version import Version, VersionNumber, Pre, Build, parse_version
+from semver.version import (
+    Build,
+    FrozenVersion,
+    Pre,
+    Version,
+    VersionNumber,
+    parse_version,
+)
 from semver.constants import (
     VPos,
     VRm,
@@ -107,6 +114,12 @@ class TestConstructor:
         ):
             Version(2 + 5j, -1, 2, build="meta+meta", pre="alpha..11")
 
+    def test_version_number_args(self):
+        v = Version(VersionNumber(1), VersionNumber(2), VersionNumber(3))
+
+        assert (v.major, v.minor, v.patch) == (1, 2, 3)
+        assert v == Version(1, 2, 3)
+
     @pytest.mark.parametrize(
         "pre, build, digit",
         [
@@ -624,6 +637,58 @@ class TestInc:
         assert v.build == "meta"
 
 
+class TestIncDecAmount:
+    @pytest.mark.parametrize(
+        "pos, amount, res",
+        [
+            (VPos.MAJOR, 3, "5.0.0-beta.5+meta"),
+            (VPos.MINOR, 10, "2.15.0-beta.5+meta"),
+            (VPos.PATCH, 0, "2.5.3-beta.5+meta"),
+            (VPos.PRE, 10000, "2.5.3-beta.10005+meta"),
+        ],
+    )
+    def test_inc(self, pos, amount, res):
+        v = Version(2, 5, 3, pre="beta.5", build="meta")
+        v.inc(pos, amount)
+        assert str(v) == res
+
+    @pytest.mark.parametrize(
+        "pos, amount, res",
+        [
+            (VPos.MAJOR, 2, "0.5.3-beta.5+meta"),
+            (VPos.MINOR, 5, "2.0.3-beta.5+meta"),
+            (VPos.PATCH, 1, "2.5.2-beta.5+meta"),
+            (VPos.PRE, 5, "2.5.3-beta.0+meta"),
+        ],
+    )
+    def test_dec(self, pos, amount, res):
+        v = Version(2, 5, 3, pre="beta.5", build="meta")
+        v.dec(pos, amount)
+        assert str(v) == res
+
+    @pytest.mark.parametrize("pos", [VPos.MAJOR, VPos.MINOR, VPos.PATCH, VPos.PRE])
+    def test_dec_too_much(self, pos):
+        v = Version(2, 5, 3, pre="beta.5", build="meta")
+        with pytest.raises(
+            NegativeValueException,
+            match=re.escape("Cannot decrement number to a negative value"),
+        ):
+            v.dec(pos, 6)
+        assert str(v) == "2.5.3-beta.5+meta"
+
+    @pytest.mark.parametrize("pos", [VPos.MAJOR, VPos.MINOR, VPos.PATCH, VPos.PRE])
+    def test_negative_amount(self, pos):
+        v = Version(2, 5, 3, pre="beta.5", build="meta")
+        with pytest.raises(
+            NegativeValueException, match=re.escape("Number must be positive: -1")
+        ):
+            v.inc(pos, -1)
+        with pytest.raises(
+            NegativeValueException, match=re.escape("Number must be positive: -1")
+        ):
+            v.dec(pos, -1)
+
+
 class TestDec:
     def test_major(self):
         v = Version(2, 5, 3, pre="beta.5", build="meta")
@@ -1118,3 +1183,100 @@ def test_bad_parse(bad):
 )
 def test_parse(v):
     assert str(parse_version(v)) == v
+
+
+class TestStrCache:
+    def test_parse_uses_input(self):
+        s = "1.2.3-alpha.1+build.5"
+        v = parse_version(s)
+        assert str(v) is s
+
+    def test_parse_trailing_newline(self):
+        assert str(parse_version("1.2.3\n")) == "1.2.3"
+
+    @pytest.mark.parametrize(
+        "op, res",
+        [
+            (lambda v: v.inc(VPos.MAJOR), "2.0.0-alpha.1+b"),
+            (lambda v: v.inc(VPos.PRE), "1.2.3-alpha.2+b"),
+            (lambda v: v.dec(VPos.PATCH), "1.2.2-alpha.1+b"),
+            (lambda v: v.dec(VPos.PRE), "1.2.3-alpha.0+b"),
+            (lambda v: v.remove_pre(), "1.2.3+b"),
+            (lambda v: v.remove_build(), "1.2.3-alpha.1"),
+            (lambda v: v.reset(), "0.0.0"),
+            (lambda v: setattr(v, "major", 7), "7.2.3-alpha.1+b"),
+            (lambda v: setattr(v, "minor", 7), "1.7.3-alpha.1+b"),
+            (lambda v: setattr(v, "patch", 7), "1.2.7-alpha.1+b"),
+            (lambda v: setattr(v, "pre", "rc"), "1.2.3-rc+b"),
+            (lambda v: setattr(v, "pre", None), "1.2.3+b"),
+            (lambda v: setattr(v, "build", "c"), "1.2.3-alpha.1+c"),
+            (lambda v: v + VPos.MINOR, "1.3.0-alpha.1+b"),
+            (lambda v: v - VRm.PRE + "-rc.1", "1.2.3-rc.1+b"),
+            (lambda v: v - VRm.BUILD + "+c", "1.2.3-alpha.1+c"),
+            (lambda v: v - VPos.MINOR, "1.1.3-alpha.1+b"),
+        ],
+    )
+    def test_invalidated(self, op, res):
+        v = parse_version("1.2.3-alpha.1+b")
+        assert str(v) == "1.2.3-alpha.1+b"
+
+        op(v)
+        assert str(v) == res
+        assert str(v) == res
+
+
+class TestFrozen:
+    @pytest.mark.parametrize(
+        "op",
+        [
+            lambda v: v.inc(VPos.MAJOR),
+            lambda v: v.dec(VPos.PRE),
+            lambda v: v.remove_pre(),
+            lambda v: v.remove_build(),
+            lambda v: v.reset(),
+            lambda v: v + VPos.MINOR,
+            lambda v: v - VRm.BUILD,
+            lambda v: setattr(v, "major", 7),
+            lambda v: setattr(v, "minor", 7),
+            lambda v: setattr(v, "patch", 7),
+            lambda v: setattr(v, "pre", "rc"),
+            lambda v: setattr(v, "build", "c"),
+        ],
+    )
+    def test_cannot_change(self, op):
+        v = parse_version("1.2.3-alpha.1+b").freeze()
+        with pytest.raises(
+            InvalidOperationException,
+            match=re.escape("Cannot change a frozen version: FrozenVersion(major=1"),
+        ):
+            op(v)
+        assert str(v) == "1.2.3-alpha.1+b"
+
+    def test_getters(self):
+        v = FrozenVersion(1, 2, 3, "alpha.1", "b")
+        assert (v.major, v.minor, v.patch, v.pre, v.build) == (1, 2, 3, "alpha.1", "b")
+        assert v.pre_digit == 1
+        assert v.freeze() is v
+
+    def test_hash(self):
+        versions = {
+            parse_version("1.2.3").freeze(),
+            FrozenVersion(1, 2, 3, build="b"),
+            FrozenVersion(1, 2, 3, "rc.1"),
+        }
+        assert len(versions) == 2
+        assert FrozenVersion(1, 2, 3, "rc.1") in versions
+        assert parse_version("1.2.3").freeze() == parse_version("1.2.3")
+
+    def test_freeze_copy_independent(self):
+        v = parse_version("1.2.3-alpha.1")
+        frozen = v.freeze()
+        v.inc(VPos.PRE)
+        assert str(frozen) == "1.2.3-alpha.1"
+        assert frozen.pre_digit == 1
+
+        copy = frozen.copy()
+        copy.inc(VPos.PATCH)
+        assert type(copy) is Version
+        assert str(copy) == "1.2.4-alpha.1"
+        assert str(frozen) == "1.2.3-alpha.1"
@@ -0,0 +1,152 @@
+"""
+VersionView, parse_bytes()
+"""
+
+import itertools
+import mmap
+
+import pytest
+from semver.exc import ParseException
+from semver.keys import sort_key
+from semver.operations import compare
+from semver.version import Version, parse_version
+from semver.views import VersionView, parse_bytes
+
+VERSIONS = [
+    "0.0.0",
+    "1.0.0-0",
+    "1.0.0-1",
+    "1.0.0-10",
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-rc.1+build.5",
+    "1.0.0",
+    "1.0.0+build",
+    "1.0.1",
+    "1.9.0",
+    "1.10.0",
+    "10.0.0",
+    "99999999999999999999.0.0",
+]
+
+
+def _buffer(kind, data):
+    if kind == "bytes":
+        return data
+    elif kind == "bytearray":
+        return bytearray(data)
+    return memoryview(data)
+
+
+@pytest.mark.parametrize("kind", ["bytes", "bytearray", "memoryview"])
+def test_components(kind):
+    buf = _buffer(kind, b"xx 12.34.56-rc.1+b.2\n")
+    view = parse_bytes(buf, 3)
+
+    assert isinstance(view, VersionView)
+    assert (view.major, view.minor, view.patch) == (12, 34, 56)
+    assert view.pre == "rc.1"
+    assert view.build == "b.2"
+    assert str(view) == "12.34.56-rc.1+b.2"
+    assert bytes(view) == b"12.34.56-rc.1+b.2"
+    assert repr(view) == "VersionView(version='12.34.56-rc.1+b.2')"
+
+
+def test_no_labels():
+    view = parse_bytes(b"1.2.3")
+    assert view.pre is None
+    assert view.build is None
+
+
+def test_version():
+    view = parse_bytes(b"1.2.3-rc.1+b")
+    version = view.version
+
+    assert type(version) is Version
+    assert str(version) == "1.2.3-rc.1+b"
+    assert view.version is version
+
+
+@pytest.mark.parametrize("lhs, rhs", list(itertools.product(VERSIONS, repeat=2)))
+def test_compare_same_as_version(lhs, rhs):
+    res = compare(lhs, rhs)
+
+    # views in different buffers
+    vlhs = parse_bytes(lhs.encode())
+    vrhs = parse_bytes(memoryview(b"  " + rhs.encode()), 2)
+
+    assert (vlhs == vrhs) == (res == 0)
+    assert (vlhs != vrhs) == (res != 0)
+    assert (vlhs < vrhs) == (res < 0)
+    assert (vlhs <= vrhs) == (res <= 0)
+    assert (vlhs > vrhs) == (res > 0)
+    assert (vlhs >= vrhs) == (res >= 0)
+
+    # with Version objects, on either side
+    version = parse_version(rhs)
+    assert (vlhs < version) == (res < 0)
+    assert (vlhs == version) == (res == 0)
+    assert (version > vlhs) == (res < 0)
+    assert (version == vlhs) == (res == 0)
+    assert (version != vlhs) == (res != 0)
+    assert (version <= vlhs) == (res >= 0)
+    assert (version >= vlhs) == (res <= 0)
+
+
+def test_hash():
+    assert hash(parse_bytes(b"1.2.3-rc.1+b")) == hash(
+        parse_version("1.2.3-rc.1").freeze()
+    )
+    assert len({parse_bytes(b"1.2.3+a"), parse_bytes(b"1.2.3+b")}) == 1
+
+
+def test_mixed_with_versions():
+    views = [parse_bytes(v.encode()) for v in VERSIONS]
+    versions = [parse_version(v) for v in VERSIONS]
+    expected = sorted(sort_key(v) for v in VERSIONS)
+
+    # the order of views and versions in the list does not matter
+    for mixed in (views[::2] + versions[1::2], versions[::2] + views[1::2]):
+        assert [sort_key(str(v)) for v in sorted(mixed)] == expected
+    assert parse_bytes(b"1.2.3") in [parse_version("1.2.3")]
+    assert parse_version("1.2.3") in [parse_bytes(b"1.2.3")]
+
+
+def test_compare_bad_type():
+    with pytest.raises(TypeError):
+        parse_bytes(b"1.2.3") < "1.2.3"
+
+
+def test_mmap(tmp_path):
+    path = tmp_path / "versions.txt"
+    path.write_bytes(b"1.2.3\n2.0.0-rc.1\n")
+
+    with open(str(path), "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        first = parse_bytes(buf, 0, 6)
+        second = parse_bytes(buf, 6)
+
+        assert str(first) == "1.2.3"
+        assert second.pre == "rc.1"
+        assert first < second
+
+        del first, second
+        buf.close()
+
+
+@pytest.mark.parametrize(
+    "data, start, end",
+    [
+        (b"", 0, None),
+        (b"1.2", 0, None),
+        (b"1.2.3", 1, None),
+        (b"1.2.3", 0, 3),
+        (b"1.2.3 ", 0, None),
+        (b"01.2.3", 0, None),
+        ("1.1١.0".encode(), 0, None),
+    ],
+)
+def test_invalid(data, start, end):
+    with pytest.raises(ParseException):
+        parse_bytes(data, start, end)